@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Frytesty Bench - Repeated timing runs with robust statistics and A/B comparison
+# Frytesty 벤치 - 반복 측정, 견고한 통계, A/B 비교
+# Rheehose (Rhee Creative) 2008-2026
+# Licensed under Apache-2.0
+
+# One sample per case cannot separate two solutions: timings drift with CPU
+# frequency, caches and other processes. Each case runs WARMUP_RUNS times
+# unrecorded and then `runs` times; the median and IQR describe the samples
+# and a percentile bootstrap gives a confidence interval for the median.
+# Two solutions are run interleaved (A B, then B A, ...) so drift hits both
+# alike, and compared with a Mann-Whitney U test.
+# 케이스당 한 번의 측정으로는 두 풀이를 구분할 수 없음: CPU 클럭, 캐시, 다른 프로세스에
+# 따라 시간이 흔들림. 각 케이스를 WARMUP_RUNS번 기록 없이 돌린 뒤 `runs`번 측정하고,
+# 중앙값과 IQR로 표본을 요약하며 백분위 부트스트랩으로 중앙값의 신뢰 구간을 구함.
+# 두 풀이는 번갈아 실행(A B, 다음엔 B A, ...)하여 흔들림이 양쪽에 같이 걸리게 하고
+# Mann-Whitney U 검정으로 비교.
+
+import math
+import random
+import statistics
+from collections import namedtuple
+
+import judge
+import checkers
+import languages
+
+BENCH_RUNS = 10
+WARMUP_RUNS = 2
+BOOTSTRAP_RESAMPLES = 2000
+CONFIDENCE = 0.95
+BOOTSTRAP_SEED = 2008 # Same samples, same interval / 같은 표본이면 같은 구간
+METRICS = ("cpu", "wall")
+
+Stats = namedtuple("Stats", "median q1 q3 low high count")
+Comparison = namedtuple("Comparison", "change low high p faster")
+
+def quartiles(samples):
+    if len(samples) < 2:
+        return samples[0], samples[0], samples[0]
+    return tuple(statistics.quantiles(samples, n=4, method="inclusive"))
+
+def _percentiles(estimates, confidence):
+    estimates.sort()
+    tail = (1 - confidence) / 2
+    return estimates[int(tail * len(estimates))], estimates[min(len(estimates) - 1, int((1 - tail) * len(estimates)))]
+
+def summarize(samples, rng=None, confidence=CONFIDENCE, resamples=BOOTSTRAP_RESAMPLES):
+    # Median, quartiles and a bootstrap interval for the median
+    # 중앙값, 사분위수, 중앙값의 부트스트랩 구간
+    rng = rng or random.Random(BOOTSTRAP_SEED)
+    q1, median, q3 = quartiles(samples)
+    n = len(samples)
+    low, high = _percentiles([statistics.median(rng.choices(samples, k=n)) for _ in range(resamples)], confidence)
+    return Stats(median, q1, q3, low, high, n)
+
+def mann_whitney(a, b):
+    # Two-sided p-value of the U test (normal approximation, tie-corrected);
+    # makes no normality assumption, which timing samples rarely meet
+    # U 검정의 양측 p값 (정규 근사, 동순위 보정), 시간 표본이 거의 만족하지 않는 정규성을 가정하지 않음
+    ranked = sorted([(x, 0) for x in a] + [(x, 1) for x in b])
+    n1, n2, n = len(a), len(b), len(a) + len(b)
+    rank_a = ties = 0.0
+    i = 0
+    while i < n:
+        j = i
+        while j < n and ranked[j][0] == ranked[i][0]:
+            j += 1
+        average = (i + j + 1) / 2 # Ranks i+1..j share their mean / 동순위는 평균 순위
+        rank_a += average * sum(1 for k in range(i, j) if ranked[k][1] == 0)
+        ties += (j - i) ** 3 - (j - i)
+        i = j
+    u = rank_a - n1 * (n1 + 1) / 2
+    variance = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = max(0.0, abs(u - n1 * n2 / 2) - 0.5) / math.sqrt(variance)
+    return math.erfc(z / math.sqrt(2))
+
+def compare(a, b, rng=None, alpha=1 - CONFIDENCE, resamples=BOOTSTRAP_RESAMPLES):
+    # B relative to A: change is median(B) / median(A) - 1 with a bootstrap
+    # interval; faster is "A", "B" or None when the difference is not significant
+    # A 대비 B: change는 median(B) / median(A) - 1과 부트스트랩 구간,
+    # faster는 "A", "B", 유의하지 않으면 None
+    rng = rng or random.Random(BOOTSTRAP_SEED)
+    base = statistics.median(a)
+    change = statistics.median(b) / base - 1 if base else 0.0
+    estimates = []
+    for _ in range(resamples):
+        resampled = statistics.median(rng.choices(a, k=len(a)))
+        estimates.append(statistics.median(rng.choices(b, k=len(b))) / resampled - 1 if resampled else 0.0)
+    low, high = _percentiles(estimates, 1 - alpha)
+    p = mann_whitney(a, b)
+    faster = None
+    if p < alpha and change:
+        faster = "B" if change < 0 else "A"
+    return Comparison(change, low, high, p, faster)
+
+def benchmark(scripts, cases, runs=BENCH_RUNS, warmup=WARMUP_RUNS, time_limit=judge.DEFAULT_TIME_LIMIT, memory_limit=None, warm=True, checker="lines", language=None, flags="", isolate=False, progress=None):
+    # Times one or two solutions on every case. Runs are strictly one at a
+    # time so samples do not compete for cores. A program that fails a case
+    # (anything but AC) is not timed on it further. Returns
+    # {"cases": [[per-program entry] per case], "total": [per-program entry]},
+    # entry = {"verdict", "cpu": Stats or None, "wall": Stats or None, "samples": {metric: [ms]}}.
+    # 하나 또는 두 풀이를 모든 케이스에서 측정. 표본끼리 코어를 다투지 않도록 한 번에 하나씩 실행.
+    # 케이스에서 실패(AC 이외)한 프로그램은 그 케이스를 더 측정하지 않음.
+    programs = [languages.prepare(script, language, flags) for script in scripts]
+    checker = checkers.resolve(checker)
+    caps = judge.sandbox_caps(1, isolate)
+    pools = [judge.InterpreterPool(warm and program.warm) for program in programs]
+    entries = [[{"verdict": "AC", "samples": {metric: [] for metric in METRICS}} for _ in programs] for _ in cases]
+    total_runs = (warmup + runs) * len(cases) * len(programs)
+    done = 0
+    try:
+        for rep in range(warmup + runs):
+            # Alternate who goes first so neither always runs on a cooler cache
+            # 어느 쪽도 항상 식은 캐시에서 돌지 않도록 순서를 번갈아 변경
+            order = list(range(len(programs)))
+            if rep % 2:
+                order.reverse()
+            for case, entry in zip(cases, entries):
+                for i in order:
+                    done += 1
+                    if entry[i]["verdict"] != "AC":
+                        continue
+                    res = judge.run_case(programs[i], case[0], case[1], time_limit, memory_limit, pools[i], checker, caps)
+                    if not res["passed"]:
+                        entry[i].update(verdict=res["verdict"], error=res["error"])
+                    elif rep >= warmup:
+                        entry[i]["samples"]["wall"].append(res["elapsed"])
+                        if res["cpu"] is not None:
+                            entry[i]["samples"]["cpu"].append(res["cpu"])
+                    if progress:
+                        progress(done, total_runs)
+    finally:
+        for pool in pools:
+            pool.close()
+
+    rng = random.Random(BOOTSTRAP_SEED)
+    totals = []
+    for i in range(len(programs)):
+        # Suite time per repetition, only when every case passed
+        # 반복마다의 스위트 전체 시간, 모든 케이스가 통과했을 때만
+        failed = [entry[i]["verdict"] for entry in entries if entry[i]["verdict"] != "AC"]
+        samples = {metric: [] for metric in METRICS}
+        if not failed:
+            for metric in METRICS:
+                per_case = [entry[i]["samples"][metric] for entry in entries]
+                if per_case and all(len(s) == runs for s in per_case):
+                    samples[metric] = [sum(column) for column in zip(*per_case)]
+        totals.append({"verdict": failed[0] if failed else "AC", "samples": samples})
+    for entry in [e for row in entries for e in row] + totals:
+        for metric in METRICS:
+            entry[metric] = summarize(entry["samples"][metric], rng) if entry["samples"][metric] else None
+    return {"cases": entries, "total": totals}
+
+def comparison(entry_a, entry_b, metric="cpu"):
+    # None unless both sides have samples / 양쪽 모두 표본이 있어야 비교
+    a, b = entry_a["samples"][metric], entry_b["samples"][metric]
+    return compare(a, b) if a and b else None
+
+def format_stats(stats):
+    # "12.34ms (IQR 11.90-12.80, 95% CI 12.10-12.60)"
+    return f"{stats.median:.2f}ms (IQR {stats.q1:.2f}-{stats.q3:.2f}, {CONFIDENCE:.0%} CI {stats.low:.2f}-{stats.high:.2f})"
+
+def format_comparison(result):
+    # "B -17.9% [-21.0%, -15.2%] p=0.0002: B faster"
+    text = f"B {result.change:+.1%} [{result.low:+.1%}, {result.high:+.1%}] p={result.p:.4f}"
+    return text + (f": {result.faster} faster" if result.faster else ": no significant difference")
@@ -0,0 +1,552 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Frytesty Checkers - Streaming comparison of solution output
+# Frytesty 체커 - 풀이 출력의 스트리밍 비교
+# Rheehose (Rhee Creative) 2008-2026
+# Licensed under Apache-2.0
+
+# Every checker is built from the expected blob and then fed stdout blocks:
+# feed(data) -> False once the verdict is WA (the judge kills the solution),
+# finish() -> True for AC; on WA `mismatch` describes the first difference.
+# 모든 체커는 기대 출력 blob으로 만들어져 stdout 블록을 받음:
+# feed(data)가 False면 WA 확정(채점기가 풀이를 종료), finish()가 True면 AC,
+# WA일 때 `mismatch`가 첫 차이를 설명.
+
+import os
+import re
+import math
+import difflib
+import tempfile
+from collections import Counter
+from functools import partial
+
+SNIPPET = 40 # Bytes shown around a mismatch / 불일치 위치 주변에 보여줄 바이트 수
+DIFF_BLOCK = 4096 # Bytes compared per step when locating a difference / 차이 위치를 찾을 때 한 번에 비교하는 바이트
+# Diff window kept around the first difference: matched lines before it, then
+# a bounded number of lines from each side; only this window is ever diffed
+# 첫 차이 주변에 보관하는 비교 창: 앞쪽의 일치한 줄, 그 뒤 양쪽의 제한된 줄 수.
+# 비교(diff)는 항상 이 창 안에서만 수행
+CONTEXT_LINES = 3
+WINDOW_LINES = 8
+WINDOW_BYTES = 8192
+LINE_CHARS = 200 # Longer lines are cut in the window / 창에서 더 긴 줄은 잘림
+TRAILING_SPACE = re.compile(rb"[ \t\r]+(?=\n)")
+DEFAULT_EPSILON = 1e-6
+# testlib-style exit codes of checker scripts / testlib 방식의 체커 스크립트 종료 코드
+CHECKER_AC, CHECKER_WA, CHECKER_PE = 0, 1, 2
+
+class _Normalizer:
+    # Streaming equivalent of "strip the whole output, rstrip every line".
+    # Whitespace at the end of a chunk is held back until the next chunk shows
+    # whether it is trailing; all work is done by C-level bytes/regex calls.
+    # "전체 출력 strip, 각 줄 rstrip"의 스트리밍 버전. 청크 끝의 공백은 다음 청크를
+    # 보고 끝 공백인지 알 수 있을 때까지 보류, 모든 처리는 C 수준 bytes/정규식 호출.
+    def __init__(self):
+        self.held = b""
+        self.started = False
+        self.skipped_lines = 0 # Leading blank lines dropped / 제거된 앞쪽 빈 줄 수
+
+    def feed(self, data):
+        data = self.held + data
+        if not self.started:
+            stripped = data.lstrip()
+            self.skipped_lines += data[:len(data) - len(stripped)].count(b"\n")
+            if not stripped:
+                self.held = b""
+                return b""
+            data = stripped
+            self.started = True
+        body = data.rstrip()
+        self.held = data[len(body):]
+        return TRAILING_SPACE.sub(b"", body)
+
+    def finish(self):
+        self.held = b""
+        return b""
+
+def _first_difference(a, b):
+    # Length of the common prefix in one O(n) pass: equal DIFF_BLOCK-sized
+    # blocks are skipped with a C-level compare, only the differing block is
+    # walked byte by byte
+    # 공통 접두사 길이를 O(n) 한 번에 계산: 같은 DIFF_BLOCK 크기 블록은 C 수준 비교로
+    # 건너뛰고, 다른 블록만 바이트 단위로 확인
+    n = min(len(a), len(b))
+    start = 0
+    while start < n and a[start:start + DIFF_BLOCK] == b[start:start + DIFF_BLOCK]:
+        start += DIFF_BLOCK
+    end = min(start + DIFF_BLOCK, n)
+    while start < end and a[start] == b[start]:
+        start += 1
+    return min(start, n)
+
+def _window_lines(data, count, more):
+    # First `count` lines of data, decoded and cut to LINE_CHARS, and whether
+    # the stream goes on past them (`more`: data beyond what was given)
+    # 데이터의 처음 `count`줄(디코딩 후 LINE_CHARS로 자름)과, 스트림이 그 뒤로
+    # 이어지는지 여부 (`more`: 주어진 것 이후에도 데이터가 있음)
+    lines = data.split(b"\n", count)
+    return [_clip(line.decode("utf-8", errors="replace")) for line in lines[:count]], more or len(lines) > count
+
+def _clip(text):
+    return text if len(text) <= LINE_CHARS else text[:LINE_CHARS] + "..."
+
+def _snippet(data):
+    line = data[:SNIPPET].split(b"\n", 1)[0]
+    return line.decode("utf-8", errors="replace") if line or not data else "\\n"
+
+def _text(token):
+    return "<EOF>" if token is None else token[:SNIPPET].decode("utf-8", errors="replace")
+
+class Checker:
+    name = None
+    script = None # Set by checkers that run an external program / 외부 프로그램을 실행하는 체커만 설정
+    failure = None # The checker itself broke: verdict ERROR / 체커 자체의 오류: ERROR 판정
+
+    def __init__(self, expected):
+        self.mismatch = None
+
+    def close(self):
+        pass
+
+class LineChecker(Checker):
+    # Compares output as it arrives against the expected stream, pulling only
+    # as much expected data as has been produced. feed() returns False at the
+    # first mismatch so the caller can kill the child; `mismatch` holds the
+    # line/column (1-based, in the output) and a snippet from each side.
+    # 출력이 도착하는 대로 기대 스트림과 비교하며 기대 데이터는 필요한 만큼만 읽음.
+    # 첫 불일치에서 feed()가 False를 반환해 호출자가 자식을 종료할 수 있고,
+    # `mismatch`에는 줄/열(1부터, 출력 기준)과 양쪽 일부가 담김.
+    name = "lines"
+
+    def __init__(self, expected):
+        super().__init__(expected)
+        self.expected = iter(expected.chunks())
+        self.exp_norm, self.act_norm = _Normalizer(), _Normalizer()
+        self.exp_buf = self.act_buf = b""
+        self.exp_done = False
+        self.line, self.column, self.offset = 1, 1, 0
+        self.tail = b"" # Last matched bytes, for the diff window / 비교 창용 마지막 일치 바이트
+        self.finished = False
+
+    def _pull_expected(self, need):
+        while len(self.exp_buf) < need and not self.exp_done:
+            chunk = next(self.expected, None)
+            if chunk is None:
+                self.exp_buf += self.exp_norm.finish()
+                self.exp_done = True
+            else:
+                self.exp_buf += self.exp_norm.feed(chunk)
+
+    def _advance(self, matched):
+        self.tail = (self.tail + matched[-WINDOW_BYTES:])[-WINDOW_BYTES:]
+        newlines = matched.count(b"\n")
+        if newlines:
+            self.line += newlines
+            self.column = len(matched) - matched.rfind(b"\n")
+        else:
+            self.column += len(matched)
+        self.offset += len(matched)
+
+    def _fail(self, reason):
+        self._pull_expected(SNIPPET)
+        # One side ended on a line break: point at the start of the next line
+        # 한쪽이 줄바꿈에서 끝남: 다음 줄의 시작을 가리킴
+        rest = self.exp_buf if not self.act_buf else self.act_buf if not self.exp_buf else b""
+        if rest.startswith(b"\n"):
+            self._advance(b"\n")
+            self.exp_buf, self.act_buf = self.exp_buf[1:], self.act_buf[1:]
+        self.mismatch = {
+            "line": self.line + self.act_norm.skipped_lines,
+            "column": self.column,
+            "offset": self.offset,
+            "reason": reason,
+            "expected": _snippet(self.exp_buf) if self.exp_buf else "<EOF>",
+            "actual": _snippet(self.act_buf) if self.act_buf else "<EOF>",
+            "context": self._context(),
+        }
+        return False
+
+    def _context(self):
+        # Bounded lines around the difference: the window starts CONTEXT_LINES
+        # matched lines earlier, and each side continues from the line the
+        # difference is on. The output side only has what was already
+        # received, as the solution is killed at the first difference.
+        # 차이 주변의 제한된 줄: 창은 일치한 CONTEXT_LINES줄 앞에서 시작하고, 양쪽은
+        # 차이가 있는 줄부터 이어짐. 풀이는 첫 차이에서 종료되므로 출력 쪽은 이미 받은 것만 있음.
+        self._pull_expected(len(self.exp_buf) + WINDOW_BYTES)
+        lines = self.tail.split(b"\n")
+        prefix = lines.pop() # Common start of the differing line / 다른 줄의 공통 앞부분
+        if len(self.tail) >= WINDOW_BYTES and lines:
+            lines.pop(0) # Cut by the byte cap / 바이트 한도로 잘린 줄
+        before = [_clip(line.decode("utf-8", errors="replace")) for line in lines[-CONTEXT_LINES:]]
+        if len(prefix) > LINE_CHARS // 2:
+            # Long line: start near the difference so it stays in view / 긴 줄: 차이가 보이도록 그 근처부터 표시
+            prefix = b"..." + prefix[-(LINE_CHARS // 2):]
+        expected, expected_cut = _window_lines(prefix + self.exp_buf[:WINDOW_BYTES], WINDOW_LINES, len(self.exp_buf) > WINDOW_BYTES or not self.exp_done)
+        actual, actual_cut = _window_lines(prefix + self.act_buf[:WINDOW_BYTES], WINDOW_LINES, len(self.act_buf) > WINDOW_BYTES or not self.finished)
+        return {
+            "line": self.line + self.act_norm.skipped_lines - len(before),
+            "before": before,
+            "expected": expected if self.exp_buf or prefix else [],
+            "actual": actual if self.act_buf or prefix else [],
+            "expected_cut": expected_cut,
+            "actual_cut": actual_cut,
+        }
+
+    def _compare(self):
+        self._pull_expected(len(self.act_buf))
+        n = min(len(self.act_buf), len(self.exp_buf))
+        if self.act_buf[:n] != self.exp_buf[:n]:
+            i = _first_difference(self.act_buf, self.exp_buf)
+            self._advance(self.act_buf[:i])
+            self.act_buf, self.exp_buf = self.act_buf[i:], self.exp_buf[i:]
+            return self._fail("different")
+        self._advance(self.act_buf[:n])
+        self.act_buf, self.exp_buf = self.act_buf[n:], self.exp_buf[n:]
+        if self.act_buf and self.exp_done:
+            return self._fail("extra output")
+        return True
+
+    def feed(self, data):
+        if self.mismatch:
+            return False
+        self.act_buf += self.act_norm.feed(data)
+        return self._compare()
+
+    def finish(self):
+        if self.mismatch:
+            return False
+        self.finished = True
+        self.act_buf += self.act_norm.finish()
+        if not self._compare():
+            return False
+        while not self.exp_done:
+            self._pull_expected(len(self.exp_buf) + 1)
+        if self.exp_buf:
+            return self._fail("output ended early")
+        return True
+
+def _split_tokens(chunks):
+    # Yields lists of whitespace-separated tokens; a token cut by a chunk
+    # boundary is carried over to the next list
+    # 공백으로 나눈 토큰 목록을 생성, 청크 경계에서 잘린 토큰은 다음 목록으로 이월
+    pending = b""
+    for chunk in chunks:
+        data = pending + chunk
+        tokens = data.split()
+        pending = tokens.pop() if tokens and not data[-1:].isspace() else b""
+        if tokens:
+            yield tokens
+    if pending:
+        yield [pending]
+
+class TokenChecker(Checker):
+    # Compares whitespace-separated tokens, so spacing and line breaks do not
+    # matter. Whole token lists are compared with one C-level `==`; only a
+    # differing batch is walked token by token through same().
+    # 공백으로 나눈 토큰을 비교하므로 공백과 줄바꿈은 무관. 토큰 목록 전체를 C 수준
+    # `==` 한 번으로 비교하고, 다른 묶음만 same()으로 토큰별 확인.
+    name = "tokens"
+
+    def __init__(self, expected):
+        super().__init__(expected)
+        self.expected = _split_tokens(expected.chunks())
+        self.exp_tokens, self.exp_pos = [], 0
+        self.pending = b""
+        self.index = 0 # Tokens matched so far / 지금까지 일치한 토큰 수
+
+    def same(self, actual, expected):
+        return actual == expected
+
+    def _pull_expected(self, need):
+        if self.exp_pos:
+            del self.exp_tokens[:self.exp_pos]
+            self.exp_pos = 0
+        while len(self.exp_tokens) < need:
+            batch = next(self.expected, None)
+            if batch is None:
+                break
+            self.exp_tokens += batch
+        return self.exp_tokens[:need]
+
+    def _fail(self, reason, expected, actual):
+        self.mismatch = {
+            "token": self.index + 1,
+            "reason": reason,
+            "expected": _text(expected),
+            "actual": _text(actual),
+        }
+        return False
+
+    def _check(self, tokens):
+        wanted = self._pull_expected(len(tokens))
+        if tokens != wanted:
+            for token, want in zip(tokens, wanted):
+                if not self.same(token, want):
+                    return self._fail("different", want, token)
+                self.index += 1
+            if len(tokens) > len(wanted):
+                return self._fail("extra output", None, tokens[len(wanted)])
+        else:
+            self.index += len(tokens)
+        self.exp_pos = len(tokens)
+        return True
+
+    def feed(self, data):
+        if self.mismatch:
+            return False
+        data = self.pending + data
+        tokens = data.split()
+        self.pending = tokens.pop() if tokens and not data[-1:].isspace() else b""
+        return self._check(tokens)
+
+    def finish(self):
+        if self.mismatch:
+            return False
+        if self.pending and not self._check([self.pending]):
+            return False
+        self.pending = b""
+        left = self._pull_expected(1)
+        if left:
+            return self._fail("output ended early", left[0], None)
+        return True
+
+class FloatChecker(TokenChecker):
+    # Tokens that both parse as numbers match within an absolute OR relative
+    # epsilon (math.isclose); anything else must match exactly
+    # 둘 다 숫자로 읽히는 토큰은 절대 또는 상대 오차 안이면 일치 (math.isclose),
+    # 그 외에는 정확히 일치해야 함
+    name = "float"
+
+    def __init__(self, expected, abs_eps=DEFAULT_EPSILON, rel_eps=DEFAULT_EPSILON):
+        super().__init__(expected)
+        self.abs_eps, self.rel_eps = abs_eps, rel_eps
+
+    def same(self, actual, expected):
+        if actual == expected:
+            return True
+        try:
+            a, e = float(actual), float(expected)
+        except ValueError:
+            return False
+        if math.isnan(a) or math.isnan(e):
+            return math.isnan(a) and math.isnan(e)
+        return math.isclose(a, e, rel_tol=self.rel_eps, abs_tol=self.abs_eps)
+
+class UnorderedChecker(Checker):
+    # Same lines in any order (normalized like LineChecker). Expected lines are
+    # counted before the solution starts, so that is not timed. Output lines are
+    # counted with C-level Counter.update(); a line that is not expected at all
+    # fails at once, surplus or missing copies are found when the output ends.
+    # 순서와 무관하게 같은 줄 집합 (LineChecker와 같은 정규화). 기대 줄은 풀이 시작 전에
+    # 세므로 시간에 포함되지 않음. 출력 줄은 C 수준 Counter.update()로 세며, 기대에 없는
+    # 줄은 즉시 실패하고 남거나 모자란 줄은 출력이 끝날 때 확인.
+    name = "unordered"
+
+    def __init__(self, expected):
+        super().__init__(expected)
+        self.owed = self._count(expected.chunks())
+        self.got = Counter()
+        self.norm = _Normalizer()
+        self.partial = b""
+        self.lines = 0
+
+    def _count(self, chunks):
+        norm, partial, counts = _Normalizer(), b"", Counter()
+        for chunk in chunks:
+            lines = (partial + norm.feed(chunk)).split(b"\n")
+            partial = lines.pop()
+            counts.update(lines)
+        if partial or counts:
+            counts[partial] += 1
+        return counts
+
+    def _fail(self, reason, line, expected, actual):
+        self.mismatch = {
+            "line": line, "column": 1, "offset": None,
+            "reason": reason, "expected": expected, "actual": actual,
+        }
+        return False
+
+    def _take(self, lines):
+        if not self.owed.keys() >= set(lines):
+            # Rare path: find which line it was / 드문 경로: 어느 줄인지 찾기
+            index, line = next((i, line) for i, line in enumerate(lines) if line not in self.owed)
+            return self._fail("unexpected line", self.lines + index + 1 + self.norm.skipped_lines, "<none>", _snippet(line))
+        self.got.update(lines)
+        self.lines += len(lines)
+        return True
+
+    def feed(self, data):
+        if self.mismatch:
+            return False
+        lines = (self.partial + self.norm.feed(data)).split(b"\n")
+        self.partial = lines.pop()
+        return self._take(lines)
+
+    def finish(self):
+        if self.mismatch:
+            return False
+        if (self.partial or self.lines) and not self._take([self.partial]):
+            return False
+        # dict equality runs in C; Counter.__eq__ is a Python-level loop
+        # dict 비교는 C 수준, Counter.__eq__는 파이썬 루프
+        if dict.__eq__(self.got, self.owed):
+            return True
+        line = next(line for line in self.owed.keys() | self.got.keys() if self.got[line] != self.owed[line])
+        reason = "line repeated" if self.got[line] > self.owed[line] else "missing line"
+        return self._fail(reason, None, f"{self.owed[line]}x {_snippet(line)}", f"{self.got[line]}x {_snippet(line)}")
+
+class ScriptChecker(Checker):
+    # Special judge: a checker script run as `checker <input> <output> <answer>`
+    # (testlib order) after the solution exits. Output is spooled to a temp
+    # file as it streams; the judge runs the script on the case's worker and
+    # hands the result to conclude(). Exit 0 = AC, 1/2 = WA, anything else
+    # means the checker itself failed.
+    # 스페셜 저지: 풀이 종료 후 `checker <입력> <출력> <정답>` (testlib 순서)으로
+    # 실행하는 체커 스크립트. 출력은 도착하는 대로 임시 파일에 기록되고, 채점기가
+    # 케이스의 작업자에서 스크립트를 실행해 결과를 conclude()에 전달. 종료 코드
+    # 0 = AC, 1/2 = WA, 그 외는 체커 자체의 실패.
+    name = "script"
+
+    def __init__(self, expected, script):
+        super().__init__(expected)
+        self.script = script
+        self.expected = expected
+        self.temp = []
+        self.output = self._spool()
+
+    def _spool(self):
+        f = tempfile.NamedTemporaryFile(prefix="frytesty-", delete=False)
+        self.temp.append(f.name)
+        return f
+
+    def _path(self, blob):
+        # Whole files are passed as-is, anything else is written out once
+        # 파일 전체는 그대로 넘기고, 그 외에는 한 번 파일로 기록
+        if getattr(blob, "whole", False):
+            return blob.path
+        with self._spool() as f:
+            for chunk in blob.chunks():
+                f.write(chunk)
+        return f.name
+
+    def feed(self, data):
+        self.output.write(data)
+        return True
+
+    def finish(self):
+        self.output.close()
+        return True
+
+    def arguments(self, source):
+        return [self._path(source), self.output.name, self._path(self.expected)]
+
+    def conclude(self, returncode, message):
+        if returncode == CHECKER_AC:
+            return True
+        # An uncaught Python exception also exits with 1: that is a broken checker
+        # 처리되지 않은 파이썬 예외도 1로 종료: 체커 자체의 오류
+        crashed = message.startswith("Traceback (most recent call last)")
+        if returncode in (CHECKER_WA, CHECKER_PE) and not crashed:
+            self.mismatch = {"reason": "checker", "message": message or f"exit code {returncode}"}
+        else:
+            self.failure = f"Checker failed (exit code {returncode}): {message}"
+        return False
+
+    def close(self):
+        self.output.close()
+        for path in self.temp:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+        self.temp = []
+
+BUILTIN = {
+    "lines": LineChecker,
+    "tokens": TokenChecker,
+    "float": FloatChecker,
+    "unordered": UnorderedChecker,
+}
+
+def resolve(spec):
+    # "lines" | "tokens" | "float[:EPS]" | "float:abs=A,rel=R" | "unordered" | path/to/checker.py
+    # Returns a factory called with the expected blob for every case.
+    # 케이스마다 기대 출력 blob으로 호출되는 팩토리를 반환.
+    if callable(spec):
+        return spec
+    name, _, params = (spec or "lines").partition(":")
+    if name == "float":
+        abs_eps = rel_eps = DEFAULT_EPSILON
+        for param in filter(None, params.split(",")):
+            key, _, value = param.rpartition("=")
+            if key in ("", "eps"):
+                abs_eps = rel_eps = float(value)
+            elif key == "abs":
+                abs_eps = float(value)
+            elif key == "rel":
+                rel_eps = float(value)
+            else:
+                raise ValueError(f"Unknown float checker option: {param}")
+        return partial(FloatChecker, abs_eps=abs_eps, rel_eps=rel_eps)
+    if name in BUILTIN and not params:
+        return BUILTIN[name]
+    if os.path.isfile(spec):
+        return partial(ScriptChecker, script=os.path.abspath(spec))
+    raise ValueError(f"Unknown checker: {spec}")
+
+def diff_window(mismatch):
+    # Rows (tag, line, text) of a line diff around the first difference: tag
+    # " " for common lines, "-" expected only, "+" output only; line numbers
+    # are the expected side's for " " and "-", the output's for "+". Empty
+    # when the checker kept no window (token checkers, special judges).
+    # difflib only ever sees the bounded window, never the whole output.
+    # 첫 차이 주변 줄 단위 비교의 (태그, 줄 번호, 내용) 행: " "는 공통 줄, "-"는 기대에만,
+    # "+"는 출력에만 있는 줄. 줄 번호는 " "와 "-"는 기대 쪽, "+"는 출력 쪽 기준.
+    # 체커가 창을 남기지 않았으면 빈 목록 (토큰 체커, 스페셜 저지).
+    # difflib은 항상 제한된 창만 보고 전체 출력은 보지 않음.
+    context = (mismatch or {}).get("context")
+    if not context:
+        return []
+    line = context["line"]
+    rows = [(" ", line + i, text) for i, text in enumerate(context["before"])]
+    first = line + len(context["before"])
+    expected, actual = context["expected"], context["actual"]
+    opcodes = difflib.SequenceMatcher(None, expected, actual, autojunk=False).get_opcodes()
+    if opcodes and opcodes[-1][0] != "equal":
+        # A window that stops short is not a deletion: the last change only
+        # shows as many lines of one side as the cut side still had
+        # 중간에 끝난 창은 삭제가 아님: 마지막 변경은 잘린 쪽에 남은 줄 수만큼만 상대쪽을 표시
+        op, e1, e2, a1, a2 = opcodes[-1]
+        if context["actual_cut"]:
+            e2 = min(e2, e1 + (a2 - a1))
+        if context["expected_cut"]:
+            a2 = min(a2, a1 + (e2 - e1))
+        opcodes[-1] = (op, e1, e2, a1, a2)
+    for op, e1, e2, a1, a2 in opcodes:
+        if op == "equal":
+            rows += [(" ", first + i, expected[i]) for i in range(e1, e2)]
+            continue
+        rows += [("-", first + i, expected[i]) for i in range(e1, e2)]
+        rows += [("+", first + i, actual[i]) for i in range(a1, a2)]
+    return rows
+
+def format_window(rows):
+    # "  12 | text" lines for plain-text output / 일반 텍스트 출력용 "  12 | text" 줄
+    return [f"{tag} {line:>5} | {text}" for tag, line, text in rows]
+
+def describe(mismatch):
+    # "line 3, column 5: expected '42', got '41'"
+    if "message" in mismatch:
+        return mismatch["message"]
+    if "token" in mismatch:
+        where = f"token {mismatch['token']}"
+    elif mismatch["line"]:
+        where = f"line {mismatch['line']}, column {mismatch['column']}"
+    else:
+        where = "output" # Not tied to one position / 특정 위치가 아님
+    return (
+        f"{where} ({mismatch['reason']}): "
+        f"expected '{mismatch['expected']}', got '{mismatch['actual']}'"
+    )
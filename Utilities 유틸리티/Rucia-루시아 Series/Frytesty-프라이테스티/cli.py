@@ -4,13 +4,23 @@
 # Rheehose (Rhee Creative) 2008-2026
 
 import os
-import subprocess
-import time
 import sys
 import argparse
-import difflib
+import threading
 import locale
 
+import judge
+import suite
+import checkers
+import languages
+import sandbox
+import bench
+import results
+import watch
+import stress
+import reports
+import complexity
+
 def get_msg(ko_msg, en_msg):
     try:
         lang, _ = locale.getdefaultlocale()
@@ -20,80 +30,389 @@ def get_msg(ko_msg, en_msg):
         pass
     return en_msg
 
-def run_test(script, in_data, expected):
-    start_time = time.time()
-    try:
-        process = subprocess.Popen(
-            ["python3", script],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-        stdout, stderr = process.communicate(input=in_data, timeout=5)
-        elapsed = (time.time() - start_time) * 1000 # ms
-        
-        actual = stdout.strip()
-        passed = actual == expected.strip()
-        
-        return {
-            "passed": passed,
-            "actual": actual,
-            "expected": expected.strip(),
-            "elapsed": elapsed,
-            "error": stderr.strip()
-        }
-    except Exception as e:
-        return {
-            "passed": False,
-            "actual": "ERROR",
-            "expected": expected.strip(),
-            "elapsed": 0,
-            "error": str(e)
-        }
-
 def main():
     parser = argparse.ArgumentParser(description="Frytesty CLI - Auto-Tester")
-    parser.add_argument("--script", required=True, help="Target script to test")
+    parser.add_argument("--script", required=True, help="Solution to test (.py, .c, .cpp, .java, .rs, .go, .js)")
+    parser.add_argument("--lang", choices=list(languages.PROFILES), help="Language profile (default: from the file extension, e.g. pypy needs --lang)")
+    parser.add_argument("--flags", default="", help="Extra compiler (or interpreter) flags, e.g. \"-O3 -march=native\"")
     parser.add_argument("--input", help="Input string for the test")
     parser.add_argument("--expected", help="Expected output string")
-    parser.add_argument("--file", help="Path to a test file (input and expected separated by '---')")
+    parser.add_argument("--file", help="Path to a test file (input and expected separated by a '---' line, cases by '===')")
+    parser.add_argument("--suite", help="Test suite: directory of N.in/N.out pairs, a .zip of them, or a multi-case file")
+    parser.add_argument("-j", "--workers", type=int, default=judge.default_workers(), help="Cases run in parallel (default: CPU cores)")
+    parser.add_argument("--time-limit", type=float, default=judge.DEFAULT_TIME_LIMIT, help="CPU seconds per case (TLE above it, default: %(default)s)")
+    parser.add_argument("--memory-limit", type=int, metavar="MB", help="Address-space limit per case in MB (MLE above it)")
+    parser.add_argument("--cold", action="store_true", help="Start a fresh interpreter per case instead of forking warm ones (same limits; no-new-privs through setpriv where installed)")
+    parser.add_argument("--bench", type=int, nargs="?", const=bench.BENCH_RUNS, metavar="K", help=f"Benchmark: time every case K times (default {bench.BENCH_RUNS}) after warmup, one run at a time")
+    parser.add_argument("--warmup", type=int, default=bench.WARMUP_RUNS, help="Unrecorded runs per case before benchmarking (default: %(default)s)")
+    parser.add_argument("--against", metavar="SCRIPT", help="With --bench: second solution (B) to compare the first one (A) with")
+    parser.add_argument("--metric", choices=bench.METRICS, default="cpu", help="With --bench: time compared between A and B (default: %(default)s)")
+    parser.add_argument("--changed", action="store_true", help="Only run cases whose solution, data, checker, limits or runtime changed since they were last judged; replay the rest from the result cache")
+    parser.add_argument("--no-cache", action="store_true", help="Neither read nor record cached results")
+    parser.add_argument("--stress", metavar="GENERATOR", help="Stress test: run `GENERATOR <seed>` for random inputs and compare against --reference (no suite needed)")
+    parser.add_argument("--reference", metavar="SCRIPT", help="With --stress: brute-force solution whose output is taken as correct")
+    parser.add_argument("--tests", type=int, default=stress.STRESS_TESTS, help="With --stress: random tests to run, 0 = until a divergence (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=1, help="With --stress: first seed (default: %(default)s)")
+    parser.add_argument("--no-shrink", action="store_true", help="With --stress: report the failing input as generated")
+    parser.add_argument("--save", metavar="DIR", help="With --stress: write the failing case to DIR as stress-<seed>.in/.out")
+    parser.add_argument("--scaling", metavar="GENERATOR", help="Estimate the complexity class: time the script on `GENERATOR <n> <seed>` inputs for each of --sizes (no suite needed)")
+    parser.add_argument("--sizes", default=",".join(map(str, complexity.SCALING_SIZES)), help="With --scaling: comma-separated input sizes (default: %(default)s)")
+    parser.add_argument("--max-n", type=int, metavar="N", help="With --scaling: the problem's largest n, to project the running time at")
+    parser.add_argument("--junit", metavar="PATH", help="Write a JUnit XML report (updated after every case)")
+    parser.add_argument("--jsonl", metavar="PATH", help="Write a JSON Lines report, one line per case as it finishes")
+    parser.add_argument("--watch", action="store_true", help="Re-run whenever the script, the suite or the checker is saved (failed cases first)")
+    parser.add_argument("--isolate", action="store_true", help="Run each case without network and with a private tmpfs (Linux user namespaces)")
+    parser.add_argument("--checker", default="lines", help="lines (default), tokens, float[:EPS | :abs=A,rel=R], unordered, or a checker script run as `checker input output answer` (exit 0 = AC, 1 = WA)")
     
     args = parser.parse_args()
     
     if not os.path.exists(args.script):
         print(get_msg(f"오류: 스크립트 '{args.script}'를 찾을 수 없습니다.", f"Error: Script '{args.script}' not found."))
-        return
+        return 1
 
-    test_cases = []
-    if args.file:
-        if os.path.exists(args.file):
-            with open(args.file, "r") as f:
-                parts = f.read().split("---")
-                if len(parts) >= 2:
-                    test_cases.append((parts[0].strip(), parts[1].strip()))
-        else:
-            print(get_msg(f"오류: 테스트 파일 '{args.file}'을 찾을 수 없습니다.", f"Error: Test file '{args.file}' not found."))
-            return
-    elif args.input and args.expected:
-        test_cases.append((args.input, args.expected))
+    if args.scaling:
+        return run_scaling(args)
+    if args.stress:
+        test_cases = None
     else:
-        print(get_msg("오류: --input/--expected 또는 --file 중 하나를 제공하세요.", "Error: Provide either --input/--expected or --file."))
-        return
+        test_cases, error = load_cases(args)
+        if error:
+            print(error)
+            return 1
+
+    try:
+        checker = checkers.resolve(args.checker)
+    except ValueError as e:
+        print(get_msg(f"오류: {e}", f"Error: {e}"))
+        return 1
+    if args.stress:
+        return run_stress(args, checker)
+    if args.isolate and not sandbox.isolation_supported():
+        print(get_msg("오류: 이 시스템에서는 네임스페이스 격리를 쓸 수 없습니다.", "Error: Namespace isolation is not available on this system."))
+        return 1
+    if args.watch:
+        return run_watch(args, checker)
+    try:
+        # Compiled languages build once here (cached across runs) / 컴파일 언어는 여기서 한 번 빌드 (실행 간 캐시)
+        program = languages.prepare(args.script, args.lang, args.flags)
+    except languages.CompileError as e:
+        print(get_msg("컴파일 오류:", "Compile error:"))
+        print(e)
+        return 1
+    if args.bench is not None or args.against:
+        return run_bench(args, program, test_cases, checker)
 
     print(get_msg(f"\nFrytesty CLI - 테스트 중: {args.script}", f"\nFrytesty CLI - Testing: {args.script}"))
     print("="*40)
-    
-    for i, (in_data, expected) in enumerate(test_cases):
-        res = run_test(args.script, in_data, expected)
-        status = "PASS" if res["passed"] else "FAIL"
-        print(f"{get_msg('케이스', 'Case')} #{i+1}: {status} ({res['elapsed']:.2f}ms)")
-        if not res["passed"]:
-            print(f"  {get_msg('기대값', 'Expected')}: {res['expected']}")
-            print(f"  {get_msg('실제값', 'Actual')}:   {res['actual']}")
-            if res["error"]:
-                print(f"  {get_msg('오류', 'Error')}:    {res['error']}")
-    print("="*40 + "\n")
+    cache = None if args.no_cache else results.open_cache(reuse=args.changed)
+    try:
+        failing = run_cases(args, program, test_cases, checker, cache)
+    except OSError as e:
+        print(get_msg(f"오류: {e}", f"Error: {e}"))
+        return 1
+    finally:
+        if cache:
+            cache.close()
+    print("="*40)
+    print(f"{len(test_cases) - len(failing)}/{len(test_cases)} {get_msg('통과', 'passed')}\n")
+    return 1 if failing else 0
+
+def load_cases(args):
+    # (cases, None) or (None, error message) / (케이스, None) 또는 (None, 오류 메시지)
+    if args.file or args.suite:
+        path = args.suite or args.file
+        if not os.path.exists(path):
+            return None, get_msg(f"오류: 테스트 파일 '{path}'을 찾을 수 없습니다.", f"Error: Test file '{path}' not found.")
+        # Cases are loaded lazily: only file positions are kept until they run
+        # 케이스는 지연 로드: 실행 전까지는 파일 위치만 보관
+        test_cases = suite.load_suite(path) if args.suite else suite.load_multicase(path)
+        if not test_cases:
+            return None, get_msg(f"오류: '{path}'에서 테스트 케이스를 찾지 못했습니다.", f"Error: No test cases found in '{path}'.")
+        return test_cases, None
+    if args.input and args.expected:
+        return [(args.input, args.expected)], None
+    return None, get_msg("오류: --input/--expected, --file 또는 --suite 중 하나를 제공하세요.", "Error: Provide --input/--expected, --file or --suite.")
+
+def run_cases(args, program, test_cases, checker, cache, order=None, cancel=None):
+    # Prints each case as it finishes (and reports it with --junit/--jsonl)
+    # and returns the numbers of the failed ones
+    # 케이스가 끝나는 대로 출력(--junit/--jsonl이면 보고서에도 기록)하고 실패한 케이스 번호를 반환
+    failing = set()
+    report = None
+    if args.junit or args.jsonl:
+        report = reports.Reports({
+            "script": args.script, "language": program.language, "cases": len(test_cases),
+            "time_limit": args.time_limit, "memory_limit_mb": args.memory_limit, "checker": args.checker,
+        }, junit=args.junit, jsonl=args.jsonl)
+    complete = False
+    try:
+        for num, res in judge.run_suite(
+            program, test_cases, args.workers, args.time_limit,
+            args.memory_limit * 1024 * 1024 if args.memory_limit else None,
+            warm=not args.cold, checker=checker, isolate=args.isolate, cache=cache, cancel=cancel, order=order
+        ):
+            if not res["passed"]:
+                failing.add(num)
+            case_name = test_cases[num - 1].name if isinstance(test_cases[num - 1], suite.Case) else None
+            if report:
+                report.case(num, case_name, res)
+            name = f" [{case_name}]" if case_name else ""
+            print(f"{get_msg('케이스', 'Case')} #{num}{name}: {res['verdict']} ({judge.format_usage(res)})", flush=True)
+            if not res["passed"]:
+                if res["mismatch"]:
+                    print(f"  {get_msg('첫 차이', 'First difference')}: {checkers.describe(res['mismatch'])}")
+                diff = checkers.diff_window(res["mismatch"])
+                if diff:
+                    # Bounded window instead of both outputs in full / 두 출력 전체 대신 제한된 비교 창
+                    for line in checkers.format_window(diff):
+                        print(f"    {line}")
+                else:
+                    print(f"  {get_msg('기대값', 'Expected')}: {res['expected']}")
+                    print(f"  {get_msg('실제값', 'Actual')}:   {res['actual']}")
+                if res["error"]:
+                    print(f"  {get_msg('오류', 'Error')}:    {res['error']}")
+        complete = cancel is None or not cancel.is_set()
+    finally:
+        if report:
+            report.close(complete)
+    return failing
+
+def watch_round(args, checker, cache, failing, cancel):
+    # One run of the watch loop. Cases and the program are reloaded every
+    # time, since a save may have added cases or changed the source.
+    # Last round's failures go first.
+    # 감시 루프의 실행 한 번. 저장으로 케이스가 추가되거나 소스가 바뀌었을 수 있어
+    # 매번 다시 불러옴. 지난번 실패한 케이스를 먼저 실행.
+    test_cases, error = load_cases(args)
+    if error:
+        print(error)
+        return
+    try:
+        program = languages.prepare(args.script, args.lang, args.flags)
+    except (OSError, languages.CompileError) as e:
+        print(get_msg("컴파일 오류:", "Compile error:"))
+        print(e)
+        return
+    order = sorted(range(len(test_cases)), key=lambda i: i + 1 not in failing)
+    print("="*40)
+    try:
+        now_failing = run_cases(args, program, test_cases, checker, cache, order, cancel)
+    except OSError as e:
+        print(get_msg(f"오류: {e}", f"Error: {e}"))
+        return
+    if cancel.is_set():
+        return # Unfinished: keep the previous failures / 미완료: 이전 실패 목록 유지
+    failing.clear()
+    failing.update(now_failing)
+    print("="*40)
+    print(f"{len(test_cases) - len(failing)}/{len(test_cases)} {get_msg('통과', 'passed')}")
+    print(get_msg("변경 대기 중... (Ctrl+C로 종료)", "Watching for changes... (Ctrl+C to stop)"), flush=True)
+
+def run_watch(args, checker):
+    # Runs in a background thread while the main thread waits for saves; a
+    # save during a run cancels it (running children are killed) and starts over.
+    # 실행은 백그라운드 스레드에서, 메인 스레드는 저장을 대기. 실행 중 저장되면
+    # 실행을 취소(실행 중인 자식 종료)하고 다시 시작.
+    paths = [args.script]
+    if args.suite or args.file:
+        paths.append(suite.suite_source(args.suite or args.file))
+    if os.path.isfile(args.checker):
+        paths.append(args.checker)
+    cache = None if args.no_cache else results.open_cache(reuse=args.changed)
+    # Only case files count inside a suite folder / 스위트 폴더 안에서는 케이스 파일만 해당
+    batches = watch.changes(paths, suffixes=suite.INPUT_EXTS + suite.OUTPUT_EXTS)
+    failing = set()
+    print(get_msg(f"\nFrytesty CLI - 감시 중: {args.script}", f"\nFrytesty CLI - Watching: {args.script}"))
+    try:
+        while True:
+            cancel = threading.Event()
+            worker = threading.Thread(target=watch_round, args=(args, checker, cache, failing, cancel), daemon=True)
+            worker.start()
+            changed = next(batches)
+            if worker.is_alive():
+                cancel.set()
+                print(get_msg("\n실행 취소됨", "\nRun cancelled"))
+            worker.join()
+            names = ", ".join(sorted(os.path.basename(path) for path in changed)[:5])
+            print(get_msg(f"\n변경됨: {names}", f"\nChanged: {names}"))
+    except KeyboardInterrupt:
+        cancel.set()
+        worker.join()
+        return 0
+    finally:
+        batches.close()
+        if cache:
+            cache.close()
+
+def run_stress(args, checker):
+    if not args.reference:
+        print(get_msg("오류: --stress에는 --reference가 필요합니다.", "Error: --stress needs --reference."))
+        return 1
+    for path in (args.stress, args.reference):
+        if not os.path.exists(path):
+            print(get_msg(f"오류: '{path}'를 찾을 수 없습니다.", f"Error: '{path}' not found."))
+            return 1
+    print(get_msg(f"\nFrytesty 스트레스 - {args.script} / 기준: {args.reference} / 생성기: {args.stress}", f"\nFrytesty Stress - {args.script} vs reference {args.reference}, generator {args.stress}"))
+    print("="*40)
+
+    def progress(tested, phase):
+        label = get_msg("축소 중", "shrinking") if phase == "shrinking" else get_msg("테스트", "tests")
+        print(f"\r  {tested} {label}", end="", flush=True)
+
+    try:
+        result = stress.stress(
+            args.script, args.reference, args.stress, args.tests or None, args.workers, args.time_limit,
+            args.memory_limit * 1024 * 1024 if args.memory_limit else None,
+            warm=not args.cold, checker=checker, language=args.lang, flags=args.flags,
+            seed=args.seed, shrinking=not args.no_shrink, isolate=args.isolate, progress=progress
+        )
+    except languages.CompileError as e:
+        print(get_msg("컴파일 오류:", "Compile error:"))
+        print(e)
+        return 1
+    except KeyboardInterrupt:
+        print()
+        return 1
+    print()
+    failure = result["failure"]
+    if failure is None:
+        print(get_msg(f"{result['tested']}개 테스트 모두 일치", f"All {result['tested']} tests agree"))
+        return 0
+    if failure["stage"] != "candidate":
+        who = args.stress if failure["stage"] == "generator" else args.reference
+        print(get_msg(f"시드 {failure['seed']}에서 {who} 실행 실패:", f"{who} failed on seed {failure['seed']}:"))
+        print(failure["error"])
+        return 1
+    res = failure["result"]
+    print(get_msg(f"시드 {failure['seed']}에서 불일치 ({result['tested']}번째 테스트): {res['verdict']}", f"Divergence on seed {failure['seed']} (test {result['tested']}): {res['verdict']}"))
+    if "original" in failure:
+        print(get_msg(f"  입력 축소: {len(failure['original'])} -> {len(failure['input'])} 바이트", f"  Input shrunk: {len(failure['original'])} -> {len(failure['input'])} bytes"))
+    if res["mismatch"]:
+        print(f"  {get_msg('첫 차이', 'First difference')}: {checkers.describe(res['mismatch'])}")
+    print(f"  {get_msg('입력', 'Input')}:\n{failure['input'].decode('utf-8', errors='replace')[:judge.OUTPUT_KEEP]}")
+    print(f"  {get_msg('기대값', 'Expected')}: {res['expected']}")
+    print(f"  {get_msg('실제값', 'Actual')}:   {res['actual']}")
+    if res["error"]:
+        print(f"  {get_msg('오류', 'Error')}:    {res['error']}")
+    if args.save:
+        # Same N.in/N.out layout as suites, so the case can join one
+        # 스위트와 같은 N.in/N.out 형식이라 스위트에 바로 추가 가능
+        os.makedirs(args.save, exist_ok=True)
+        stem = os.path.join(args.save, f"stress-{failure['seed']}")
+        with open(stem + ".in", "wb") as f:
+            f.write(failure["input"])
+        with open(stem + ".out", "wb") as f:
+            f.write(failure["expected"])
+        print(get_msg(f"  저장됨: {stem}.in / .out", f"  Saved: {stem}.in / .out"))
+    return 1
+
+def run_scaling(args):
+    try:
+        sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    except ValueError:
+        sizes = []
+    if len(sizes) < complexity.MIN_POINTS or min(sizes) < 1:
+        print(get_msg(f"오류: --sizes에는 양의 정수가 {complexity.MIN_POINTS}개 이상 필요합니다.", f"Error: --sizes needs at least {complexity.MIN_POINTS} positive integers."))
+        return 1
+    if not os.path.exists(args.scaling):
+        print(get_msg(f"오류: '{args.scaling}'를 찾을 수 없습니다.", f"Error: '{args.scaling}' not found."))
+        return 1
+    print(get_msg(f"\nFrytesty 복잡도 - {args.script} / 생성기: {args.scaling}", f"\nFrytesty Complexity - {args.script}, generator {args.scaling}"))
+    print("="*40)
+
+    def progress(done, total, n):
+        print(f"\r  {done}/{total} {get_msg('실행', 'runs')} (n = {n})", end="", flush=True)
+
+    try:
+        result = complexity.scaling(
+            args.script, args.scaling, sizes, time_limit=args.time_limit,
+            memory_limit=args.memory_limit * 1024 * 1024 if args.memory_limit else None,
+            warm=not args.cold, language=args.lang, flags=args.flags, isolate=args.isolate, progress=progress
+        )
+    except languages.CompileError as e:
+        print(get_msg("\n컴파일 오류:", "\nCompile error:"))
+        print(e)
+        return 1
+    except OSError as e:
+        print(get_msg(f"\n오류: {e}", f"\nError: {e}"))
+        return 1
+    print()
+    for point in result["points"]:
+        if point["ms"] is not None:
+            print(f"  n = {point['n']:>10}: {point['ms']:10.2f}ms")
+        else:
+            print(f"  n = {point['n']:>10}: {point['verdict']}")
+            if point["error"]:
+                print(f"    {point['error'].strip().splitlines()[-1]}")
+    fits = result["fits"]
+    if not fits:
+        print(get_msg(f"측정된 크기가 {complexity.MIN_POINTS}개 미만이라 추정할 수 없습니다.", f"Fewer than {complexity.MIN_POINTS} sizes measured: no estimate."))
+        return 1
+    print("="*40)
+    best = fits[0]
+    print(get_msg(f"가장 잘 맞는 클래스: {best.name} (log-log 기울기 {result['slope']:.2f})", f"Best fit: {best.name} (log-log slope {result['slope']:.2f})"))
+    close = complexity.close_fits(fits)
+    if close:
+        names = ", ".join(f.name for f in close)
+        print(get_msg(f"  {names}와(과) 구분하기 어려움 (오차 {best.error:.3f} vs {close[0].error:.3f}), 더 넓은 범위의 --sizes를 시도하세요", f"  Hard to tell apart from {names} (error {best.error:.3f} vs {close[0].error:.3f}); try a wider range of --sizes"))
+    if args.max_n:
+        projected = complexity.project(best, args.max_n)
+        verdict = get_msg("제한 초과 예상", "over the limit") if projected > args.time_limit * 1000 else get_msg("제한 이내 예상", "within the limit")
+        print(get_msg(f"n = {args.max_n}에서 예상 시간: {complexity.format_ms(projected)} ({verdict}, 제한 {args.time_limit:g}s)", f"Projected at n = {args.max_n}: {complexity.format_ms(projected)} ({verdict}, limit {args.time_limit:g}s)"))
+    return 0
+
+def run_bench(args, program, test_cases, checker):
+    if args.bench is not None and args.bench < 1:
+        print(get_msg("오류: --bench 횟수는 1 이상이어야 합니다.", "Error: --bench needs at least 1 run."))
+        return 1
+    scripts = [program]
+    if args.against:
+        try:
+            scripts.append(languages.prepare(args.against, args.lang, args.flags))
+        except (OSError, languages.CompileError) as e:
+            print(get_msg(f"오류 (B): {e}", f"Error (B): {e}"))
+            return 1
+    runs = args.bench or bench.BENCH_RUNS
+    labels = ["A", "B"] if args.against else [""]
+    print(get_msg(f"\nFrytesty 벤치 - {runs}회 측정 (예열 {args.warmup}회)", f"\nFrytesty Bench - {runs} runs (warmup {args.warmup})"))
+    for label, script in zip(labels, [args.script, args.against]):
+        if label:
+            print(f"  {label}: {script}")
+    print("="*40)
+
+    def progress(done, total):
+        print(f"\r  {done}/{total}", end="", flush=True)
+
+    result = bench.benchmark(
+        scripts, test_cases, runs, args.warmup, args.time_limit,
+        args.memory_limit * 1024 * 1024 if args.memory_limit else None,
+        warm=not args.cold, checker=checker, isolate=args.isolate, progress=progress
+    )
+    print("\r" + " " * 20 + "\r", end="")
+
+    def report(title, entries):
+        print(title)
+        for label, entry in zip(labels, entries):
+            prefix = f"  {label} " if label else "  "
+            if entry["verdict"] != "AC":
+                print(f"{prefix}{entry['verdict']}")
+                continue
+            for metric in bench.METRICS:
+                if entry[metric]:
+                    print(f"{prefix}{metric:<4} {bench.format_stats(entry[metric])}")
+        if len(entries) == 2:
+            compared = bench.comparison(entries[0], entries[1], args.metric)
+            if compared:
+                print(f"  {args.metric}: {bench.format_comparison(compared)}")
+
+    for num, entries in enumerate(result["cases"], 1):
+        name = f" [{test_cases[num - 1].name}]" if isinstance(test_cases[num - 1], suite.Case) else ""
+        report(f"{get_msg('케이스', 'Case')} #{num}{name}", entries)
+    if len(test_cases) > 1:
+        print("="*40)
+        report(get_msg("전체 (반복마다 합계)", "Total (sum per repetition)"), result["total"])
+    print()
+    return 0 if all(entry["verdict"] == "AC" for entry in result["total"]) else 1
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
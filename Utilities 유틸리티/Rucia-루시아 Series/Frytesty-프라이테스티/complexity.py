@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Frytesty Complexity - Growth-rate estimation from runs at increasing input sizes
+# Frytesty 복잡도 - 입력 크기를 늘려 가며 실행해 증가율 추정
+# Rheehose (Rhee Creative) 2008-2026
+# Licensed under Apache-2.0
+
+# `generator <n> <seed>` writes an input of size n; the solution is timed on
+# it SCALING_RUNS times (different seeds) and the median CPU time is kept.
+# Each complexity class f is fitted as t = a + b*f(n): the constant a absorbs
+# process start-up, which would otherwise flatten every small-n curve towards
+# O(1). The fit minimizes relative error, and classes are ranked by their
+# squared error in log space, so a 1ms miss at n=1000 weighs as much as a
+# 100ms miss at n=100000. The plain log-log slope is reported alongside.
+# `generator <n> <seed>`가 크기 n의 입력을 만들고, 풀이를 SCALING_RUNS번(다른 시드)
+# 측정해 CPU 시간의 중앙값을 보관. 복잡도 클래스 f마다 t = a + b*f(n)으로 맞추며,
+# 상수 a가 프로세스 시작 비용을 흡수(없으면 작은 n의 곡선이 모두 O(1) 쪽으로 눕게 됨).
+# 맞춤은 상대 오차를 최소화하고 클래스 순위는 로그 공간의 제곱 오차로 정하므로,
+# n=1000에서 1ms 차이와 n=100000에서 100ms 차이가 같은 무게를 가짐. 단순 log-log 기울기도 함께 보고.
+
+import math
+import statistics
+from collections import namedtuple
+
+import judge
+import languages
+
+SCALING_RUNS = 3
+SCALING_WARMUP = 1 # Unrecorded runs before the first size / 첫 크기 전에 기록 없이 하는 실행
+SCALING_SIZES = (1000, 2000, 4000, 8000, 16000, 32000, 64000)
+MIN_POINTS = 3 # Sizes needed for a fit / 맞춤에 필요한 크기 수
+# Classes within this factor of the best error are reported as too close to
+# call: n and n log n in particular differ little over a small range
+# 최선 오차의 이 배수 안에 드는 클래스는 구분하기 어렵다고 보고: 특히 n과 n log n은
+# 좁은 범위에서는 차이가 작음
+CLOSE_FIT = 2.0
+
+# Name and growth function, simplest first: on a tie the simpler class wins
+# 이름과 증가 함수, 단순한 것부터: 동률이면 단순한 클래스가 이김
+CLASSES = (
+    ("O(1)", lambda n: 0.0),
+    ("O(log n)", lambda n: math.log2(n)),
+    ("O(sqrt n)", lambda n: math.sqrt(n)),
+    ("O(n)", lambda n: float(n)),
+    ("O(n log n)", lambda n: n * math.log2(n)),
+    ("O(n^2)", lambda n: float(n) ** 2),
+    ("O(n^2 log n)", lambda n: float(n) ** 2 * math.log2(n)),
+    ("O(n^3)", lambda n: float(n) ** 3),
+)
+
+Fit = namedtuple("Fit", "name a b error")
+
+def _weighted_line(xs, ys):
+    # Least squares for y = a + b*x with weights 1/y^2 (relative error),
+    # keeping a, b >= 0: time never shrinks with n and start-up is not negative
+    # 가중치 1/y^2(상대 오차)로 y = a + b*x 최소제곱, a, b >= 0 유지:
+    # 시간은 n과 함께 줄지 않고 시작 비용은 음수가 아님
+    ws = [1 / (y * y) for y in ys]
+    sw = sum(ws)
+    swx = sum(w * x for w, x in zip(ws, xs))
+    swy = sum(w * y for w, y in zip(ws, ys))
+    swxx = sum(w * x * x for w, x in zip(ws, xs))
+    swxy = sum(w * x * y for w, x, y in zip(ws, xs, ys))
+    det = sw * swxx - swx * swx
+    if det > 0:
+        a = (swxx * swy - swx * swxy) / det
+        b = (sw * swxy - swx * swy) / det
+        if a >= 0 and b >= 0:
+            return a, b
+    # On the boundary: the better of a line through 0 and a constant
+    # 경계: 원점을 지나는 직선과 상수 중 나은 쪽
+    candidates = [(swy / sw, 0.0)]
+    if swxx > 0:
+        candidates.append((0.0, swxy / swxx))
+    return min(candidates, key=lambda ab: _log_error(xs, ys, *ab))
+
+def _log_error(xs, ys, a, b):
+    error = 0.0
+    for x, y in zip(xs, ys):
+        predicted = a + b * x
+        if predicted <= 0:
+            return math.inf
+        error += math.log(predicted / y) ** 2
+    return error
+
+def fit(sizes, times):
+    # Every class fitted to (size, ms) points, best first
+    # 모든 클래스를 (크기, ms) 점에 맞춘 결과, 좋은 것부터
+    fits = []
+    for name, growth in CLASSES:
+        xs = [growth(n) for n in sizes]
+        a, b = _weighted_line(xs, times)
+        fits.append(Fit(name, a, b, _log_error(xs, times, a, b)))
+    # Stable sort keeps the simpler class on (near) ties / 안정 정렬로 (거의) 동률이면 단순한 클래스 유지
+    return sorted(fits, key=lambda f: round(f.error, 9))
+
+def slope(sizes, times):
+    # Exponent k of t ~ n^k from an ordinary log-log regression
+    # 일반 log-log 회귀로 구한 t ~ n^k의 지수 k
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(t) for t in times]
+    mx, my = statistics.fmean(xs), statistics.fmean(ys)
+    sxx = sum((x - mx) ** 2 for x in xs)
+    return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / sxx if sxx else 0.0
+
+def close_fits(fits):
+    # Runners-up the measurements cannot rule out / 측정으로 배제할 수 없는 차점 클래스
+    return [f for f in fits[1:] if f.error <= max(fits[0].error, 1e-9) * CLOSE_FIT]
+
+def project(best, n):
+    # Predicted ms at size n under a fitted class / 맞춘 클래스로 예측한 크기 n의 ms
+    growth = dict(CLASSES)[best.name]
+    return best.a + best.b * growth(n)
+
+def scaling(script, generator, sizes=SCALING_SIZES, runs=SCALING_RUNS, time_limit=judge.DEFAULT_TIME_LIMIT, memory_limit=None, warm=True, language=None, flags="", isolate=False, progress=None):
+    # Times the solution at each size, smallest first, one run at a time (like
+    # benchmarks) so runs do not compete for cores. Stops at the first size
+    # that fails: larger ones would only fail slower. Returns
+    # {"points": [{"n", "ms", "samples", "verdict", "error"}], "fits": [...], "slope": k};
+    # "fits" and "slope" are None with fewer than MIN_POINTS measured sizes.
+    # 코어를 다투지 않도록 (벤치마크처럼) 한 번에 하나씩, 작은 크기부터 측정. 실패한 첫 크기에서
+    # 멈춤 (더 큰 크기는 더 느리게 실패할 뿐). 측정된 크기가 MIN_POINTS보다 적으면
+    # "fits"와 "slope"는 None.
+    program = languages.prepare(script, language, flags)
+    helper = languages.prepare(generator)
+    caps = judge.sandbox_caps(1, isolate)
+    pool = judge.InterpreterPool(warm and (program.warm or helper.warm))
+    limits = dict(caps, memory_cap=memory_limit or caps.get("memory_cap"))
+    points = []
+    sizes = sorted(set(sizes))
+    try:
+        for step, n in enumerate(sizes):
+            point = {"n": n, "ms": None, "samples": [], "verdict": "AC", "error": None}
+            points.append(point)
+            # Seeds below 1 are warmup runs (page cache, fork server) / 1 미만의 시드는 예열 실행 (페이지 캐시, fork 서버)
+            for seed in range(1 - (SCALING_WARMUP if step == 0 else 0), runs + 1):
+                gen = judge.run_program(helper, b"", time_limit, pool, [str(n), str(seed)], caps)
+                if not gen["ok"]:
+                    point.update(verdict="ERROR", error=f"Generator: {gen['error'] or 'exit code ' + str(gen['returncode'])}")
+                    break
+                res = judge.run_program(program, gen["stdout"], time_limit, pool, caps=limits)
+                verdict = judge.judge_verdict(True, res["timed_out"], False, res["returncode"], res["cpu"], None, res["error"], time_limit, None)
+                if not res["ok"] and verdict == "AC":
+                    verdict = "RE" # Output over the helper cap / 보조 출력 한도 초과
+                if verdict != "AC":
+                    point.update(verdict=verdict, error=res["error"])
+                    break
+                if seed < 1:
+                    continue
+                point["samples"].append(res["cpu"] if res["cpu"] is not None else res["elapsed"])
+                if progress:
+                    progress(step * runs + seed, len(sizes) * runs, n)
+            if point["verdict"] != "AC":
+                break
+            point["ms"] = statistics.median(point["samples"])
+    finally:
+        pool.close()
+
+    measured = [point for point in points if point["ms"] is not None]
+    fits = slope_k = None
+    if len(measured) >= MIN_POINTS:
+        # A 0ms sample (coarse clock) would break the logarithms / 0ms 표본(거친 시계)은 로그를 깨뜨림
+        times = [max(point["ms"], 0.001) for point in measured]
+        fits = fit([point["n"] for point in measured], times)
+        slope_k = slope([point["n"] for point in measured], times)
+    return {"points": points, "fits": fits, "slope": slope_k}
+
+def format_ms(ms):
+    # "850.0ms", "12.3s", "2.1h" / 밀리초에서 시간 단위까지
+    for unit, size in (("h", 3600000), ("min", 60000), ("s", 1000)):
+        if ms >= size:
+            return f"{ms / size:.1f}{unit}"
+    return f"{ms:.1f}ms"
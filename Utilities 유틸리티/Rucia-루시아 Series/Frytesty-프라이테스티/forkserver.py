@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Frytesty Fork Server - Warm Python interpreter that forks once per test case
+# Frytesty 포크 서버 - 테스트 케이스마다 fork하는 예열된 파이썬 인터프리터
+# Rheehose (Rhee Creative) 2008-2026
+# Licensed under Apache-2.0
+
+# Started once per worker as `python3 forkserver.py <fd>`. For each request the
+# client passes the case's stdin/stdout/stderr pipe ends over the socket
+# (SCM_RIGHTS); the server forks, the child wires them to fd 0/1/2 and runs the
+# solution as __main__. CPython boot and common imports are paid once, and
+# every case still starts from the same clean post-boot state.
+# 작업자마다 `python3 forkserver.py <fd>`로 한 번 시작. 요청마다 클라이언트가 케이스의
+# stdin/stdout/stderr 파이프 끝을 소켓(SCM_RIGHTS)으로 넘기면 서버가 fork하고, 자식은
+# 이를 fd 0/1/2에 연결해 풀이를 __main__으로 실행. CPython 부팅과 공통 import는 한 번만
+# 치르며, 매 케이스는 부팅 직후의 같은 깨끗한 상태에서 시작.
+
+import os
+import sys
+import json
+import types
+import signal
+import socket
+import builtins
+import traceback
+
+from sandbox import apply_limits
+
+# Modules typical solutions import, loaded before the first fork
+# 일반적인 풀이가 import하는 모듈, 첫 fork 전에 미리 로드
+WARM_MODULES = (
+    "io", "re", "math", "heapq", "bisect", "itertools", "functools", "collections",
+    "string", "random", "decimal", "fractions", "array", "copy", "operator", "typing",
+)
+MAX_MESSAGE = 65536
+
+def _compile(script, cache):
+    # Compiled once per script version, reused by every forked child
+    # 스크립트 버전마다 한 번 컴파일하여 fork된 모든 자식이 재사용
+    st = os.stat(script)
+    key = (script, st.st_mtime_ns, st.st_size)
+    if key not in cache:
+        cache.clear()
+        with open(script, "rb") as f:
+            source = f.read()
+        try:
+            cache[key] = compile(source, script, "exec", dont_inherit=True)
+        except (SyntaxError, ValueError) as e:
+            cache[key] = e.with_traceback(None)
+    return cache[key]
+
+def _run_child(script, code, fds, limits, args):
+    # Own process group, so the judge can kill grandchildren too
+    # 자체 프로세스 그룹: 채점기가 손자 프로세스까지 종료 가능
+    os.setpgid(0, 0)
+    for target, fd in enumerate(fds):
+        os.dup2(fd, target)
+        os.close(fd)
+    try:
+        apply_limits(limits)
+    except OSError as e:
+        print(f"sandbox: {e}", file=sys.stderr)
+        os._exit(127)
+    sys.argv = [script] + list(args)
+    sys.path[0] = os.path.dirname(os.path.abspath(script))
+    main = types.ModuleType("__main__")
+    main.__file__ = script
+    main.__builtins__ = builtins
+    sys.modules["__main__"] = main
+    status = 0
+    try:
+        if isinstance(code, BaseException):
+            raise code
+        exec(code, main.__dict__)
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            status = e.code or 0
+        else:
+            print(e.code, file=sys.stderr)
+            status = 1
+    except BaseException as e:
+        # Drop this file's frame so the traceback looks like `python3 script`
+        # 이 파일의 프레임을 빼서 `python3 script`와 같은 트레이스백 출력
+        traceback.print_exception(type(e), e, e.__traceback__.tb_next)
+        status = 1
+    try:
+        sys.stdout.flush()
+        sys.stderr.flush()
+    except BaseException:
+        status = status or 120
+    # Skip atexit/finalizers inherited from the server / 서버에서 물려받은 정리 작업 생략
+    os._exit(status)
+
+def _sweep(pgid):
+    # Leftover grandchildren die with their solution / 남은 손자 프로세스는 풀이와 함께 종료
+    try:
+        os.killpg(pgid, signal.SIGKILL)
+    except OSError:
+        pass
+
+def _reply(sock, message):
+    # One JSON line per message, so stream-socket fallbacks can split them too
+    # 메시지마다 JSON 한 줄, 스트림 소켓 대체 경로에서도 분리 가능
+    sock.sendall((json.dumps(message) + "\n").encode("utf-8"))
+
+def serve(sock):
+    cache = {}
+    _reply(sock, {"ready": True})
+    while True:
+        try:
+            message, fds, _, _ = socket.recv_fds(sock, MAX_MESSAGE, 3)
+        except OSError:
+            return
+        if not message:
+            return # Client went away / 클라이언트 종료
+        request = json.loads(message)
+        script = request["script"]
+        try:
+            code = _compile(script, cache)
+        except OSError as e:
+            code = e
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            sock.close()
+            _run_child(script, code, fds, request.get("limits"), request.get("args", ()))
+        try:
+            os.setpgid(pid, pid) # Also from here, whichever runs first wins / 여기서도 설정, 먼저 실행된 쪽이 적용
+        except OSError:
+            pass
+        for fd in fds:
+            os.close(fd)
+        _reply(sock, {"pid": pid})
+        _, status, usage = os.wait4(pid, 0)
+        _sweep(pid)
+        _reply(sock, {"pid": pid, "status": status, "utime": usage.ru_utime, "stime": usage.ru_stime, "maxrss": usage.ru_maxrss})
+
+if __name__ == "__main__":
+    for name in WARM_MODULES:
+        __import__(name)
+    serve(socket.socket(fileno=int(sys.argv[1])))
@@ -0,0 +1,655 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Frytesty Judge - Test-case execution engine shared by the GUI and CLI
+# Frytesty 채점기 - GUI와 CLI가 함께 쓰는 테스트 케이스 실행 엔진
+# Rheehose (Rhee Creative) 2008-2026
+# Licensed under Apache-2.0
+
+import os
+import sys
+import json
+import time
+import queue
+import shutil
+import signal
+import socket
+import tempfile
+import selectors
+import subprocess
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+import suite
+import sandbox
+import checkers
+import languages
+
+PYTHON = languages.PYTHON
+FORKSERVER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "forkserver.py")
+DEFAULT_TIME_LIMIT = 5.0 # CPU seconds per case / 케이스당 CPU 제한 시간 (초)
+WALL_FACTOR = 2.0 # Wall-clock guard for sleeping/blocked solutions / 대기 중인 풀이를 위한 실제 시간 한도 배수
+RSS_UNIT = 1 if sys.platform == "darwin" else 1024 # ru_maxrss is bytes on macOS, KB elsewhere / macOS는 바이트, 그 외 KB
+VERDICTS = ("AC", "WA", "TLE", "MLE", "RE", "ERROR")
+PIPE_CHUNK = 64 * 1024
+CANCEL_POLL = 0.1 # Seconds between cancel checks while a child runs / 자식 실행 중 취소 확인 간격 (초)
+OUTPUT_KEEP = 64 * 1024 # Bytes of stdout/stderr kept for the report / 보고서용으로 보관하는 stdout/stderr 바이트
+HELPER_OUTPUT = 64 * 1024 * 1024 # Whole stdout kept from generators and references / 생성기와 기준 풀이의 stdout 전체 보관 한도
+# stderr signs of a failed allocation: Python, C++, Rust, Go, Node, Java
+# 할당 실패를 뜻하는 stderr 문구: 파이썬, C++, 러스트, Go, Node, 자바
+OOM_MARKERS = ("MemoryError", "std::bad_alloc", "memory allocation of", "out of memory", "OutOfMemoryError")
+
+class Cancelled(Exception):
+    pass
+
+def _kill_group(pid, alone=True):
+    # Solutions lead their own process group; fall back to the pid alone
+    # (only while it is unreaped, so it cannot have been reused)
+    # 풀이는 자체 프로세스 그룹의 리더, 실패하면 pid만 종료 (회수 전에만, 재사용 불가하므로)
+    try:
+        os.killpg(pid, signal.SIGKILL)
+    except OSError:
+        if alone:
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except OSError:
+                pass
+
+def default_workers():
+    return os.cpu_count() or 1
+
+def warm_supported():
+    # fork + SCM_RIGHTS fd passing: POSIX only / fork + SCM_RIGHTS fd 전달: POSIX 전용
+    return hasattr(os, "fork") and hasattr(socket, "send_fds")
+
+class ColdChild:
+    # A fresh process per case (`python3 script`, a compiled binary, `java Main`...)
+    # 케이스마다 새 프로세스 (`python3 script`, 컴파일된 실행 파일, `java Main`...)
+    def __init__(self, argv, limits=None, stdin_fd=None):
+        # stdin_fd: an input file handed to the child directly (no pipe, no copy)
+        # stdin_fd: 자식에게 직접 넘기는 입력 파일 (파이프와 복사 없음)
+        in_r, self.stdin = (stdin_fd, None) if stdin_fd is not None else os.pipe()
+        self.stdout, out_w = os.pipe()
+        self.stderr, err_w = os.pipe()
+        # prlimit() after spawn avoids preexec_fn, which is unsafe with worker threads;
+        # namespaces need an exec through the sandbox helper instead
+        # 작업 스레드와 함께 쓰기 위험한 preexec_fn 대신 생성 직후 prlimit() 적용,
+        # 네임스페이스는 샌드박스 도우미를 거쳐 exec
+        wrapped = bool(limits and limits.get("isolate"))
+        use_prlimit = hasattr(resource, "prlimit") and not wrapped
+        try:
+            self.proc = subprocess.Popen(
+                sandbox.wrap(argv, limits) if wrapped else sandbox.harden(argv, limits) if use_prlimit else argv, stdin=in_r, stdout=out_w, stderr=err_w,
+                env=sandbox.child_env(limits), start_new_session=True,
+                preexec_fn=None if use_prlimit or wrapped or not limits else lambda: sandbox.apply_limits(limits)
+            )
+        except OSError:
+            for fd in (self.stdin, self.stdout, self.stderr):
+                if fd is not None:
+                    os.close(fd)
+            raise
+        finally:
+            for fd in (in_r, out_w, err_w):
+                os.close(fd)
+        self.pid = self.proc.pid
+        # Readable once the child exits, even while grandchildren keep its pipes open (Linux 5.3+)
+        # 손자 프로세스가 파이프를 붙잡고 있어도 자식이 종료되면 읽기 가능 (리눅스 5.3+)
+        try:
+            self.exited = os.pidfd_open(self.pid)
+        except (AttributeError, OSError):
+            self.exited = None
+        if use_prlimit and limits:
+            try:
+                sandbox.prlimit(self.pid, limits)
+            except ProcessLookupError:
+                pass # Already exited / 이미 종료됨
+
+    def kill(self):
+        # The whole process group (start_new_session), so grandchildren die too.
+        # Not Popen.kill(): it polls first and may reap the child before wait4().
+        # 프로세스 그룹 전체 (start_new_session)를 종료해 손자 프로세스도 함께 종료.
+        # Popen.kill()은 먼저 poll()하여 wait4() 전에 자식을 회수할 수 있으므로 사용하지 않음.
+        _kill_group(self.pid)
+
+    def wait(self):
+        # wait4() instead of Popen.wait() to get the child's own rusage
+        # 자식 자신의 rusage를 얻기 위해 Popen.wait() 대신 wait4()
+        _, status, usage = os.wait4(self.pid, 0)
+        if self.exited is not None:
+            os.close(self.exited)
+            self.exited = None
+        _kill_group(self.pid, alone=False) # Leftover grandchildren only: the pid is free now / 남은 손자만, pid는 이미 해제됨
+        self.proc.returncode = os.waitstatus_to_exitcode(status)
+        return self.proc.returncode, {"utime": usage.ru_utime, "stime": usage.ru_stime, "maxrss": usage.ru_maxrss}
+
+class WarmInterpreter:
+    # Client of one forkserver.py process; used by one case at a time
+    # forkserver.py 프로세스 하나의 클라이언트, 한 번에 한 케이스만 사용
+    def __init__(self):
+        try:
+            self.sock, theirs = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        except OSError:
+            self.sock, theirs = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self.proc = subprocess.Popen(
+                [PYTHON, FORKSERVER, str(theirs.fileno())],
+                pass_fds=(theirs.fileno(),), stdin=subprocess.DEVNULL
+            )
+        finally:
+            theirs.close()
+        self.replies = self.sock.makefile("rb")
+        self.read_reply() # Booted and warmed up / 부팅 및 예열 완료
+
+    def read_reply(self):
+        line = self.replies.readline()
+        if not line:
+            raise OSError("fork server exited")
+        return json.loads(line)
+
+    def spawn(self, script, limits=None, stdin_fd=None, args=()):
+        in_r, in_w = (stdin_fd, None) if stdin_fd is not None else os.pipe()
+        out_r, out_w = os.pipe()
+        err_r, err_w = os.pipe()
+        try:
+            request = json.dumps({"script": os.path.abspath(script), "limits": limits, "args": list(args)}).encode("utf-8")
+            socket.send_fds(self.sock, [request], [in_r, out_w, err_w])
+        except OSError:
+            for fd in (in_w, out_r, err_r):
+                if fd is not None:
+                    os.close(fd)
+            raise
+        finally:
+            for fd in (in_r, out_w, err_w):
+                os.close(fd)
+        return WarmChild(self, self.read_reply()["pid"], in_w, out_r, err_r)
+
+    def alive(self):
+        return self.proc.poll() is None
+
+    def close(self):
+        self.replies.close()
+        self.sock.close()
+        try:
+            self.proc.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+            self.proc.wait()
+
+class WarmChild:
+    def __init__(self, server, pid, stdin, stdout, stderr):
+        self.server, self.pid = server, pid
+        self.stdin, self.stdout, self.stderr = stdin, stdout, stderr
+        self.returncode = None
+        self.usage = None
+
+    def kill(self):
+        if self.returncode is None:
+            _kill_group(self.pid)
+
+    def wait(self):
+        # The server reaps the child with wait4() and reports status + rusage
+        # 서버가 wait4()로 자식을 회수하고 상태와 rusage를 보고
+        if self.returncode is None:
+            reply = self.server.read_reply()
+            self.returncode = os.waitstatus_to_exitcode(reply["status"])
+            self.usage = {key: reply[key] for key in ("utime", "stime", "maxrss")}
+        return self.returncode, self.usage
+
+class InterpreterPool:
+    # Warm interpreters are started on first use and shared by the worker threads.
+    # `cancel` (a threading.Event) aborts every case of the run that uses the pool.
+    # 예열 인터프리터는 처음 쓸 때 시작되어 작업 스레드들이 공유.
+    # `cancel` (threading.Event)은 이 풀을 쓰는 실행의 모든 케이스를 중단.
+    def __init__(self, warm=True, cancel=None):
+        self.warm = warm and warm_supported()
+        self.cancel = cancel
+        self.idle = queue.SimpleQueue()
+        self.started = []
+
+    def check_cancel(self):
+        if self.cancel is not None and self.cancel.is_set():
+            raise Cancelled()
+
+    def acquire(self):
+        # Starting a server is not part of any case's timing / 서버 시작은 케이스 시간에 포함되지 않음
+        self.check_cancel()
+        if not self.warm:
+            return None
+        try:
+            return self.idle.get_nowait()
+        except queue.Empty:
+            server = WarmInterpreter()
+            self.started.append(server)
+            return server
+
+    def release(self, server):
+        if server and server.alive():
+            self.idle.put(server)
+
+    def close(self):
+        for server in self.started:
+            server.close()
+        self.started = []
+
+class _Capture:
+    # Keeps the first OUTPUT_KEEP bytes of a stream and drops the rest
+    # 스트림의 처음 OUTPUT_KEEP 바이트만 보관하고 나머지는 버림
+    def __init__(self):
+        self.head = bytearray()
+        self.truncated = False
+
+    def add(self, block):
+        room = OUTPUT_KEEP - len(self.head)
+        if len(block) > room:
+            self.truncated = True
+        self.head += block[:max(0, room)]
+
+    def text(self):
+        text = self.head.decode("utf-8", errors="replace").strip()
+        return text + " ..." if self.truncated else text
+
+def _communicate(child, chunks, timeout, on_stdout, cancel=None):
+    # Streams stdin from `chunks` and hands stdout blocks to on_stdout without
+    # buffering them; kills on timeout or when on_stdout returns False.
+    # Returns (stderr capture, timed_out, stopped); raises Cancelled once
+    # `cancel` is set (the caller kills and reaps the child).
+    # `chunks`에서 stdin을 흘려 쓰고 stdout 블록은 버퍼링 없이 on_stdout에 전달,
+    # 시간 초과나 on_stdout이 False를 반환하면 종료. (stderr, 시간 초과, 중단) 반환,
+    # `cancel`이 설정되면 Cancelled 발생 (자식 종료와 회수는 호출자 담당).
+    deadline = time.monotonic() + timeout if timeout else None
+    stderr = _Capture()
+    chunks = iter(chunks)
+    view, offset = memoryview(b""), 0
+    sel = selectors.DefaultSelector()
+    if child.stdin is not None:
+        os.set_blocking(child.stdin, False)
+        sel.register(child.stdin, selectors.EVENT_WRITE)
+    for fd in (child.stdout, child.stderr):
+        sel.register(fd, selectors.EVENT_READ)
+    exited = getattr(child, "exited", None)
+    if exited is not None:
+        sel.register(exited, selectors.EVENT_READ)
+    timed_out = stopped = False
+    try:
+        while sel.get_map():
+            remaining = deadline - time.monotonic() if deadline else None
+            if remaining is not None and remaining <= 0:
+                timed_out = True
+                child.kill()
+                break
+            if cancel is not None:
+                if cancel.is_set():
+                    raise Cancelled()
+                remaining = CANCEL_POLL if remaining is None else min(remaining, CANCEL_POLL)
+            for key, _ in sel.select(remaining):
+                if key.fd == child.stdin:
+                    if offset >= len(view):
+                        view, offset = memoryview(next(chunks, b"")), 0
+                    try:
+                        offset += os.write(key.fd, view[offset:offset + PIPE_CHUNK]) if view else 0
+                    except BrokenPipeError:
+                        view = None # Solution stopped reading / 풀이가 읽기를 멈춤
+                    if not view:
+                        sel.unregister(key.fd)
+                        os.close(key.fd)
+                    continue
+                if key.fd == exited:
+                    # Solution is done: leftover grandchildren must not hold its pipes open
+                    # 풀이 종료: 남은 손자 프로세스가 파이프를 붙잡지 못하도록 종료
+                    sel.unregister(exited)
+                    child.kill()
+                    continue
+                block = os.read(key.fd, PIPE_CHUNK)
+                if not block:
+                    sel.unregister(key.fd)
+                    os.close(key.fd)
+                elif key.fd == child.stderr:
+                    stderr.add(block)
+                elif not on_stdout(block):
+                    # Verdict already decided: stop the solution now / 판정 확정: 풀이를 즉시 중단
+                    stopped = True
+                    child.kill()
+            if stopped:
+                break
+    finally:
+        for key in list(sel.get_map().values()):
+            if key.fd != exited: # Owned by the child / 자식 소유
+                os.close(key.fd)
+        sel.close()
+    return stderr, timed_out, stopped
+
+def _run_legacy(argv, in_data, timeout):
+    # Platforms without select() on pipes or wait4() (Windows): wall time only
+    # 파이프 select()나 wait4()가 없는 플랫폼 (윈도우): 실제 시간만 측정
+    process = subprocess.Popen(argv, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    try:
+        stdout, stderr = process.communicate(input=in_data, timeout=timeout)
+        return stdout, stderr, False, process.returncode, None
+    except subprocess.TimeoutExpired:
+        process.kill()
+        stdout, stderr = process.communicate()
+        return stdout, stderr, True, process.returncode, None
+
+def _start(server, program, limits, stdin_fd, args=()):
+    # Forks from the warm server when there is one (Python only), else starts
+    # cold. Returns (child, server); server is None if it broke or was not used.
+    # 예열 서버가 있으면 fork (파이썬 전용), 없으면 콜드 시작. (자식, 서버) 반환,
+    # 고장 났거나 쓰지 않은 서버는 None.
+    if limits and not program.limit_as:
+        limits = dict(limits, memory=None) # Judged on peak RSS instead / 대신 최대 RSS로 판정
+    if server and program.warm:
+        try:
+            return server.spawn(program.source, limits, stdin_fd, args), server
+        except OSError:
+            # Broken server: drop it and fall back to a cold start
+            # 고장 난 서버는 버리고 콜드 시작으로 대체
+            server.close()
+            server = None
+    return ColdChild(program.argv + list(args), limits, stdin_fd), server
+
+def _execute(pool, server, program, limits, stdin_fd, chunks, timeout, on_stdout, args=()):
+    # One child on an acquired warm interpreter (or cold), which is handed back
+    # to the pool afterwards; returns (stderr, timed_out, stopped, returncode, usage)
+    # 획득한 예열 인터프리터(또는 콜드)에서 자식 하나를 실행하고 서버는 풀에 반환.
+    # (stderr, 시간 초과, 중단, 종료 코드, 사용량) 반환
+    child, server = _start(server, program, limits, stdin_fd, args)
+    try:
+        stderr, timed_out, stopped = _communicate(child, chunks, timeout, on_stdout, pool.cancel if pool else None)
+        returncode, usage = child.wait()
+    except BaseException:
+        # Reap the killed child: no zombie, and the server's reply is consumed so
+        # it stays reusable; a server that cannot answer is dropped
+        # 종료한 자식을 회수: 좀비가 남지 않고 서버 응답도 읽어 재사용 가능, 응답 못 하는 서버는 폐기
+        child.kill()
+        try:
+            child.wait()
+        except (OSError, ValueError):
+            if server:
+                server.close()
+                server = None
+        raise
+    finally:
+        if pool:
+            pool.release(server)
+    return stderr, timed_out, stopped, returncode, usage
+
+def _run_checker(pool, checker, source, timeout):
+    # Special judges run right after the solution, in the same worker thread and
+    # interpreter pool, so checking overlaps with the other cases
+    # 스페셜 저지는 풀이 직후 같은 작업 스레드와 인터프리터 풀에서 실행되어 다른 케이스와 겹쳐 진행
+    # Checker scripts may be any supported language / 체커 스크립트는 지원하는 어느 언어든 가능
+    try:
+        program = languages.prepare(checker.script)
+    except languages.CompileError as e:
+        checker.failure = f"Checker does not compile:\n{e}"
+        return False
+    output = _Capture()
+    args = checker.arguments(source)
+    if os.name == "nt":
+        out, err, timed_out, returncode, _ = _run_legacy(program.argv + args, b"", timeout)
+        output.add(err or out)
+    else:
+        server = pool.acquire() if pool and program.warm else None
+        stderr, timed_out, _, returncode, _ = _execute(
+            pool, server, program, None, None, (), timeout, lambda block: output.add(block) or True, args
+        )
+        output = stderr if stderr.head else output
+    if timed_out:
+        return checker.conclude(None, f"no verdict after {timeout:g}s")
+    return checker.conclude(returncode, output.text())
+
+def judge_verdict(passed, timed_out, stopped, returncode, cpu, rss, stderr, time_limit, memory_limit):
+    if timed_out or (cpu is not None and time_limit and cpu > time_limit * 1000):
+        return "TLE"
+    # No SIGXCPU on Windows: a 0 fallback would turn every clean exit into TLE
+    # Windows에는 SIGXCPU가 없음: 0으로 대신하면 모든 정상 종료가 TLE가 됨
+    if hasattr(signal, "SIGXCPU") and returncode == -signal.SIGXCPU:
+        return "TLE"
+    if memory_limit and ((rss or 0) > memory_limit or (returncode and any(marker in stderr for marker in OOM_MARKERS))):
+        return "MLE"
+    if stopped:
+        return "WA" # Killed by the judge at the first mismatch / 첫 불일치에서 채점기가 종료
+    if returncode:
+        return "RE"
+    return "AC" if passed else "WA"
+
+def _signal_name(number):
+    # SIGXFSZ = file size cap, SIGXCPU = CPU cap, SIGKILL = usually memory / 파일 크기, CPU, 대개 메모리
+    try:
+        return signal.Signals(number).name
+    except ValueError:
+        return f"signal {number}"
+
+def _excerpt(blob):
+    capture = _Capture()
+    for block in blob.chunks():
+        capture.add(block)
+        if capture.truncated:
+            break
+    return capture.text()
+
+def _stdin_fd(source):
+    # Whole input files become the child's stdin as-is / 입력 파일 전체는 그대로 자식의 stdin이 됨
+    return os.open(source.path, os.O_RDONLY) if getattr(source, "whole", False) else None
+
+def run_case(script, in_data, expected, time_limit=DEFAULT_TIME_LIMIT, memory_limit=None, pool=None, checker="lines", caps=None):
+    # verdict: AC / WA / TLE / MLE / RE / ERROR (could not start, or the checker failed)
+    # script: a source path or a languages.prepare() Program / 소스 경로 또는 languages.prepare()의 Program
+    # time_limit in CPU seconds, memory_limit in bytes (RLIMIT_AS) / CPU 초, 바이트 단위
+    # checker: a checkers.resolve() spec or factory / checkers.resolve() 지정자 또는 팩토리
+    # caps: sandbox limits from sandbox_caps() / sandbox_caps()의 샌드박스 제한
+    # Raises languages.CompileError if the source does not build / 빌드 실패 시 languages.CompileError
+    program = languages.prepare(script)
+    source = suite.as_blob(in_data)
+    expected = suite.as_blob(expected)
+    checker = checkers.resolve(checker)(expected)
+    caps = dict(caps or {})
+    if os.name != "nt":
+        # Private scratch dir per case (a tmpfs of its own when isolated)
+        # 케이스별 전용 임시 폴더 (격리 시에는 전용 tmpfs)
+        caps["tmpdir"] = tempfile.mkdtemp(prefix="frytesty-case-")
+    try:
+        return _judge_case(program, source, expected, time_limit, memory_limit, pool, checker, caps)
+    finally:
+        checker.close()
+        if caps.get("tmpdir"):
+            shutil.rmtree(caps["tmpdir"], ignore_errors=True)
+
+def _cached_case(cache, stamp, program, in_data, expected, *args):
+    # run_case() through the result cache: replayed when reusing, recorded always
+    # 결과 캐시를 거친 run_case(): 재사용 시에는 재생, 항상 기록
+    key = cache.key(stamp, in_data, expected)
+    if cache.reuse and key:
+        result = cache.get(key)
+        if result is not None:
+            return result
+    result = run_case(program, in_data, expected, *args)
+    cache.put(key, result)
+    return result
+
+def _judge_case(program, source, expected, time_limit, memory_limit, pool, checker, caps):
+    stdout = _Capture()
+
+    def on_stdout(block):
+        stdout.add(block)
+        return checker.feed(block)
+
+    # Without a memory limit the sandbox cap still applies (MemoryError -> RE)
+    # 메모리 제한이 없어도 샌드박스 상한은 적용 (MemoryError -> RE)
+    limits = dict(caps, cpu=time_limit, memory=memory_limit or caps.get("memory_cap"))
+    limits.pop("memory_cap", None)
+    wall_limit = time_limit * WALL_FACTOR if time_limit else None
+    try:
+        server = pool.acquire() if pool and program.warm and os.name != "nt" else None
+        start_time = time.perf_counter_ns()
+        if os.name == "nt":
+            out, err, timed_out, returncode, usage = _run_legacy(program.argv, source.read(), wall_limit)
+            stopped = False
+            on_stdout(out)
+            stderr = _Capture()
+            stderr.add(err)
+        else:
+            stderr, timed_out, stopped, returncode, usage = _execute(
+                pool, server, program, limits, _stdin_fd(source), source.chunks(), wall_limit, on_stdout
+            )
+        elapsed = (time.perf_counter_ns() - start_time) / 1e6 # ms
+        passed = not timed_out and not stopped and returncode == 0 and checker.finish()
+        if passed and checker.script:
+            passed = _run_checker(pool, checker, source, wall_limit)
+    except OSError as e:
+        return {
+            "verdict": "ERROR", "passed": False, "actual": "", "expected": _excerpt(expected),
+            "elapsed": 0, "cpu": None, "rss": None, "exit_code": None, "stopped": False, "mismatch": None, "error": str(e)
+        }
+    cpu = (usage["utime"] + usage["stime"]) * 1000 if usage else None
+    rss = usage["maxrss"] * RSS_UNIT if usage else None
+
+    error = stderr.text()
+    verdict = judge_verdict(passed, timed_out, stopped, returncode, cpu, rss, error, time_limit, memory_limit)
+    if timed_out:
+        error = (error + "\n" if error else "") + f"Killed after {wall_limit:g}s wall time"
+    elif returncode is not None and returncode < 0 and not stopped:
+        error = (error + "\n" if error else "") + f"Terminated by {_signal_name(-returncode)}"
+    if checker.failure:
+        verdict, error = "ERROR", checker.failure
+    return {
+        "verdict": verdict,
+        "passed": verdict == "AC",
+        "actual": stdout.text(),
+        "expected": _excerpt(expected),
+        "elapsed": elapsed,
+        "cpu": cpu,
+        "rss": rss,
+        "exit_code": returncode,
+        # Killed by the judge at the first mismatch: exit_code is then the
+        # judge's own signal, not the solution's status
+        # 첫 불일치에서 채점기가 종료: 이때 exit_code는 풀이가 아니라 채점기의 시그널
+        "stopped": stopped,
+        "mismatch": checker.mismatch if verdict == "WA" else None,
+        "error": error
+    }
+
+def run_program(script, in_data=b"", time_limit=DEFAULT_TIME_LIMIT, pool=None, args=(), caps=None):
+    # Runs a helper (test generator, reference solution) and keeps its whole
+    # stdout: {"ok", "stdout" (bytes), "returncode", "timed_out", "error",
+    # "elapsed" (ms), "cpu" (ms or None)}
+    # 보조 프로그램(테스트 생성기, 기준 풀이)을 실행하고 stdout 전체를 보관:
+    # {"ok", "stdout" (바이트), "returncode", "timed_out", "error", "elapsed" (ms), "cpu" (ms 또는 None)}
+    program = languages.prepare(script)
+    source = suite.as_blob(in_data)
+    caps = dict(caps or {})
+    limits = dict(caps, cpu=time_limit, memory=caps.pop("memory_cap", None))
+    wall_limit = time_limit * WALL_FACTOR if time_limit else None
+    blocks, size = [], 0
+
+    def on_stdout(block):
+        nonlocal size
+        blocks.append(block)
+        size += len(block)
+        return size <= HELPER_OUTPUT
+
+    try:
+        if os.name == "nt":
+            start_time = time.perf_counter_ns()
+            out, err, timed_out, returncode, usage = _run_legacy(program.argv + list(args), source.read(), wall_limit)
+            stopped = not on_stdout(out)
+            error = err.decode("utf-8", errors="replace")
+        else:
+            server = pool.acquire() if pool and program.warm else None
+            start_time = time.perf_counter_ns()
+            stderr, timed_out, stopped, returncode, usage = _execute(
+                pool, server, program, limits, _stdin_fd(source), source.chunks(), wall_limit, on_stdout, args
+            )
+            error = stderr.text()
+        elapsed = (time.perf_counter_ns() - start_time) / 1e6 # ms
+    except OSError as e:
+        return {"ok": False, "stdout": b"", "returncode": None, "timed_out": False, "error": str(e), "elapsed": 0, "cpu": None}
+    if timed_out:
+        error = (error + "\n" if error else "") + f"Killed after {wall_limit:g}s wall time"
+    elif stopped:
+        error = (error + "\n" if error else "") + f"Output larger than {HELPER_OUTPUT // (1024 * 1024)}MB"
+    return {
+        "ok": returncode == 0 and not timed_out and not stopped,
+        "stdout": b"".join(blocks),
+        "returncode": returncode,
+        "timed_out": timed_out,
+        "error": error,
+        "elapsed": elapsed,
+        "cpu": (usage["utime"] + usage["stime"]) * 1000 if usage else None,
+    }
+
+def sandbox_caps(workers, isolate=False):
+    # Limits every case gets on top of its time/memory limit, sized for the
+    # whole run so parallel cases cannot starve the machine together
+    # 시간/메모리 제한 외에 모든 케이스에 적용되는 제한, 병렬 케이스가 함께 기계를
+    # 고갈시키지 않도록 실행 전체 기준으로 산정
+    if os.name == "nt":
+        return {}
+    if isolate and not sandbox.isolation_supported():
+        raise OSError("Namespace isolation is not available (unprivileged user namespaces are disabled)")
+    return {
+        "fsize": sandbox.FSIZE_LIMIT,
+        "nproc": sandbox.nproc_limit(workers),
+        "memory_cap": sandbox.memory_cap(workers),
+        "isolate": isolate,
+    }
+
+def run_suite(script, cases, workers=None, time_limit=DEFAULT_TIME_LIMIT, memory_limit=None, warm=True, checker="lines", language=None, flags="", cancel=None, isolate=False, cache=None, order=None):
+    # Yields (case_num, result) in completion order; case_num is the 1-based
+    # position in `cases`, so numbering stays stable whatever finishes first.
+    # Each case is its own child process, so threads only wait on pipes.
+    # Setting `cancel` (a threading.Event) kills running children, drops queued
+    # cases and ends the generator early.
+    # 완료 순서대로 (케이스 번호, 결과) 생성, 번호는 `cases` 내 1부터의 위치라
+    # 먼저 끝나는 순서와 무관하게 고정. 케이스마다 자식 프로세스이므로 스레드는 파이프만 대기.
+    # `cancel` (threading.Event)을 설정하면 실행 중인 자식을 종료하고 대기 중인 케이스를
+    # 버린 뒤 생성을 조기 종료.
+    # With a results.ResultCache every result is recorded; if cache.reuse is
+    # set, unchanged cases are replayed from it (marked "cached") instead of run.
+    # results.ResultCache를 주면 모든 결과를 기록하고, cache.reuse가 설정되면
+    # 바뀌지 않은 케이스는 실행 대신 캐시에서 재생 ("cached" 표시).
+    # `order` (0-based indices) sets which cases start first; numbering is unchanged.
+    # `order` (0부터의 인덱스)는 먼저 시작할 케이스를 정하며 번호는 그대로.
+    # Compiled once here, before any worker starts; CompileError propagates
+    # 작업자 시작 전에 여기서 한 번 컴파일, CompileError는 그대로 전달
+    program = languages.prepare(script, language, flags)
+    workers = max(1, workers or default_workers())
+    checker = checkers.resolve(checker) # Bad specs fail before any case runs / 잘못된 지정자는 실행 전에 실패
+    caps = sandbox_caps(workers, isolate)
+    pool = InterpreterPool(warm and program.warm, cancel)
+    run = run_case
+    if cache is not None:
+        run = partial(_cached_case, cache, cache.stamp(program, checker, time_limit, memory_limit, isolate))
+    try:
+        with ThreadPoolExecutor(max_workers=min(workers, max(1, len(cases)))) as executor:
+            futures = {
+                executor.submit(run, program, cases[i][0], cases[i][1], time_limit, memory_limit, pool, checker, caps): i + 1
+                for i in (range(len(cases)) if order is None else order)
+            }
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Cancelled:
+                    result = None
+                if result is None or (cancel is not None and cancel.is_set()):
+                    for pending in futures:
+                        pending.cancel()
+                    return
+                yield futures[future], result
+    finally:
+        pool.close()
+
+def format_usage(res):
+    # "12.3ms wall 10.1ms cpu 9.8MB" for the CLI and GUI / CLI와 GUI 공용
+    text = f"{res['elapsed']:.2f}ms"
+    if res.get("cpu") is not None:
+        text += f" cpu {res['cpu']:.2f}ms"
+    if res.get("rss") is not None:
+        text += f" {res['rss'] / (1024 * 1024):.1f}MB"
+    if res.get("cached"):
+        text += " (cached)"
+    return text
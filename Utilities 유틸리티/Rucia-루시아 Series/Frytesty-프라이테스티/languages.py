@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Frytesty Languages - Language profiles and the compile-once build cache
+# Frytesty 언어 - 언어 프로필과 한 번만 컴파일하는 빌드 캐시
+# Rheehose (Rhee Creative) 2008-2026
+# Licensed under Apache-2.0
+
+import os
+import shlex
+import shutil
+import hashlib
+import tempfile
+import threading
+import subprocess
+from collections import namedtuple
+
+PYTHON = "python3"
+COMPILE_TIMEOUT = 120 # Seconds / 초
+CACHE_ENTRIES = 64 # Builds kept, least recently used are pruned / 보관할 빌드 수, 오래 안 쓴 것부터 정리
+CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "frytesty", "build")
+EXE_SUFFIX = ".exe" if os.name == "nt" else ""
+
+# compile/run are argv templates: {src} source, {dir} build directory,
+# {exe} built executable, {main} source file stem (Java class name).
+# limit_as: RLIMIT_AS is safe to apply; JVM/Go/V8 reserve huge address ranges
+# up front, so for them the memory limit is judged on peak RSS only.
+# compile/run은 argv 템플릿: {src} 소스, {dir} 빌드 폴더, {exe} 실행 파일,
+# {main} 소스 파일 이름 (자바 클래스 이름). limit_as: RLIMIT_AS 적용 가능 여부,
+# JVM/Go/V8은 시작 시 큰 주소 공간을 예약하므로 메모리 제한을 최대 RSS로만 판정.
+Profile = namedtuple("Profile", "name extensions compile run limit_as")
+
+PROFILES = {
+    "python": Profile("python", (".py",), None, [PYTHON, "{src}"], True),
+    "pypy": Profile("pypy", (), None, ["pypy3", "{src}"], True),
+    "c": Profile("c", (".c",), ["gcc", "-O2", "-std=gnu17", "-pipe", "-o", "{exe}", "{src}", "-lm"], ["{exe}"], True),
+    "cpp": Profile("cpp", (".cpp", ".cc", ".cxx"), ["g++", "-O2", "-std=gnu++17", "-pipe", "-o", "{exe}", "{src}"], ["{exe}"], True),
+    "java": Profile("java", (".java",), ["javac", "-encoding", "UTF-8", "-d", "{dir}", "{src}"], ["java", "-Xss64m", "-cp", "{dir}", "{main}"], False),
+    "rust": Profile("rust", (".rs",), ["rustc", "-O", "--edition", "2021", "-o", "{exe}", "{src}"], ["{exe}"], True),
+    "go": Profile("go", (".go",), ["go", "build", "-o", "{exe}", "{src}"], ["{exe}"], False),
+    "node": Profile("node", (".js", ".mjs"), None, ["node", "{src}"], False),
+}
+
+class CompileError(Exception):
+    pass
+
+# A prepared solution: argv to run, whether warm Python interpreters can fork
+# it, and whether RLIMIT_AS applies / 준비된 풀이: 실행 argv, 예열 파이썬 인터프리터
+# 사용 가능 여부, RLIMIT_AS 적용 여부
+Program = namedtuple("Program", "source language argv warm limit_as")
+
+_prepared = {} # (path, mtime_ns, size, language, flags) -> Program or CompileError
+_lock = threading.Lock()
+
+def detect(path):
+    ext = os.path.splitext(path)[1].lower()
+    for profile in PROFILES.values():
+        if ext in profile.extensions:
+            return profile.name
+    return "python" # Previous behaviour for unknown files / 알 수 없는 파일은 기존 동작대로
+
+def _fill(template, values):
+    return [part.format(**values) for part in template]
+
+def _build_key(profile, flags, source):
+    # Source bytes + the exact compile command, so new flags mean a new build
+    # 소스 바이트 + 정확한 컴파일 명령, 플래그가 바뀌면 새 빌드
+    digest = hashlib.sha256()
+    digest.update("\0".join(profile.compile + flags).encode("utf-8") + b"\0")
+    digest.update(source)
+    return digest.hexdigest()[:32]
+
+def _prune(keep):
+    try:
+        entries = [os.path.join(CACHE_DIR, name) for name in os.listdir(CACHE_DIR) if not name.startswith(".")]
+    except OSError:
+        return
+    entries.sort(key=lambda path: os.path.getmtime(path) if os.path.exists(path) else 0, reverse=True)
+    for path in entries[keep:]:
+        shutil.rmtree(path, ignore_errors=True)
+
+def _compile(profile, path, flags):
+    with open(path, "rb") as f:
+        source = f.read()
+    key = _build_key(profile, flags, source)
+    build_dir = os.path.join(CACHE_DIR, key)
+    name = os.path.basename(path)
+    values = {"dir": build_dir, "src": os.path.join(build_dir, name), "exe": os.path.join(build_dir, "main" + EXE_SUFFIX), "main": os.path.splitext(name)[0]}
+    if os.path.isdir(build_dir):
+        os.utime(build_dir) # Recently used / 최근 사용 표시
+        return values
+    # Build in a scratch directory and rename it into place, so concurrent runs
+    # never see a half-written build / 임시 폴더에서 빌드 후 이름을 바꿔 넣어 동시 실행 시에도
+    # 반쯤 쓰인 빌드가 보이지 않음
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    scratch = tempfile.mkdtemp(prefix=".build-", dir=CACHE_DIR)
+    try:
+        scratch_values = dict(values, dir=scratch, src=os.path.join(scratch, name), exe=os.path.join(scratch, "main" + EXE_SUFFIX))
+        with open(scratch_values["src"], "wb") as f:
+            f.write(source)
+        command = _fill(profile.compile, scratch_values)
+        command[1:1] = flags
+        try:
+            result = subprocess.run(command, cwd=scratch, stdin=subprocess.DEVNULL, capture_output=True, timeout=COMPILE_TIMEOUT)
+        except FileNotFoundError:
+            raise CompileError(f"{command[0]} not found: install it to run {profile.name} solutions")
+        except subprocess.TimeoutExpired:
+            raise CompileError(f"Compilation took longer than {COMPILE_TIMEOUT}s")
+        if result.returncode != 0:
+            output = (result.stderr or result.stdout).decode("utf-8", errors="replace")
+            raise CompileError(output.replace(scratch + os.sep, "").strip() or f"{command[0]} exited with {result.returncode}")
+        try:
+            os.rename(scratch, build_dir)
+            scratch = None
+        except OSError:
+            pass # Another run finished the same build first / 다른 실행이 같은 빌드를 먼저 완료
+    finally:
+        if scratch:
+            shutil.rmtree(scratch, ignore_errors=True)
+    _prune(CACHE_ENTRIES)
+    return values
+
+def prepare(path, language=None, flags=""):
+    # Resolves a solution file to a Program, compiling it if needed. Compiles
+    # happen once per source version and flag set: repeated runs hit the
+    # on-disk cache, and within one process even the hashing is skipped.
+    # 풀이 파일을 Program으로 변환하고 필요하면 컴파일. 소스 버전과 플래그 조합마다
+    # 한 번만 컴파일: 반복 실행은 디스크 캐시를 쓰고, 같은 프로세스 안에서는 해시도 생략.
+    if isinstance(path, Program):
+        return path
+    path = os.path.abspath(path)
+    profile = PROFILES[language or detect(path)]
+    flags = shlex.split(flags or "")
+    st = os.stat(path)
+    memo = (path, st.st_mtime_ns, st.st_size, profile.name, tuple(flags))
+    with _lock:
+        if memo in _prepared:
+            if isinstance(_prepared[memo], CompileError):
+                raise _prepared[memo] # Same source, same errors / 같은 소스, 같은 오류
+            return _prepared[memo]
+        if profile.compile:
+            try:
+                values = _compile(profile, path, flags)
+            except CompileError as e:
+                _prepared[memo] = e.with_traceback(None)
+                raise
+        else:
+            values = {"src": path}
+        argv = _fill(profile.run, values)
+        if not profile.compile:
+            argv[1:1] = flags # Interpreter options, e.g. python3 -X / 인터프리터 옵션
+        # Only plain CPython runs on the warm fork servers / 예열 포크 서버는 옵션 없는 CPython만
+        program = Program(path, profile.name, argv, profile.name == "python" and not flags, profile.limit_as)
+        _prepared[memo] = program
+        return program
+
+def available(name):
+    # Whether the toolchain for a profile is on PATH / 프로필의 도구가 PATH에 있는지
+    profile = PROFILES[name]
+    return shutil.which((profile.compile or profile.run)[0]) is not None
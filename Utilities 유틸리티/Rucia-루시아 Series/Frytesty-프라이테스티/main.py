@@ -6,13 +6,27 @@
 # Licensed under Apache-2.0
 
 import os
-import subprocess
-import time
-import difflib
+import sys
+import queue
+import threading
 from tkinter import filedialog, messagebox
 import customtkinter as ctk
 import locale
 
+import judge
+import suite
+import checkers
+import languages
+import results
+import watch
+
+RESULT_DRAIN_MS = 50
+RESULT_DRAIN_BATCH = 200 # Results taken per drain, keeps the window responsive / 한 번에 가져오는 결과 수, 창 응답성 유지
+REPORT_ROW_HEIGHT = 28
+REPORT_WHEEL_ROWS = 3
+WATCH_POLL_MS = 200
+DETAIL_LINES = 200 # Output lines shown per side without a diff window / 비교 창이 없을 때 쪽마다 보여주는 출력 줄 수
+
 def get_system_lang():
     try:
         lang, _ = locale.getdefaultlocale()
@@ -42,7 +56,28 @@ TRANSLATIONS = {
         'timeout': '시간 초과 / TIMEOUT',
         'error': '오류 / ERROR',
         'expected': '기대값 / Expected',
-        'actual': '실제값 / Actual'
+        'actual': '실제값 / Actual',
+        'workers': '병렬 / Workers',
+        'warm': '예열 인터프리터 / Warm interpreters',
+        'isolate': '격리 / Isolate',
+        'changed_only': '변경분만 / Changed only',
+        'watch': '감시 / Watch',
+        'time_limit': '시간 제한(초) / Time limit (s)',
+        'memory_limit': '메모리(MB) / Memory (MB)',
+        'load_suite': '스위트 불러오기 / LOAD SUITE',
+        'suite_loaded': '스위트 {count}개 케이스 불러옴 / Loaded {count} cases from suite',
+        'suite_empty': '테스트 케이스를 찾지 못했습니다! / No test cases found!',
+        'first_diff': '첫 차이 / First difference',
+        'diff': '비교 (- 기대값, + 실제값) / Diff (- expected, + actual)',
+        'checker': '체커 / Checker',
+        'language': '언어 / Language',
+        'flags_placeholder': '컴파일 옵션 / Compiler flags',
+        'compile_error': '컴파일 오류 / Compile Error',
+        'cancel': '취소 / CANCEL',
+        'cancelling': '취소 중... / Cancelling...',
+        'cancelled': '취소됨 / Cancelled',
+        'compiling': '준비 중... / Preparing...',
+        'select_row': '행을 클릭하면 상세 정보가 표시됩니다 / Click a row for details'
     },
     'en': {
         'tester': 'TESTER',
@@ -62,7 +97,28 @@ TRANSLATIONS = {
         'timeout': 'TIMEOUT',
         'error': 'ERROR',
         'expected': 'Expected',
-        'actual': 'Actual'
+        'actual': 'Actual',
+        'workers': 'Workers',
+        'warm': 'Warm interpreters',
+        'isolate': 'Isolate',
+        'changed_only': 'Changed only',
+        'watch': 'Watch',
+        'time_limit': 'Time limit (s)',
+        'memory_limit': 'Memory (MB)',
+        'load_suite': 'LOAD SUITE',
+        'suite_loaded': 'Loaded {count} cases from suite',
+        'suite_empty': 'No test cases found!',
+        'first_diff': 'First difference',
+        'diff': 'Diff (- expected, + actual)',
+        'checker': 'Checker',
+        'language': 'Language',
+        'flags_placeholder': 'Compiler flags',
+        'compile_error': 'Compile Error',
+        'cancel': 'CANCEL',
+        'cancelling': 'Cancelling...',
+        'cancelled': 'Cancelled',
+        'compiling': 'Preparing...',
+        'select_row': 'Click a row for details'
     }
 }
 
@@ -91,9 +147,30 @@ class Frytesty(ctk.CTk):
         self.target_script = ""
         self.test_cases = [] # List of (input, expected_output)
         self.current_lang = get_system_lang()
+        # Background run: results come back through the queue / 백그라운드 실행: 결과는 큐로 전달
+        self.result_queue = queue.Queue()
+        self.cancel_event = None # Set while a run is active / 실행 중에만 설정
+        self.run_cases = []
+        self.run_done = 0
+        # Report: plain result data, rendered into a fixed pool of row widgets
+        # 보고서: 결과 데이터만 보관하고 고정된 행 위젯 풀에 렌더링
+        self.report_rows = [] # (case_num, result) in completion order / 완료 순서
+        self.report_slots = [] # (frame, labels, last drawn state) / (프레임, 라벨, 마지막으로 그린 상태)
+        self.report_top = 0
+        self.report_selected = None
+        self.verdict_counts = {}
+        # Watch mode: loaded suites are reloaded on change, failed cases run first
+        # 감시 모드: 불러온 스위트는 변경 시 다시 불러오고, 실패한 케이스를 먼저 실행
+        self.suites = [] # (path, cases) / (경로, 케이스)
+        self.failing = set() # Case numbers that failed in the last full run / 마지막 전체 실행에서 실패한 케이스 번호
+        self.run_failed = set()
+        self.watch_queue = queue.Queue()
+        self.watch_stop = None # Set to stop the watcher thread / 설정하면 감시 스레드 종료
+        self.rerun_pending = False
         
         # UI Setup / UI 구축
         self.setup_ui()
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
 
     def setup_ui(self):
         # Sidebar / 사이드바
@@ -142,6 +219,71 @@ class Frytesty(ctk.CTk):
         self.select_btn = ctk.CTkButton(script_row, text=TRANSLATIONS[self.current_lang]['select_script'], width=120, command=self.select_script, fg_color=self.secondary_color, hover_color="#30363d")
         self.select_btn.pack(side="right")
 
+        # Parallel workers (blank = CPU cores) / 병렬 작업 수 (비우면 CPU 코어 수)
+        self.workers_entry = ctk.CTkEntry(script_row, width=60, placeholder_text=str(judge.default_workers()), fg_color=self.secondary_color, border_color="#30363d")
+        self.workers_entry.pack(side="right", padx=(0, 10))
+        self.workers_label = ctk.CTkLabel(script_row, text=TRANSLATIONS[self.current_lang]['workers'], font=("Inter", 11), text_color=self.dim_text)
+        self.workers_label.pack(side="right", padx=(0, 5))
+
+        # Fork pre-started interpreters instead of booting python3 per case (POSIX)
+        # 케이스마다 python3를 부팅하는 대신 미리 시작한 인터프리터를 fork (POSIX)
+        self.warm_var = ctk.BooleanVar(value=judge.warm_supported())
+        self.warm_check = ctk.CTkCheckBox(script_row, text=TRANSLATIONS[self.current_lang]['warm'], variable=self.warm_var, font=("Inter", 11), text_color=self.dim_text, fg_color=self.accent_color, hover_color="#af8cf7")
+        self.warm_check.pack(side="right", padx=(0, 10))
+        if not judge.warm_supported():
+            self.warm_check.configure(state="disabled")
+
+        # No network and a private tmpfs per case (Linux user namespaces)
+        # 케이스마다 네트워크 차단과 전용 tmpfs (리눅스 user 네임스페이스)
+        self.isolate_var = ctk.BooleanVar(value=False)
+        self.isolate_check = ctk.CTkCheckBox(script_row, text=TRANSLATIONS[self.current_lang]['isolate'], variable=self.isolate_var, font=("Inter", 11), text_color=self.dim_text, fg_color=self.accent_color, hover_color="#af8cf7")
+        self.isolate_check.pack(side="right", padx=(0, 10))
+        if not sys.platform.startswith("linux"):
+            self.isolate_check.configure(state="disabled")
+
+        # Limits: CPU seconds (TLE) and address space (MLE) / 제한: CPU 초 (TLE)와 주소 공간 (MLE)
+        limits_row = ctk.CTkFrame(self.config_panel, fg_color="transparent")
+        limits_row.pack(fill="x", padx=20, pady=(0, 20))
+        self.time_limit_label = ctk.CTkLabel(limits_row, text=TRANSLATIONS[self.current_lang]['time_limit'], font=("Inter", 11), text_color=self.dim_text)
+        self.time_limit_label.pack(side="left", padx=(0, 5))
+        self.time_limit_entry = ctk.CTkEntry(limits_row, width=60, placeholder_text=f"{judge.DEFAULT_TIME_LIMIT:g}", fg_color=self.secondary_color, border_color="#30363d")
+        self.time_limit_entry.pack(side="left", padx=(0, 20))
+        self.memory_limit_label = ctk.CTkLabel(limits_row, text=TRANSLATIONS[self.current_lang]['memory_limit'], font=("Inter", 11), text_color=self.dim_text)
+        self.memory_limit_label.pack(side="left", padx=(0, 5))
+        self.memory_limit_entry = ctk.CTkEntry(limits_row, width=70, placeholder_text="-", fg_color=self.secondary_color, border_color="#30363d")
+        self.memory_limit_entry.pack(side="left")
+
+        # Output checker: a built-in name, float:EPS, or a checker script path
+        # 출력 체커: 기본 제공 이름, float:EPS, 또는 체커 스크립트 경로
+        self.checker_label = ctk.CTkLabel(limits_row, text=TRANSLATIONS[self.current_lang]['checker'], font=("Inter", 11), text_color=self.dim_text)
+        self.checker_label.pack(side="left", padx=(20, 5))
+        self.checker_box = ctk.CTkComboBox(limits_row, width=200, values=list(checkers.BUILTIN), fg_color=self.secondary_color, border_color="#30363d", button_color="#30363d")
+        self.checker_box.set("lines")
+        self.checker_box.pack(side="left", padx=(0, 5))
+        self.checker_btn = ctk.CTkButton(limits_row, text="...", width=30, command=self.select_checker, fg_color=self.secondary_color, hover_color="#30363d")
+        self.checker_btn.pack(side="left")
+
+        # Language profile ("auto" = by file extension) and extra compiler flags
+        # 언어 프로필 ("auto" = 파일 확장자 기준)과 추가 컴파일 옵션
+        lang_row = ctk.CTkFrame(self.config_panel, fg_color="transparent")
+        lang_row.pack(fill="x", padx=20, pady=(0, 20))
+        self.language_label = ctk.CTkLabel(lang_row, text=TRANSLATIONS[self.current_lang]['language'], font=("Inter", 11), text_color=self.dim_text)
+        self.language_label.pack(side="left", padx=(0, 5))
+        self.language_menu = ctk.CTkOptionMenu(lang_row, width=100, values=["auto"] + list(languages.PROFILES), fg_color=self.secondary_color, button_color="#30363d", button_hover_color="#30363d")
+        self.language_menu.set("auto")
+        self.language_menu.pack(side="left", padx=(0, 10))
+        # Replay cached results of cases nothing changed for / 바뀐 것이 없는 케이스는 캐시된 결과를 재생
+        self.changed_var = ctk.BooleanVar(value=False)
+        self.changed_check = ctk.CTkCheckBox(lang_row, text=TRANSLATIONS[self.current_lang]['changed_only'], variable=self.changed_var, font=("Inter", 11), text_color=self.dim_text, fg_color=self.accent_color, hover_color="#af8cf7")
+        self.changed_check.pack(side="right", padx=(10, 0))
+        # Re-run whenever the script, a loaded suite or the checker is saved
+        # 스크립트, 불러온 스위트, 체커가 저장될 때마다 다시 실행
+        self.watch_var = ctk.BooleanVar(value=False)
+        self.watch_check = ctk.CTkCheckBox(lang_row, text=TRANSLATIONS[self.current_lang]['watch'], variable=self.watch_var, command=self.toggle_watch, font=("Inter", 11), text_color=self.dim_text, fg_color=self.accent_color, hover_color="#af8cf7")
+        self.watch_check.pack(side="right", padx=(10, 0))
+        self.flags_entry = ctk.CTkEntry(lang_row, placeholder_text=TRANSLATIONS[self.current_lang]['flags_placeholder'], fg_color=self.secondary_color, border_color="#30363d")
+        self.flags_entry.pack(side="left", fill="x", expand=True)
+
         # Test Case Input Section / 테스트 케이스 입력 섹션
         self.input_section = ctk.CTkFrame(self.content, fg_color="transparent")
         self.input_section.pack(fill="x", pady=10)
@@ -167,18 +309,52 @@ class Frytesty(ctk.CTk):
         actions_frame.pack(side="right", fill="y")
         self.add_btn = ctk.CTkButton(actions_frame, text=TRANSLATIONS[self.current_lang]['add_case'], command=self.add_test_case, fg_color=self.secondary_color, hover_color="#30363d", height=45)
         self.add_btn.pack(pady=(25, 10), fill="x", padx=10)
+        self.suite_btn = ctk.CTkButton(actions_frame, text=TRANSLATIONS[self.current_lang]['load_suite'], command=self.load_suite, fg_color=self.secondary_color, hover_color="#30363d", height=35)
+        self.suite_btn.pack(pady=(0, 10), fill="x", padx=10)
         self.run_btn = ctk.CTkButton(actions_frame, text=TRANSLATIONS[self.current_lang]['run_all'], command=self.run_all_tests, fg_color=self.accent_color, hover_color="#af8cf7", text_color="#161b22", font=("Inter", 13, "bold"), height=80)
         self.run_btn.pack(pady=5, fill="x", padx=10)
+        self.cancel_btn = ctk.CTkButton(actions_frame, text=TRANSLATIONS[self.current_lang]['cancel'], command=self.cancel_run, fg_color=self.secondary_color, hover_color="#da3633", height=30, state="disabled")
+        self.cancel_btn.pack(pady=5, fill="x", padx=10)
+
+        # Progress: completed / total / 진행률: 완료 / 전체
+        progress_row = ctk.CTkFrame(self.content, fg_color="transparent")
+        progress_row.pack(fill="x", pady=(5, 0))
+        self.progress_bar = ctk.CTkProgressBar(progress_row, progress_color=self.accent_color, fg_color=self.secondary_color)
+        self.progress_bar.set(0)
+        self.progress_bar.pack(side="left", fill="x", expand=True, padx=(0, 10))
+        self.progress_label = ctk.CTkLabel(progress_row, text="", width=140, font=("JetBrains Mono", 11), text_color=self.dim_text, anchor="e")
+        self.progress_label.pack(side="right")
 
         # Results Display / 결과 표시 영역
-        self.results_card = ctk.CTkScrollableFrame(self.content, fg_color=self.card_color, corner_radius=15, border_width=1, border_color="#30363d")
+        # Virtualized table: only the visible rows have widgets, the scrollbar
+        # moves data through them; details are built for the selected row only
+        # 가상화된 표: 보이는 행만 위젯을 가지며 스크롤바는 데이터를 그 행들로 이동,
+        # 상세 정보는 선택한 행만 생성
+        self.results_card = ctk.CTkFrame(self.content, fg_color=self.card_color, corner_radius=15, border_width=1, border_color="#30363d")
         self.results_card.pack(fill="both", expand=True, pady=10)
-        
-        self.report_label = ctk.CTkLabel(self.results_card, text=TRANSLATIONS[self.current_lang]['report'], font=("Inter", 12, "bold"), text_color=self.dim_text)
-        self.report_label.pack(anchor="w", padx=10, pady=10)
-        
-        self.result_container = ctk.CTkFrame(self.results_card, fg_color="transparent")
-        self.result_container.pack(fill="both", expand=True)
+
+        report_header = ctk.CTkFrame(self.results_card, fg_color="transparent")
+        report_header.pack(fill="x", padx=10, pady=(10, 0))
+        self.report_label = ctk.CTkLabel(report_header, text=TRANSLATIONS[self.current_lang]['report'], font=("Inter", 12, "bold"), text_color=self.dim_text)
+        self.report_label.pack(side="left")
+        self.summary_label = ctk.CTkLabel(report_header, text="", font=("JetBrains Mono", 11), text_color=self.dim_text)
+        self.summary_label.pack(side="right")
+
+        report_body = ctk.CTkFrame(self.results_card, fg_color="transparent")
+        report_body.pack(fill="both", expand=True, padx=10, pady=5)
+        self.report_scroll = ctk.CTkScrollbar(report_body, command=self.scroll_report)
+        self.report_scroll.pack(side="right", fill="y")
+        self.report_table = ctk.CTkFrame(report_body, fg_color="transparent")
+        self.report_table.pack(side="left", fill="both", expand=True)
+        self.report_table.bind("<Configure>", lambda event: self.render_report())
+        self.bind_wheel(self.report_table)
+
+        self.detail_text = ctk.CTkTextbox(self.results_card, height=150, fg_color=self.bg_color, font=("JetBrains Mono", 11), wrap="none")
+        self.detail_text.pack(fill="x", padx=10, pady=(0, 10))
+        self.detail_text.tag_config("-", foreground=self.fail_color)
+        self.detail_text.tag_config("+", foreground=self.pass_color)
+        self.detail_text.tag_config(" ", foreground=self.dim_text)
+        self.set_detail(TRANSLATIONS[self.current_lang]['select_row'])
 
     def toggle_lang(self):
         self.current_lang = 'en' if self.current_lang == 'ko' else 'ko'
@@ -193,16 +369,41 @@ class Frytesty(ctk.CTk):
         self.input_label.configure(text=lang['input_label'])
         self.expected_label.configure(text=lang['expected_label'])
         self.add_btn.configure(text=lang['add_case'])
+        self.suite_btn.configure(text=lang['load_suite'])
         self.run_btn.configure(text=lang['run_all'])
+        self.cancel_btn.configure(text=lang['cancel'])
+        if self.report_selected is None:
+            self.set_detail(lang['select_row'])
+        else:
+            self.show_details(*self.report_rows[self.report_selected])
         self.report_label.configure(text=lang['report'])
+        self.workers_label.configure(text=lang['workers'])
+        self.warm_check.configure(text=lang['warm'])
+        self.isolate_check.configure(text=lang['isolate'])
+        self.changed_check.configure(text=lang['changed_only'])
+        self.watch_check.configure(text=lang['watch'])
+        self.time_limit_label.configure(text=lang['time_limit'])
+        self.memory_limit_label.configure(text=lang['memory_limit'])
+        self.checker_label.configure(text=lang['checker'])
+        self.language_label.configure(text=lang['language'])
+        self.flags_entry.configure(placeholder_text=lang['flags_placeholder'])
         self.lang_btn.configure(text=self.current_lang.upper())
 
     def select_script(self):
-        file = filedialog.askopenfilename(filetypes=[("Python files", "*.py"), ("All files", "*.*")])
+        sources = " ".join(f"*{ext}" for profile in languages.PROFILES.values() for ext in profile.extensions)
+        file = filedialog.askopenfilename(filetypes=[("Source files", sources), ("Python files", "*.py"), ("All files", "*.*")])
         if file:
             self.target_script = file
             self.script_entry.delete(0, "end")
             self.script_entry.insert(0, file)
+            self.failing = set()
+            self.restart_watch()
+
+    def select_checker(self):
+        file = filedialog.askopenfilename(filetypes=[("Python files", "*.py"), ("All files", "*.*")])
+        if file:
+            self.checker_box.set(file)
+            self.restart_watch()
 
     def add_test_case(self):
         in_data = self.input_text.get("1.0", "end-1c").strip()
@@ -217,12 +418,33 @@ class Frytesty(ctk.CTk):
         self.expected_text.delete("1.0", "end")
         self.log_case_added(len(self.test_cases), in_data)
 
+    def load_suite(self):
+        # A .zip, a multi-case file, or any N.in/N.out file to load its whole folder
+        # .zip, 다중 케이스 파일, 또는 폴더 전체를 불러올 N.in/N.out 파일 하나
+        path = filedialog.askopenfilename(filetypes=[("Test suites", "*.zip *.txt *.in *.out *.ans"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            cases = suite.load_suite(path)
+        except (OSError, ValueError) as e:
+            messagebox.showwarning(TRANSLATIONS[self.current_lang]['warning'], str(e))
+            return
+        if not cases:
+            messagebox.showwarning(TRANSLATIONS[self.current_lang]['warning'], TRANSLATIONS[self.current_lang]['suite_empty'])
+            return
+        self.test_cases.extend(cases)
+        self.suites.append((path, cases))
+        self.restart_watch()
+        msg = TRANSLATIONS[self.current_lang]['suite_loaded'].format(count=len(cases))
+        self.summary_label.configure(text=f"{msg}: {os.path.basename(path)}")
+
     def log_case_added(self, num, in_data):
         msg = TRANSLATIONS[self.current_lang]['case_added'].format(num=num)
-        label = ctk.CTkLabel(self.result_container, text=f"{msg}: {in_data[:20]}...", font=("Inter", 11), text_color=self.dim_text)
-        label.pack(anchor="w", padx=20, pady=2)
+        self.summary_label.configure(text=f"{msg}: {in_data[:20]}...")
 
     def run_all_tests(self):
+        if self.cancel_event:
+            return # Already running / 이미 실행 중
         if not self.target_script:
             messagebox.showwarning(TRANSLATIONS[self.current_lang]['warning'], TRANSLATIONS[self.current_lang]['select_first'])
             return
@@ -230,64 +452,348 @@ class Frytesty(ctk.CTk):
             messagebox.showwarning(TRANSLATIONS[self.current_lang]['warning'], TRANSLATIONS[self.current_lang]['add_first'])
             return
             
-        # Clear previous results
-        for child in self.result_container.winfo_children():
-            child.destroy()
-            
-        results = []
-        for i, (in_data, expected) in enumerate(self.test_cases):
-            res = self.run_test(in_data, expected, i+1)
-            results.append(res)
+        try:
+            checker = checkers.resolve(self.checker_box.get().strip())
+        except ValueError as e:
+            messagebox.showwarning(TRANSLATIONS[self.current_lang]['warning'], str(e))
+            return
+
+        # Clear previous results: data only, the row widgets are reused
+        # 이전 결과 초기화: 데이터만 지우고 행 위젯은 재사용
+        self.report_rows = []
+        self.report_top = 0
+        self.report_selected = None
+        self.verdict_counts = {}
+        self.summary_label.configure(text="")
+        self.set_detail(TRANSLATIONS[self.current_lang]['select_row'])
+        self.render_report()
 
-    def run_test(self, in_data, expected, case_num):
-        start_time = time.time()
+        # Snapshot of the run: cases added meanwhile wait for the next one
+        # 실행 시점의 스냅샷: 실행 중 추가된 케이스는 다음 실행에 포함
+        self.run_cases = list(self.test_cases)
+        self.run_failed = set()
+        self.run_done = 0
+        self.cancel_event = threading.Event()
+        self.run_btn.configure(state="disabled")
+        self.cancel_btn.configure(state="normal")
+        self.progress_bar.set(0)
+        self.progress_label.configure(text=TRANSLATIONS[self.current_lang]['compiling'])
+        language = self.language_menu.get()
+        settings = {
+            "language": None if language == "auto" else language,
+            "flags": self.flags_entry.get(),
+            "checker": checker,
+            "workers": self.get_workers(),
+            "limits": self.get_limits(),
+            "warm": self.warm_var.get(),
+            "isolate": self.isolate_var.get(),
+            "changed_only": self.changed_var.get(),
+            # Last run's failures first / 지난 실행의 실패 케이스 먼저
+            "order": sorted(range(len(self.run_cases)), key=lambda i: i + 1 not in self.failing),
+        }
+        threading.Thread(target=self.run_worker, args=(self.target_script, self.run_cases, settings, self.cancel_event), daemon=True).start()
+        self.after(RESULT_DRAIN_MS, self.drain_results)
+
+    def run_worker(self, script, cases, settings, cancel):
+        # Background thread: compiles, runs the suite and posts every result;
+        # Tk widgets are only touched by drain_results() on the main thread
+        # 백그라운드 스레드: 컴파일과 스위트 실행 후 결과를 게시,
+        # Tk 위젯은 메인 스레드의 drain_results()만 다룸
+        cache = results.open_cache(reuse=settings["changed_only"])
         try:
-            # Use subprocess to run the target script / 자식 프로세스로 대상 스크립트 실행
-            process = subprocess.Popen(
-                ["python3", self.target_script],
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            stdout, stderr = process.communicate(input=in_data, timeout=5)
-            elapsed = (time.time() - start_time) * 1000 # ms
-            
-            actual = stdout.strip()
-            passed = actual == expected.strip()
-            
-            self.display_result(case_num, in_data, expected, actual, passed, elapsed, stderr)
-            return passed
-        except subprocess.TimeoutExpired:
-            self.display_result(case_num, in_data, expected, TRANSLATIONS[self.current_lang]['timeout'], False, 5000, "Operation timed out after 5 seconds")
-            return False
-        except Exception as e:
-            self.display_result(case_num, in_data, expected, TRANSLATIONS[self.current_lang]['error'], False, 0, str(e))
-            return False
-
-    def display_result(self, case_num, in_data, expected, actual, passed, elapsed, error):
-        card = ctk.CTkFrame(self.result_container, fg_color=self.secondary_color, corner_radius=10, border_width=1, border_color="#30363d")
-        card.pack(fill="x", padx=10, pady=5)
-        
-        status_text = "PASS" if passed else "FAIL"
-        status_color = self.pass_color if passed else self.fail_color
-        
-        header = ctk.CTkFrame(card, fg_color="transparent")
-        header.pack(fill="x", padx=15, pady=10)
-        
-        ctk.CTkLabel(header, text=f"Case #{case_num}", font=("Inter", 12, "bold")).pack(side="left")
-        ctk.CTkLabel(header, text=status_text, font=("Inter", 12, "bold"), text_color=status_color).pack(side="left", padx=10)
-        ctk.CTkLabel(header, text=f"{elapsed:.2f}ms", font=("JetBrains Mono", 11), text_color=self.dim_text).pack(side="right")
-        
-        if not passed:
-            diff_frame = ctk.CTkFrame(card, fg_color=self.bg_color, corner_radius=5)
-            diff_frame.pack(fill="x", padx=15, pady=(0, 15))
-            
-            ctk.CTkLabel(diff_frame, text=f"{TRANSLATIONS[self.current_lang]['expected']}: {expected}", font=("JetBrains Mono", 11), text_color=self.dim_text, anchor="w").pack(fill="x", padx=10, pady=2)
-            ctk.CTkLabel(diff_frame, text=f"{TRANSLATIONS[self.current_lang]['actual']}:   {actual}", font=("JetBrains Mono", 11), text_color=self.fail_color, anchor="w").pack(fill="x", padx=10, pady=2)
-            
-            if error:
-                ctk.CTkLabel(diff_frame, text=f"{TRANSLATIONS[self.current_lang]['error']}: {error}", font=("JetBrains Mono", 10), text_color="#f85149", wraplenght=600).pack(fill="x", padx=10, pady=2)
+            # Compiles once (or hits the build cache) before any case runs
+            # 케이스 실행 전에 한 번 컴파일 (또는 빌드 캐시 사용)
+            program = languages.prepare(script, settings["language"], settings["flags"])
+            time_limit, memory_limit = settings["limits"]
+            for case_num, res in judge.run_suite(
+                program, cases, settings["workers"], time_limit, memory_limit,
+                warm=settings["warm"], checker=settings["checker"], cancel=cancel, isolate=settings["isolate"], cache=cache, order=settings["order"]
+            ):
+                self.result_queue.put(("result", case_num, res))
+        except languages.CompileError as e:
+            self.result_queue.put(("compile_error", None, str(e)))
+        except (ValueError, OSError) as e:
+            self.result_queue.put(("error", None, str(e)))
+        finally:
+            if cache:
+                cache.close()
+            self.result_queue.put(("done", None, None))
+
+    def drain_results(self):
+        finished = taken = False
+        try:
+            for _ in range(RESULT_DRAIN_BATCH):
+                kind, case_num, res = self.result_queue.get_nowait()
+                taken = True
+                if kind == "result":
+                    self.show_result(case_num, res)
+                elif kind == "compile_error":
+                    messagebox.showerror(TRANSLATIONS[self.current_lang]['compile_error'], res)
+                elif kind == "error":
+                    messagebox.showwarning(TRANSLATIONS[self.current_lang]['warning'], res)
+                else:
+                    finished = True
+                    break
+        except queue.Empty:
+            pass
+        if taken:
+            self.render_report()
+        if finished:
+            self.finish_run()
+        else:
+            # Come back sooner while results are waiting / 대기 중인 결과가 있으면 더 빨리 재호출
+            self.after(1 if not self.result_queue.empty() else RESULT_DRAIN_MS, self.drain_results)
+
+    def show_result(self, case_num, res):
+        # Rows appear in completion order, numbered by case position; drawing
+        # happens once per drain in render_report()
+        # 행은 완료 순서대로, 번호는 케이스 위치 기준. 그리기는 drain마다 render_report()에서 한 번
+        self.run_done += 1
+        self.progress_bar.set(self.run_done / len(self.run_cases))
+        self.progress_label.configure(text=f"{self.run_done}/{len(self.run_cases)}")
+        self.report_rows.append((case_num, res))
+        if not res["passed"]:
+            self.run_failed.add(case_num)
+        self.verdict_counts[res["verdict"]] = self.verdict_counts.get(res["verdict"], 0) + 1
+        self.summary_label.configure(text="  ".join(
+            f"{verdict} {self.verdict_counts[verdict]}" for verdict in judge.VERDICTS if verdict in self.verdict_counts
+        ))
+
+    def cancel_run(self):
+        # Running children are killed by the judge within CANCEL_POLL
+        # 실행 중인 자식은 CANCEL_POLL 이내에 채점기가 종료
+        if self.cancel_event:
+            self.cancel_event.set()
+            self.cancel_btn.configure(state="disabled")
+            self.progress_label.configure(text=TRANSLATIONS[self.current_lang]['cancelling'])
+
+    def on_close(self):
+        # Give the judge a moment to kill running children before exiting
+        # 종료 전에 채점기가 실행 중인 자식을 정리할 시간을 줌
+        if self.watch_stop:
+            self.watch_stop.set()
+        if self.cancel_event:
+            self.cancel_event.set()
+            self.after(int(judge.CANCEL_POLL * 3000), self.destroy)
+        else:
+            self.destroy()
+
+    def finish_run(self):
+        cancelled = self.cancel_event.is_set()
+        self.cancel_event = None
+        self.run_btn.configure(state="normal")
+        self.cancel_btn.configure(state="disabled")
+        text = f"{self.run_done}/{len(self.run_cases)}"
+        self.progress_label.configure(text=f"{TRANSLATIONS[self.current_lang]['cancelled']} {text}" if cancelled else text)
+        if not cancelled:
+            self.failing = self.run_failed
+        if self.rerun_pending:
+            # A save arrived mid-run: that run was cancelled, start the new one
+            # 실행 중에 저장됨: 그 실행은 취소했으므로 새 실행 시작
+            self.rerun_pending = False
+            self.run_all_tests()
+
+    def watch_paths(self):
+        paths = [self.target_script] + [suite.suite_source(path) for path, _ in self.suites]
+        checker = self.checker_box.get().strip()
+        if os.path.isfile(checker):
+            paths.append(checker)
+        return [path for path in paths if path and os.path.exists(path)]
+
+    def toggle_watch(self):
+        if self.watch_stop:
+            self.watch_stop.set()
+            self.watch_stop = None
+        if not self.watch_var.get():
+            return
+        if not self.target_script:
+            self.watch_var.set(False)
+            messagebox.showwarning(TRANSLATIONS[self.current_lang]['warning'], TRANSLATIONS[self.current_lang]['select_first'])
+            return
+        # The watcher thread only posts batches; poll_watch() acts on them
+        # 감시 스레드는 변경 묶음만 게시, 처리는 poll_watch()가 담당
+        self.watch_stop = threading.Event()
+        threading.Thread(target=self.watch_worker, args=(self.watch_paths(), self.watch_stop), daemon=True).start()
+        self.after(WATCH_POLL_MS, self.poll_watch, self.watch_stop)
+
+    def restart_watch(self):
+        if self.watch_stop:
+            self.toggle_watch()
+
+    def watch_worker(self, paths, stop):
+        for batch in watch.changes(paths, stop, suite.INPUT_EXTS + suite.OUTPUT_EXTS):
+            self.watch_queue.put((stop, batch))
+
+    def poll_watch(self, stop):
+        if stop.is_set():
+            return # Watcher replaced or turned off / 감시가 교체되었거나 꺼짐
+        changed = set()
+        while not self.watch_queue.empty():
+            source, batch = self.watch_queue.get_nowait()
+            if source is stop:
+                changed |= batch
+        if changed:
+            self.reload_suites(changed)
+            if self.cancel_event:
+                self.rerun_pending = True
+                self.cancel_run()
+            else:
+                self.run_all_tests()
+        self.after(WATCH_POLL_MS, self.poll_watch, stop)
+
+    def reload_suites(self, changed):
+        # Suites whose files changed are loaded again in place, so added or
+        # removed case files take effect (edited ones are read lazily anyway)
+        # 파일이 바뀐 스위트는 제자리에서 다시 불러와 추가/삭제된 케이스 파일을 반영
+        # (수정된 파일은 어차피 실행 시 읽힘)
+        for index, (path, old) in enumerate(self.suites):
+            source = os.path.abspath(suite.suite_source(path))
+            if not any(name == source or name.startswith(source + os.sep) for name in changed):
+                continue
+            try:
+                cases = suite.load_suite(path)
+            except (OSError, ValueError):
+                continue
+            old_ids = {id(case) for case in old}
+            start = next((i for i, case in enumerate(self.test_cases) if id(case) in old_ids), len(self.test_cases))
+            kept = [case for case in self.test_cases if id(case) not in old_ids]
+            self.test_cases = kept[:start] + cases + kept[start:]
+            self.suites[index] = (path, cases)
+
+    def get_limits(self):
+        # Blank or invalid fields fall back to the defaults / 비었거나 잘못된 값은 기본값 사용
+        try:
+            time_limit = float(self.time_limit_entry.get())
+        except ValueError:
+            time_limit = judge.DEFAULT_TIME_LIMIT
+        try:
+            memory_limit = int(self.memory_limit_entry.get()) * 1024 * 1024
+        except ValueError:
+            memory_limit = None
+        return time_limit, memory_limit
+
+    def get_workers(self):
+        try:
+            return max(1, int(self.workers_entry.get()))
+        except ValueError:
+            return judge.default_workers()
+
+    def bind_wheel(self, widget):
+        widget.bind("<MouseWheel>", self.wheel_report) # Windows / macOS
+        widget.bind("<Button-4>", self.wheel_report) # X11
+        widget.bind("<Button-5>", self.wheel_report)
+
+    def visible_rows(self):
+        return max(1, self.report_table.winfo_height() // REPORT_ROW_HEIGHT)
+
+    def add_report_slot(self):
+        slot = len(self.report_slots)
+        frame = ctk.CTkFrame(self.report_table, height=REPORT_ROW_HEIGHT - 2, fg_color="transparent", corner_radius=5)
+        frame.pack_propagate(False)
+        labels = []
+        for width, font in ((70, ("Inter", 12, "bold")), (60, ("Inter", 12, "bold")), (260, ("JetBrains Mono", 11)), (0, ("JetBrains Mono", 11))):
+            label = ctk.CTkLabel(frame, text="", width=width, font=font, anchor="w", text_color=self.text_color)
+            label.pack(side="left", padx=(10, 0), fill="none" if width else "x", expand=not width)
+            labels.append(label)
+        for widget in (frame, *labels):
+            widget.bind("<Button-1>", lambda event, slot=slot: self.select_report_row(self.report_top + slot))
+            self.bind_wheel(widget)
+        self.report_slots.append((frame, labels, [None] * (len(labels) + 1)))
+
+    def render_report(self):
+        visible = self.visible_rows()
+        while len(self.report_slots) < visible:
+            self.add_report_slot()
+        total = len(self.report_rows)
+        self.report_top = max(0, min(self.report_top, total - visible))
+        for slot, (frame, labels, shown) in enumerate(self.report_slots):
+            if slot >= visible:
+                frame.pack_forget()
+                continue
+            if not frame.winfo_manager():
+                frame.pack(fill="x", pady=1)
+            index = self.report_top + slot
+            if index < total:
+                case_num, res = self.report_rows[index]
+                texts = (f"#{case_num}", res["verdict"], judge.format_usage(res), checkers.describe(res["mismatch"]) if res["mismatch"] else (res["error"] or "").split("\n")[-1])
+                color = self.pass_color if res["passed"] else self.fail_color
+            else:
+                texts, color = ("", "", "", ""), self.text_color
+            # Only touch widgets whose state changed / 상태가 바뀐 위젯만 갱신
+            for i, (label, text) in enumerate(zip(labels, texts)):
+                if shown[i] != text:
+                    label.configure(text=text[:200])
+                    shown[i] = text
+            style = (color, index == self.report_selected)
+            if shown[-1] != style:
+                labels[1].configure(text_color=color)
+                frame.configure(fg_color=self.secondary_color if style[1] else "transparent")
+                shown[-1] = style
+        if total > visible:
+            self.report_scroll.set(self.report_top / total, (self.report_top + visible) / total)
+        else:
+            self.report_scroll.set(0, 1)
+
+    def scroll_report(self, action, amount, unit=None):
+        # Tk scrollbar protocol: ("moveto", fraction) or ("scroll", n, "units" | "pages")
+        # Tk 스크롤바 규약: ("moveto", 비율) 또는 ("scroll", n, "units" | "pages")
+        if action == "moveto":
+            self.report_top = int(float(amount) * len(self.report_rows))
+        else:
+            self.report_top += int(amount) * (self.visible_rows() if unit == "pages" else 1)
+        self.render_report()
+
+    def wheel_report(self, event):
+        up = event.num == 4 or getattr(event, "delta", 0) > 0
+        self.report_top += -REPORT_WHEEL_ROWS if up else REPORT_WHEEL_ROWS
+        self.render_report()
+
+    def select_report_row(self, index):
+        if index >= len(self.report_rows):
+            return
+        self.report_selected = index
+        self.render_report()
+        self.show_details(*self.report_rows[index])
+
+    def set_detail(self, text, diff=()):
+        # diff: checkers.diff_window() rows, colored by their tag / 태그별로 색을 입힌 diff_window() 행
+        self.detail_text.configure(state="normal")
+        self.detail_text.delete("1.0", "end")
+        self.detail_text.insert("1.0", text)
+        for (tag, line, content), formatted in zip(diff, checkers.format_window(diff)):
+            self.detail_text.insert("end", "\n" + formatted, tag)
+        self.detail_text.configure(state="disabled")
+
+    def clip_output(self, text):
+        # Bounded excerpt: Tk slows down badly on huge or very long lines
+        # 제한된 발췌: Tk는 거대한 텍스트나 아주 긴 줄에서 크게 느려짐
+        lines = text.split("\n", DETAIL_LINES)
+        clipped = [line if len(line) <= checkers.LINE_CHARS else line[:checkers.LINE_CHARS] + "..." for line in lines[:DETAIL_LINES]]
+        if len(lines) > DETAIL_LINES:
+            clipped.append("...")
+        return "\n".join(clipped)
+
+    def show_details(self, case_num, res):
+        # Built only for the selected row / 선택한 행에 대해서만 생성
+        lang = TRANSLATIONS[self.current_lang]
+        actual = res["actual"]
+        if res["verdict"] == "TLE":
+            actual = actual or lang['timeout']
+        elif res["verdict"] == "ERROR":
+            actual = lang['error']
+        lines = [f"Case #{case_num}  {res['verdict']}  {judge.format_usage(res)}"]
+        if res["mismatch"]:
+            lines.append(f"{lang['first_diff']}: {checkers.describe(res['mismatch'])}")
+        # The window around the first difference replaces the full outputs
+        # 첫 차이 주변의 비교 창이 전체 출력을 대신함
+        diff = checkers.diff_window(res["mismatch"])
+        if res["error"]:
+            lines += ["", f"{lang['error']}:", self.clip_output(res["error"])]
+        if diff:
+            lines += ["", f"{lang['diff']}:"]
+        elif not res["passed"]:
+            lines += ["", f"{lang['expected']}:", self.clip_output(res["expected"]), "", f"{lang['actual']}:", self.clip_output(actual)]
+        self.set_detail("\n".join(lines), diff)
 
 if __name__ == "__main__":
     app = Frytesty()
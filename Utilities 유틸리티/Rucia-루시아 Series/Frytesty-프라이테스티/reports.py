@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Frytesty Reports - JUnit XML and JSON Lines reports for CI and dashboards
+# Frytesty 보고서 - CI와 대시보드를 위한 JUnit XML, JSON Lines 보고서
+# Rheehose (Rhee Creative) 2008-2026
+# Licensed under Apache-2.0
+
+# Both reports are written as cases finish, not at the end, so a long suite
+# that crashes or is killed still leaves the results it got. The JSON Lines
+# file is only ever appended to; the JUnit file is kept well-formed after
+# every case by rewriting just its closing tags, and gets its totals when
+# the run completes.
+# 두 보고서 모두 마지막이 아니라 케이스가 끝날 때마다 기록하므로, 긴 스위트가 중간에
+# 죽어도 그때까지의 결과가 남음. JSON Lines 파일은 덧붙이기만 하고, JUnit 파일은
+# 닫는 태그만 다시 써서 매 케이스 후에도 올바른 XML을 유지하며 실행이 끝나면 합계를 기록.
+
+import os
+import re
+import json
+import time
+import shutil
+import socket
+import tempfile
+from xml.sax.saxutils import escape, quoteattr
+
+import checkers
+
+DIFF_EXCERPT = 2048 # Characters of expected/actual output per case / 케이스당 기대/실제 출력 글자 수
+# Characters XML 1.0 cannot carry at all, even escaped / XML 1.0에서 이스케이프해도 쓸 수 없는 문자
+XML_INVALID = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]")
+JUNIT_TAIL = "</testsuite>\n</testsuites>\n"
+
+def _clip(text):
+    text = text or ""
+    return text if len(text) <= DIFF_EXCERPT else text[:DIFF_EXCERPT] + "..."
+
+def case_record(num, name, res):
+    # Flat, JSON-ready summary of one result: times in ms, RSS in bytes, and
+    # for failures the first difference plus bounded output excerpts
+    # 결과 하나의 평평한 JSON용 요약: 시간은 ms, RSS는 바이트, 실패라면 첫 차이와 제한된 출력 발췌
+    record = {
+        "case": num,
+        "name": name,
+        "verdict": res["verdict"],
+        "passed": res["passed"],
+        "wall_ms": round(res["elapsed"], 3),
+        "cpu_ms": None if res.get("cpu") is None else round(res["cpu"], 3),
+        "rss_bytes": res.get("rss"),
+        # No exit status when the judge stopped the run itself at the first
+        # mismatch: its SIGKILL would read as a crash on a dashboard
+        # 채점기가 첫 불일치에서 직접 종료했다면 종료 코드 없음: 그 SIGKILL이 대시보드에서 충돌로 보이지 않도록
+        "exit_code": None if res.get("stopped") else res.get("exit_code"),
+        "stopped": bool(res.get("stopped")),
+        "cached": bool(res.get("cached")),
+    }
+    if not res["passed"]:
+        record["diff"] = checkers.describe(res["mismatch"]) if res.get("mismatch") else None
+        record["window"] = checkers.format_window(checkers.diff_window(res.get("mismatch")))
+        record["expected"] = _clip(res.get("expected"))
+        record["actual"] = _clip(res.get("actual"))
+        record["error"] = _clip(res.get("error")) or None
+    return record
+
+class JsonLinesReport:
+    # {"event": "start", ...}, one {"event": "case", ...} per case in finishing
+    # order, then {"event": "end", ...} unless the run was cut short
+    # {"event": "start", ...}, 끝난 순서대로 케이스마다 {"event": "case", ...},
+    # 실행이 중단되지 않았다면 마지막에 {"event": "end", ...}
+    def __init__(self, path, meta):
+        self.f = open(path, "w", encoding="utf-8")
+        self._write(dict(event="start", **meta))
+
+    def _write(self, record):
+        # One flushed line per record: a crash loses at most the line being written
+        # 기록마다 한 줄씩 flush: 죽어도 쓰던 줄 하나만 잃음
+        self.f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.f.flush()
+
+    def case(self, record):
+        self._write(dict(event="case", **record))
+
+    def close(self, summary=None):
+        try:
+            if summary is not None:
+                self._write(dict(event="end", **summary))
+        finally:
+            self.f.close()
+
+class JUnitReport:
+    def __init__(self, path, meta):
+        self.path = path
+        self.meta = meta
+        self.f = open(path, "w", encoding="utf-8")
+        self.f.write('<?xml version="1.0" encoding="UTF-8"?>\n<testsuites>\n')
+        self.f.write(self._suite_tag())
+        self.body = self.f.tell()
+        self.end = self.body # Where the closing tags start / 닫는 태그가 시작하는 위치
+        self.f.write(JUNIT_TAIL)
+        self.f.flush()
+
+    def _suite_tag(self, summary=None):
+        attrs = {
+            "name": self.meta["script"],
+            "timestamp": self.meta["started"],
+            "hostname": socket.gethostname(),
+        }
+        if summary is not None:
+            attrs.update(
+                tests=summary["total"],
+                failures=summary["failed"] - summary["errors"],
+                errors=summary["errors"],
+                skipped=0,
+                time=f"{summary['elapsed_ms'] / 1000:.3f}",
+            )
+        return "<testsuite " + " ".join(f"{key}={quoteattr(str(value))}" for key, value in attrs.items()) + ">\n"
+
+    def case(self, record):
+        name = f"#{record['case']}" + (f" [{record['name']}]" if record["name"] else "")
+        lines = [f"  <testcase classname={quoteattr(self._clean(self.meta['script']))} name={quoteattr(self._clean(name))} time=\"{record['wall_ms'] / 1000:.4f}\">"]
+        # Metrics most JUnit consumers show as-is / 대부분의 JUnit 도구가 그대로 보여주는 지표
+        lines.append("    <properties>")
+        for key in ("verdict", "cpu_ms", "rss_bytes", "exit_code", "stopped", "cached"):
+            if record[key] is not None:
+                lines.append(f"      <property name=\"{key}\" value={quoteattr(str(record[key]))}/>")
+        lines.append("    </properties>")
+        if not record["passed"]:
+            # ERROR is the judge failing (checker, runtime), not the solution
+            # ERROR는 풀이가 아니라 채점 쪽(체커, 런타임)의 실패
+            tag = "error" if record["verdict"] == "ERROR" else "failure"
+            message = record["diff"] or record["error"] or record["verdict"]
+            details = []
+            if record["diff"]:
+                details.append(f"First difference: {record['diff']}")
+            if record["window"]:
+                details.append("Diff (- expected, + actual):\n" + "\n".join(record["window"]))
+            details.append(f"Expected:\n{record['expected']}")
+            details.append(f"Actual:\n{record['actual']}")
+            if record["error"]:
+                details.append(f"Error:\n{record['error']}")
+            lines.append(f"    <{tag} type={quoteattr(record['verdict'])} message={quoteattr(self._clean(message.splitlines()[0] if message else ''))}>{escape(self._clean(chr(10).join(details)))}</{tag}>")
+        lines.append("  </testcase>\n")
+        self.f.seek(self.end)
+        self.f.write("\n".join(lines))
+        self.end = self.f.tell()
+        self.f.write(JUNIT_TAIL)
+        self.f.truncate()
+        self.f.flush()
+
+    def _clean(self, text):
+        return XML_INVALID.sub("\ufffd", text)
+
+    def close(self, summary=None):
+        self.f.close()
+        if summary is None:
+            return # Cut short: leave the partial, still valid file / 중단됨: 부분적이지만 올바른 파일을 남김
+        # The totals go on the opening tag: copy the cases under a new one
+        # 합계는 여는 태그에 들어가므로 새 태그 아래로 케이스를 복사
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp = tempfile.mkstemp(prefix=".frytesty-", suffix=".xml", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as out, open(self.path, encoding="utf-8") as f:
+                out.write('<?xml version="1.0" encoding="UTF-8"?>\n<testsuites>\n')
+                out.write(self._suite_tag(summary))
+                f.seek(self.body)
+                shutil.copyfileobj(f, out)
+            shutil.copymode(self.path, temp) # mkstemp files are private / mkstemp 파일은 소유자 전용
+            os.replace(temp, self.path)
+        except BaseException:
+            os.unlink(temp)
+            raise
+
+class Reports:
+    # Fans results out to the requested reports / 요청된 보고서들에 결과를 전달
+    def __init__(self, meta, junit=None, jsonl=None):
+        self.meta = dict(meta, started=time.strftime("%Y-%m-%dT%H:%M:%S"))
+        self.start = time.perf_counter()
+        self.counts = {"total": 0, "failed": 0, "errors": 0}
+        self.outputs = []
+        try:
+            if jsonl:
+                self.outputs.append(JsonLinesReport(jsonl, self.meta))
+            if junit:
+                self.outputs.append(JUnitReport(junit, self.meta))
+        except BaseException:
+            self.close(complete=False)
+            raise
+
+    def case(self, num, name, res):
+        record = case_record(num, name, res)
+        self.counts["total"] += 1
+        if not record["passed"]:
+            self.counts["failed"] += 1
+            if record["verdict"] == "ERROR":
+                self.counts["errors"] += 1
+        for output in self.outputs:
+            output.case(record)
+
+    def close(self, complete=True):
+        summary = None
+        if complete:
+            summary = dict(self.counts, passed=self.counts["total"] - self.counts["failed"], elapsed_ms=round((time.perf_counter() - self.start) * 1000, 3))
+        for output in self.outputs:
+            output.close(summary)
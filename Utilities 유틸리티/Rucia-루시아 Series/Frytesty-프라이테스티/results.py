@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Frytesty Results - Persistent result cache for unchanged cases
+# Frytesty 결과 - 바뀌지 않은 케이스를 위한 영구 결과 캐시
+# Rheehose (Rhee Creative) 2008-2026
+# Licensed under Apache-2.0
+
+# A result is keyed by everything that can change it: the solution source
+# and run command, the runtime (interpreter / compiler binary), the checker,
+# the limits, and the input and expected data. File contents are hashed once
+# and remembered by (size, mtime), like git's index, so an unchanged suite of
+# large files costs a stat() per file rather than a read.
+# 결과의 키는 결과를 바꿀 수 있는 모든 것: 풀이 소스와 실행 명령, 런타임(인터프리터 /
+# 컴파일러 실행 파일), 체커, 제한, 입력과 기대 데이터. 파일 내용은 한 번 해시한 뒤
+# git 인덱스처럼 (크기, 수정 시각)으로 기억하므로, 바뀌지 않은 대용량 스위트는 파일마다
+# 읽기 대신 stat() 한 번이면 됨.
+
+import os
+import json
+import time
+import shutil
+import sqlite3
+import hashlib
+import threading
+
+import suite
+import languages
+
+CACHE_FILE = os.path.join(os.path.dirname(languages.CACHE_DIR), "results.sqlite")
+MAX_RESULTS = 50000 # Least recently used are pruned / 오래 안 쓴 것부터 정리
+MAX_DIGESTS = 50000
+HASH_CHUNK = 1024 * 1024
+# Depend on the machine rather than the code: worth running again
+# 코드가 아니라 실행 환경에 달린 결과는 다시 실행할 가치가 있음
+UNCACHED_VERDICTS = ("ERROR",)
+# Bumped when the result dict gains fields, so older records are not replayed
+# 결과 dict에 필드가 추가되면 올려서 예전 기록이 재생되지 않게 함
+RESULT_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS digests (
+    path TEXT NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    used REAL NOT NULL,
+    PRIMARY KEY (path, offset, length)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    result TEXT NOT NULL,
+    used REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+class ResultCache:
+    # reuse=False still records every result, so a later "changed only" run
+    # can skip what this one already judged.
+    # Shared by the worker threads; sqlite calls are serialized by a lock.
+    # reuse=False여도 모든 결과를 기록하므로, 이후 "변경분만" 실행은 이번에 채점한 것을 건너뜀.
+    # 작업 스레드들이 공유하며 sqlite 호출은 잠금으로 직렬화.
+    def __init__(self, path=CACHE_FILE, reuse=False):
+        self.reuse = reuse
+        self.lock = threading.Lock()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        # WAL: a GUI and a CLI run can use the cache at the same time
+        # WAL: GUI와 CLI 실행이 동시에 캐시를 사용 가능
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+
+    def file_digest(self, path, offset=0, length=-1):
+        # sha256 of a file (or a slice), recomputed only when size or mtime change
+        # 파일(또는 구간)의 sha256, 크기나 수정 시각이 바뀔 때만 다시 계산
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT size, mtime_ns, sha256 FROM digests WHERE path = ? AND offset = ? AND length = ?",
+                (path, offset, length),
+            ).fetchone()
+        if row and row[0] == st.st_size and row[1] == st.st_mtime_ns:
+            return row[2]
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            f.seek(offset)
+            left = st.st_size - offset if length < 0 else length
+            while left > 0:
+                block = f.read(min(HASH_CHUNK, left))
+                if not block:
+                    break
+                left -= len(block)
+                digest.update(block)
+        digest = digest.hexdigest()
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO digests VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (path, offset, length, st.st_size, st.st_mtime_ns, digest, time.time()),
+            )
+        return digest
+
+    def blob_digest(self, data):
+        blob = suite.as_blob(data)
+        if isinstance(blob, suite.FileBlob):
+            return self.file_digest(blob.path, blob.offset, -1 if blob.whole else blob.size)
+        if isinstance(blob, suite.ZipBlob):
+            # One hash per archive, whatever the number of members / 멤버 수와 무관하게 압축 파일당 해시 한 번
+            return hashlib.sha256(f"{self.file_digest(blob.archive)}\0{blob.member}".encode("utf-8")).hexdigest()
+        return hashlib.sha256(blob.read()).hexdigest()
+
+    def _executable(self, name):
+        # A runtime is identified by its resolved binary, so upgrading python3
+        # or gcc invalidates results without running `--version` every time
+        # 런타임은 실제 실행 파일로 식별, python3나 gcc를 업그레이드하면 매번
+        # `--version`을 실행하지 않아도 결과가 무효화됨
+        found = shutil.which(name)
+        if not found:
+            return name
+        real = os.path.realpath(found)
+        st = os.stat(real)
+        return f"{real}:{st.st_size}:{st.st_mtime_ns}"
+
+    def stamp(self, program, checker, time_limit, memory_limit, isolate=False):
+        # Everything but the case data, computed once per run / 케이스 데이터 외 전부, 실행마다 한 번 계산
+        profile = languages.PROFILES[program.language]
+        parts = [
+            str(RESULT_VERSION),
+            program.language,
+            "\0".join(program.argv),
+            self.file_digest(program.source),
+            self._executable(program.argv[0]),
+            self._executable(profile.compile[0]) if profile.compile else "",
+            getattr(checker, "func", checker).__name__,
+            json.dumps(sorted((getattr(checker, "keywords", None) or {}).items())),
+            repr((time_limit, memory_limit, bool(isolate))),
+        ]
+        script = (getattr(checker, "keywords", None) or {}).get("script")
+        if script:
+            parts.append(self.file_digest(script))
+        return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+    def key(self, stamp, in_data, expected):
+        # None when the data cannot be hashed: the case then simply runs uncached
+        # 데이터를 해시할 수 없으면 None, 그 케이스는 캐시 없이 실행
+        try:
+            return hashlib.sha256(f"{stamp}\0{self.blob_digest(in_data)}\0{self.blob_digest(expected)}".encode("ascii")).hexdigest()
+        except (OSError, sqlite3.Error):
+            return None
+
+    def get(self, key):
+        with self.lock, self.conn:
+            row = self.conn.execute("SELECT result FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self.conn.execute("UPDATE results SET used = ? WHERE key = ?", (time.time(), key))
+        return dict(json.loads(row[0]), cached=True)
+
+    def put(self, key, result):
+        if key is None or result["verdict"] in UNCACHED_VERDICTS:
+            return
+        record = json.dumps({name: value for name, value in result.items() if name != "cached"})
+        try:
+            with self.lock, self.conn:
+                self.conn.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?)", (key, record, time.time()))
+        except sqlite3.Error:
+            pass # A busy or read-only cache only costs a re-run later / 사용 중이거나 읽기 전용이면 나중에 다시 실행할 뿐
+
+    def close(self):
+        with self.lock:
+            try:
+                with self.conn:
+                    for table, keep in (("results", MAX_RESULTS), ("digests", MAX_DIGESTS)):
+                        self.conn.execute(
+                            f"DELETE FROM {table} WHERE used < (SELECT used FROM {table} ORDER BY used DESC LIMIT 1 OFFSET ?)",
+                            (keep - 1,),
+                        )
+            finally:
+                self.conn.close()
+
+def open_cache(reuse=False, path=CACHE_FILE):
+    # None when the cache cannot be opened (read-only home, locked file...):
+    # the run then goes ahead uncached
+    # 캐시를 열 수 없으면 None (읽기 전용 홈, 잠긴 파일 등), 그 경우 캐시 없이 실행
+    try:
+        return ResultCache(path, reuse)
+    except (OSError, sqlite3.Error):
+        return None
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Frytesty Sandbox - Resource caps and optional namespace isolation for solutions
+# Frytesty 샌드박스 - 풀이의 자원 제한과 선택적 네임스페이스 격리
+# Rheehose (Rhee Creative) 2008-2026
+# Licensed under Apache-2.0
+
+# Limits travel as one JSON-friendly dict so the warm fork server, the cold
+# prlimit() path and the isolation helper all apply the same thing:
+#   cpu (s), memory (bytes, RLIMIT_AS), fsize (bytes), nproc (tasks),
+#   isolate (bool: user/net/mount namespaces, tmpdir becomes a private tmpfs),
+#   tmpdir (path, exported as TMPDIR)
+# Every path also sets PR_SET_NO_NEW_PRIVS on Linux; the cold prlimit() path
+# gets it from setpriv(1), and runs without it only where util-linux's
+# setpriv is not installed.
+# 제한은 JSON으로 옮길 수 있는 dict 하나로 전달되어 예열 포크 서버, 콜드 prlimit() 경로,
+# 격리 도우미가 모두 같은 제한을 적용:
+#   cpu (초), memory (바이트, RLIMIT_AS), fsize (바이트), nproc (태스크 수),
+#   isolate (user/net/mount 네임스페이스, tmpdir이 전용 tmpfs가 됨),
+#   tmpdir (경로, TMPDIR로 지정)
+# 리눅스에서는 모든 경로가 PR_SET_NO_NEW_PRIVS도 설정. 콜드 prlimit() 경로는 setpriv(1)로
+# 적용하며, util-linux의 setpriv가 설치되지 않은 경우에만 없이 실행.
+
+import os
+import sys
+import json
+import shutil
+import ctypes
+import tempfile
+import subprocess
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+PYTHON = "python3"
+FSIZE_LIMIT = 64 * 1024 * 1024 # Largest file a solution may write / 풀이가 쓸 수 있는 최대 파일 크기
+TASKS_PER_CASE = 64 # Processes + threads one case may add / 케이스 하나가 늘릴 수 있는 프로세스 + 스레드 수
+MIN_MEMORY_CAP = 256 * 1024 * 1024
+TMPFS_OPTIONS = b"size=64m,mode=1777"
+
+# linux/sched.h, linux/mount.h, linux/prctl.h
+CLONE_NEWNS, CLONE_NEWUSER, CLONE_NEWNET = 0x00020000, 0x10000000, 0x40000000
+MS_NOSUID, MS_NODEV, MS_REC, MS_PRIVATE = 0x2, 0x4, 0x4000, 0x40000
+PR_SET_NO_NEW_PRIVS = 38
+
+_isolation = None # Probe result, cached / 탐지 결과 캐시
+_setpriv = False # setpriv(1) path or None once looked up / 조회 후 setpriv(1) 경로 또는 None
+
+def _libc():
+    return ctypes.CDLL(None, use_errno=True)
+
+def _check(result, what):
+    if result != 0:
+        err = ctypes.get_errno()
+        raise OSError(err, f"{what}: {os.strerror(err)}")
+
+def user_tasks():
+    # Tasks (threads count too) owned by this user: RLIMIT_NPROC is per user,
+    # so a cap is only meaningful on top of what already runs (Linux /proc)
+    # 이 사용자의 태스크 수 (스레드 포함): RLIMIT_NPROC는 사용자 단위라 이미 실행 중인
+    # 수에 더해야 의미가 있음 (리눅스 /proc)
+    uid = str(os.getuid())
+    total = 0
+    try:
+        pids = [name for name in os.listdir("/proc") if name.isdigit()]
+    except OSError:
+        return None
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/status", "r") as f:
+                status = dict(line.split(":", 1) for line in f if ":" in line)
+        except OSError:
+            continue
+        if status.get("Uid", "").split()[:1] == [uid]:
+            total += int(status.get("Threads", "1"))
+    return total
+
+def nproc_limit(workers):
+    # Fork bombs stop at the current task count plus an allowance per worker.
+    # root is exempt from RLIMIT_NPROC, so no limit is set there.
+    # 포크 폭탄은 현재 태스크 수 + 작업자별 여유분에서 멈춤. root는 RLIMIT_NPROC의 예외라 설정 안 함.
+    if resource is None or os.getuid() == 0:
+        return None
+    base = user_tasks()
+    return None if base is None else base + workers * TASKS_PER_CASE
+
+def memory_cap(workers):
+    # Without a memory limit, parallel cases still share physical RAM between them
+    # 메모리 제한이 없어도 병렬 케이스들이 물리 메모리를 나눠 쓰도록 제한
+    try:
+        ram = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (ValueError, OSError, AttributeError):
+        return None
+    return max(MIN_MEMORY_CAP, ram // max(1, workers))
+
+def rlimits(limits):
+    # [(resource, (soft, hard))] for a limits dict / limits dict에 해당하는 rlimit 목록
+    if resource is None or not limits:
+        return []
+    result = [(resource.RLIMIT_CORE, (0, 0))]
+    if limits.get("cpu"):
+        # Only a backstop: the judge compares measured CPU time itself
+        # 안전장치일 뿐, 판정은 측정한 CPU 시간으로
+        soft = int(limits["cpu"]) + 1
+        result.append((resource.RLIMIT_CPU, (soft, soft + 1)))
+    if limits.get("memory"):
+        result.append((resource.RLIMIT_AS, (limits["memory"], limits["memory"])))
+    if limits.get("fsize"):
+        result.append((resource.RLIMIT_FSIZE, (limits["fsize"], limits["fsize"])))
+    if limits.get("nproc") and hasattr(resource, "RLIMIT_NPROC"):
+        result.append((resource.RLIMIT_NPROC, (limits["nproc"], limits["nproc"])))
+    return result
+
+def prlimit(pid, limits):
+    # Cold children: applied right after spawn from the judge / 콜드 자식: 생성 직후 채점기가 적용
+    for which, value in rlimits(limits):
+        resource.prlimit(pid, which, value)
+
+def child_env(limits):
+    # Private scratch directory for tempfile & co. / tempfile 등이 쓰는 전용 임시 폴더
+    tmpdir = (limits or {}).get("tmpdir")
+    if not tmpdir:
+        return None
+    return dict(os.environ, TMPDIR=tmpdir, TMP=tmpdir, TEMP=tmpdir)
+
+def isolate(tmpdir):
+    # Must run in a single-threaded process (a fresh fork): new user namespace
+    # mapping our own uid/gid, no network but loopback, and a private mount
+    # namespace with an empty tmpfs over the case's tmpdir. /tmp itself stays
+    # visible, since solutions and inputs often live there.
+    # 단일 스레드 프로세스(막 fork된 자식)에서만 호출: 자신의 uid/gid만 매핑한 새 user
+    # 네임스페이스, loopback뿐인 네트워크, 케이스 임시 폴더에 빈 tmpfs를 올린 전용 mount
+    # 네임스페이스. 풀이와 입력이 /tmp에 있는 경우가 많아 /tmp 자체는 그대로 보임.
+    uid, gid = os.getuid(), os.getgid()
+    libc = _libc()
+    _check(libc.unshare(CLONE_NEWUSER | CLONE_NEWNS | CLONE_NEWNET), "unshare")
+    for name, value in (("setgroups", "deny"), ("uid_map", f"{uid} {uid} 1"), ("gid_map", f"{gid} {gid} 1")):
+        with open(f"/proc/self/{name}", "w") as f:
+            f.write(value)
+    _check(libc.mount(None, b"/", None, MS_REC | MS_PRIVATE, None), "mount --make-rprivate /")
+    if tmpdir:
+        _check(libc.mount(b"tmpfs", os.fsencode(tmpdir), b"tmpfs", MS_NOSUID | MS_NODEV, TMPFS_OPTIONS), f"mount tmpfs {tmpdir}")
+
+def apply_limits(limits):
+    # In the child, after fork and before running the solution
+    # 자식에서 fork 직후, 풀이 실행 전에 호출
+    if not limits:
+        return
+    if sys.platform.startswith("linux"):
+        # seccomp-lite: setuid binaries can no longer raise privileges
+        # seccomp-lite: setuid 실행 파일로 권한 상승 불가
+        _libc().prctl(PR_SET_NO_NEW_PRIVS, 1, 0, 0, 0)
+        if limits.get("isolate"):
+            isolate(limits.get("tmpdir"))
+    env = child_env(limits)
+    if env:
+        os.environ.update(env)
+    for which, value in rlimits(limits):
+        resource.setrlimit(which, value)
+
+def harden(argv, limits):
+    # Cold children limited by prlimit() cannot run prctl() before exec (no
+    # preexec_fn with worker threads), so they exec through setpriv, which
+    # costs about 0.5ms of CPU per run
+    # prlimit()으로 제한되는 콜드 자식은 exec 전에 prctl()을 호출할 수 없으므로(작업 스레드와
+    # preexec_fn 불가) setpriv를 거쳐 exec, 실행마다 CPU 약 0.5ms 소요
+    global _setpriv
+    if not limits or not sys.platform.startswith("linux"):
+        return list(argv)
+    if _setpriv is False:
+        _setpriv = shutil.which("setpriv")
+    return [_setpriv, "--no-new-privs", "--"] + list(argv) if _setpriv else list(argv)
+
+def wrap(argv, limits):
+    # Cold children that need namespaces exec through this module, since
+    # unshare() cannot be called from the judge's threads
+    # 네임스페이스가 필요한 콜드 자식은 이 모듈을 거쳐 exec, 채점기의 스레드에서는 unshare() 불가
+    return [PYTHON, os.path.abspath(__file__), json.dumps(limits), "--"] + list(argv)
+
+def isolation_supported():
+    # Unprivileged user namespaces may be disabled by the distribution
+    # 배포판에 따라 비특권 user 네임스페이스가 꺼져 있을 수 있음
+    global _isolation
+    if _isolation is None:
+        if not sys.platform.startswith("linux"):
+            _isolation = False
+        else:
+            scratch = tempfile.mkdtemp(prefix="frytesty-probe-")
+            try:
+                probe = subprocess.run([PYTHON, os.path.abspath(__file__), "--probe", scratch], capture_output=True, timeout=10)
+                _isolation = probe.returncode == 0
+            except (OSError, subprocess.TimeoutExpired):
+                _isolation = False
+            finally:
+                shutil.rmtree(scratch, ignore_errors=True)
+    return _isolation
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--probe"]:
+        isolate(sys.argv[2])
+        sys.exit(0)
+    # sandbox.py <limits json> -- argv...
+    try:
+        apply_limits(json.loads(sys.argv[1]))
+        os.execvp(sys.argv[3], sys.argv[3:])
+    except OSError as e:
+        print(f"sandbox: {e}", file=sys.stderr)
+        sys.exit(127)
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Frytesty Stress - Random tests against a reference solution, with shrinking
+# Frytesty 스트레스 - 기준 풀이와 비교하는 무작위 테스트와 입력 축소
+# Rheehose (Rhee Creative) 2008-2026
+# Licensed under Apache-2.0
+
+# Every trial runs `generator <seed>` for an input, the reference solution for
+# the expected output, and then judges the candidate like a normal case. All
+# three fork from the same warm interpreter pool, and trials run across the
+# workers. The first divergence stops the run; its input is then shrunk
+# (lines, then tokens, then numbers) while the reference still accepts it
+# and the candidate still fails.
+# 매 시도마다 `generator <seed>`로 입력을, 기준 풀이로 기대 출력을 만든 뒤 후보 풀이를
+# 일반 케이스처럼 채점. 세 프로그램 모두 같은 예열 인터프리터 풀에서 fork되고 시도는
+# 작업자들에 나뉘어 실행. 첫 불일치에서 멈추고, 기준 풀이가 여전히 정상 실행되고 후보가
+# 여전히 실패하는 동안 입력을 줄임 (줄, 토큰, 숫자 순).
+
+import re
+import math
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import judge
+import checkers
+import languages
+
+STRESS_TESTS = 1000
+IN_FLIGHT = 2 # Trials queued per worker / 작업자당 대기시키는 시도 수
+SHRINK_RUNS = 400 # Reference + candidate runs spent on shrinking / 축소에 쓰는 기준+후보 실행 횟수
+INTEGER = re.compile(rb"-?\d+")
+
+def _check(programs, pool, caps, checker, data, time_limit, memory_limit):
+    candidate, reference, _ = programs
+    ref = judge.run_program(reference, data, time_limit, pool, caps=caps)
+    if not ref["ok"]:
+        return {"stage": "reference", "passed": False, "input": data, "error": ref["error"] or f"exit code {ref['returncode']}"}
+    res = judge.run_case(candidate, data, ref["stdout"], time_limit, memory_limit, pool, checker, caps)
+    return {"stage": "candidate", "passed": res["passed"], "input": data, "expected": ref["stdout"], "result": res}
+
+def _trial(programs, pool, caps, checker, seed, time_limit, memory_limit):
+    gen = judge.run_program(programs[2], b"", time_limit, pool, [str(seed)], caps)
+    if not gen["ok"]:
+        outcome = {"stage": "generator", "passed": False, "input": b"", "error": gen["error"] or f"exit code {gen['returncode']}"}
+    else:
+        outcome = _check(programs, pool, caps, checker, gen["stdout"], time_limit, memory_limit)
+    outcome["seed"] = seed
+    return outcome
+
+def _ddmin(units, join, fails, budget):
+    # Delta debugging: drop ever smaller slices while the input still fails
+    # 델타 디버깅: 입력이 여전히 실패하는 동안 점점 작은 구간을 제거
+    parts = 2
+    while len(units) >= 2 and budget[0] > 0:
+        size = math.ceil(len(units) / parts)
+        for start in range(0, len(units), size):
+            rest = units[:start] + units[start + size:]
+            if rest and fails(join(rest)):
+                units = rest
+                parts = max(parts - 1, 2)
+                break
+        else:
+            if parts >= len(units):
+                break
+            parts = min(len(units), parts * 2)
+    return units
+
+def _smaller(value):
+    # Simpler integers first: 0, 1, half, one less / 더 단순한 정수부터: 0, 1, 절반, 1 작은 값
+    number = int(value)
+    seen = []
+    for candidate in (0, 1, number // 2, number - 1 if number > 0 else number + 1):
+        if abs(candidate) < abs(number) and candidate not in seen:
+            seen.append(candidate)
+    return [str(candidate).encode("ascii") for candidate in seen]
+
+def shrink(data, fails, budget=SHRINK_RUNS):
+    # Smallest input found for which fails(input) holds; fails() is called at
+    # most `budget` times
+    # fails(입력)이 참인 가장 작은 입력, fails()는 최대 `budget`번 호출
+    budget = [budget]
+
+    def counted(candidate):
+        if budget[0] <= 0:
+            return False
+        budget[0] -= 1
+        return fails(candidate)
+
+    def join(lines):
+        return b"\n".join(b" ".join(tokens) for tokens in lines) + b"\n"
+
+    lines = [line.split() for line in data.decode("utf-8", errors="replace").encode("utf-8").split(b"\n") if line.strip()]
+    lines = _ddmin(lines, join, counted, budget)
+    for i in range(len(lines)):
+        lines[i] = _ddmin(lines[i], lambda tokens: join(lines[:i] + [tokens] + lines[i + 1:]), counted, budget)
+    improved = True
+    while improved and budget[0] > 0:
+        improved = False
+        for i, j in [(i, j) for i, tokens in enumerate(lines) for j in range(len(tokens))]:
+            if not INTEGER.fullmatch(lines[i][j]):
+                continue
+            for candidate in _smaller(lines[i][j]):
+                trial = [list(tokens) for tokens in lines]
+                trial[i][j] = candidate
+                if counted(join(trial)):
+                    lines, improved = trial, True
+                    break
+    return join(lines)
+
+def stress(candidate, reference, generator, tests=STRESS_TESTS, workers=None, time_limit=judge.DEFAULT_TIME_LIMIT, memory_limit=None, warm=True, checker="lines", language=None, flags="", seed=1, shrinking=True, isolate=False, cancel=None, progress=None):
+    # Returns {"tested": n, "failure": None or outcome}; an outcome has "stage"
+    # (generator / reference / candidate), "seed", "input", and for candidate
+    # failures "expected", "result" and, when shrinking, "original" (the
+    # unshrunk input). tests=None runs until a divergence or `cancel`.
+    # {"tested": 시도 수, "failure": None 또는 결과} 반환. 결과에는 "stage"
+    # (generator / reference / candidate), "seed", "input", 후보 실패라면 "expected",
+    # "result", 축소 시 "original"(축소 전 입력)이 있음. tests=None이면 불일치나 `cancel`까지 실행.
+    programs = (languages.prepare(candidate, language, flags), languages.prepare(reference), languages.prepare(generator))
+    checker = checkers.resolve(checker)
+    workers = max(1, workers or judge.default_workers())
+    caps = judge.sandbox_caps(workers, isolate)
+    # Set on the first failure so trials still in flight are killed
+    # 첫 실패 시 설정되어 진행 중인 시도를 종료
+    halt = threading.Event()
+    pool = judge.InterpreterPool(warm, halt)
+    seeds = itertools.count(seed) if tests is None else iter(range(seed, seed + tests))
+    tested, failure = 0, None
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = set()
+
+            def submit():
+                next_seed = next(seeds, None)
+                if next_seed is not None:
+                    pending.add(executor.submit(_trial, programs, pool, caps, checker, next_seed, time_limit, memory_limit))
+
+            for _ in range(workers * IN_FLIGHT):
+                submit()
+            while pending and failure is None:
+                if cancel is not None and cancel.is_set():
+                    break
+                done, pending = wait(pending, timeout=judge.CANCEL_POLL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        outcome = future.result()
+                    except judge.Cancelled:
+                        continue
+                    tested += 1
+                    if not outcome["passed"]:
+                        failure = outcome
+                        break
+                    submit()
+                if progress:
+                    progress(tested, "testing")
+            halt.set()
+            for future in pending:
+                future.cancel()
+    finally:
+        pool.close()
+
+    if failure and failure["stage"] == "candidate" and shrinking and not (cancel is not None and cancel.is_set()):
+        pool = judge.InterpreterPool(warm, cancel)
+        last = [failure]
+
+        def fails(data):
+            outcome = _check(programs, pool, caps, checker, data, time_limit, memory_limit)
+            if outcome["stage"] == "candidate" and not outcome["passed"]:
+                last[0] = outcome
+                if progress:
+                    progress(tested, "shrinking")
+                return True
+            return False
+
+        try:
+            shrink(failure["input"], fails)
+        except judge.Cancelled:
+            pass
+        finally:
+            pool.close()
+        if last[0] is not failure:
+            # The last accepted reduction is the smallest input / 마지막으로 받아들인 축소가 가장 작은 입력
+            failure = dict(last[0], seed=failure["seed"], original=failure["input"])
+    return {"tested": tested, "failure": failure}
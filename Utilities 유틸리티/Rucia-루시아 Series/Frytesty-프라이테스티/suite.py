@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Frytesty Suite Loader - Judge directories, multi-case files and zip archives
+# Frytesty 스위트 로더 - 채점 폴더, 다중 케이스 파일, zip 압축 파일
+# Rheehose (Rhee Creative) 2008-2026
+# Licensed under Apache-2.0
+
+import os
+import re
+import mmap
+import zipfile
+from collections import namedtuple
+
+INPUT_EXTS = (".in", ".inp", ".input")
+OUTPUT_EXTS = (".out", ".ans", ".output", ".a")
+READ_CHUNK = 1024 * 1024
+# Multi-case files: "---" separates input from expected, "===" separates cases
+# 다중 케이스 파일: "---"는 입력과 기대 출력, "==="는 케이스를 구분
+SEPARATOR = re.compile(rb"^(---|===)[ \t]*\r?$\n?", re.M)
+
+# Same (input, expected) order as the GUI's plain tuples / GUI의 일반 튜플과 같은 (입력, 기대값) 순서
+Case = namedtuple("Case", "input expected name")
+
+# Blobs describe where case data lives; nothing is read until a case runs,
+# so a suite of large files costs a few objects, not their contents.
+# Blob은 케이스 데이터의 위치만 기술, 케이스 실행 전에는 읽지 않으므로
+# 대용량 스위트도 내용이 아닌 객체 몇 개만 차지.
+class InlineBlob:
+    def __init__(self, data):
+        self.data = data.encode("utf-8") if isinstance(data, str) else data
+        self.size = len(self.data)
+
+    def chunks(self):
+        yield self.data
+
+    def read(self):
+        return self.data
+
+class FileBlob:
+    # A whole file, or the [offset, offset + length) slice of one
+    # 파일 전체 또는 [offset, offset + length) 구간
+    def __init__(self, path, offset=0, length=None):
+        self.path, self.offset = path, offset
+        self.size = os.path.getsize(path) - offset if length is None else length
+        self.whole = offset == 0 and length is None
+
+    def chunks(self):
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            left = self.size
+            while left > 0:
+                block = f.read(min(READ_CHUNK, left))
+                if not block:
+                    return
+                left -= len(block)
+                yield block
+
+    def read(self):
+        return b"".join(self.chunks())
+
+class ZipBlob:
+    # Streamed out of the archive on demand / 필요할 때 압축 파일에서 스트리밍
+    def __init__(self, archive, member, size):
+        self.archive, self.member, self.size = archive, member, size
+
+    def chunks(self):
+        with zipfile.ZipFile(self.archive) as zf, zf.open(self.member) as f:
+            while True:
+                block = f.read(READ_CHUNK)
+                if not block:
+                    return
+                yield block
+
+    def read(self):
+        return b"".join(self.chunks())
+
+def as_blob(data):
+    return data if hasattr(data, "chunks") else InlineBlob(data)
+
+def read_text(data):
+    if isinstance(data, str):
+        return data
+    return as_blob(data).read().decode("utf-8", errors="replace")
+
+def _natural_key(name):
+    # "2.in" before "10.in" / "10.in"보다 "2.in"이 먼저
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", name)]
+
+def _pair(names):
+    # {stem: input name} + {stem: output name} -> [(stem, in, out)] in natural order
+    # 입력/출력 이름을 같은 stem끼리 짝지어 자연 정렬 순으로 반환
+    inputs, outputs = {}, {}
+    for name in names:
+        stem, ext = os.path.splitext(name)
+        if ext.lower() in INPUT_EXTS:
+            inputs[stem] = name
+        elif ext.lower() in OUTPUT_EXTS:
+            outputs[stem] = name
+    return [(stem, inputs[stem], outputs[stem]) for stem in sorted(inputs.keys() & outputs.keys(), key=_natural_key)]
+
+def load_directory(path):
+    names = []
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        rel_root = os.path.relpath(root, path)
+        names.extend(name if rel_root == "." else os.path.join(rel_root, name) for name in files)
+    return [
+        Case(FileBlob(os.path.join(path, in_name)), FileBlob(os.path.join(path, out_name)), stem)
+        for stem, in_name, out_name in _pair(names)
+    ]
+
+def load_zip(path):
+    with zipfile.ZipFile(path) as zf:
+        sizes = {info.filename: info.file_size for info in zf.infolist() if not info.is_dir()}
+    return [
+        Case(ZipBlob(path, in_name, sizes[in_name]), ZipBlob(path, out_name, sizes[out_name]), stem)
+        for stem, in_name, out_name in _pair(sizes)
+    ]
+
+def load_multicase(path):
+    # Separators are found by scanning a memory map; cases are file slices
+    # 구분자는 메모리 맵을 훑어 찾고, 케이스는 파일 구간으로 표현
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        marks = [(m.start(), m.end(), m.group(1)) for m in SEPARATOR.finditer(mm)]
+    cases, start, input_span = [], 0, None
+    for sep_start, sep_end, kind in marks + [(size, size, b"===")]:
+        if kind == b"---" and input_span is None:
+            input_span = (start, sep_start)
+            start = sep_end
+        elif kind == b"===":
+            if input_span is not None:
+                cases.append(Case(
+                    FileBlob(path, input_span[0], input_span[1] - input_span[0]),
+                    FileBlob(path, start, sep_start - start),
+                    str(len(cases) + 1),
+                ))
+            input_span = None
+            start = sep_end
+        # A second "---" inside expected output is just data / 기대 출력 안의 두 번째 "---"는 데이터
+    return cases
+
+def suite_source(path):
+    # What load_suite() actually reads: the folder for a picked N.in/N.out file
+    # load_suite()가 실제로 읽는 대상: N.in/N.out 파일을 고른 경우 그 폴더
+    if not os.path.isdir(path) and not zipfile.is_zipfile(path) and os.path.splitext(path)[1].lower() in INPUT_EXTS + OUTPUT_EXTS:
+        return os.path.dirname(os.path.abspath(path))
+    return path
+
+def load_suite(path):
+    # Directory of N.in/N.out pairs, a .zip of them, or a multi-case text file.
+    # Picking one N.in/N.out file loads the directory it sits in.
+    # N.in/N.out 폴더, 그 zip, 또는 다중 케이스 텍스트 파일.
+    # N.in/N.out 파일 하나를 고르면 그 파일이 있는 폴더를 불러옴.
+    if os.path.isdir(path):
+        return load_directory(path)
+    if zipfile.is_zipfile(path):
+        return load_zip(path)
+    if os.path.splitext(path)[1].lower() in INPUT_EXTS + OUTPUT_EXTS:
+        return load_directory(os.path.dirname(os.path.abspath(path)))
+    return load_multicase(path)
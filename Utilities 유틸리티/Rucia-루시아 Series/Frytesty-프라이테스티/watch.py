@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Frytesty Watch - Change notification for the solution, suite and checker
+# Frytesty 감시 - 풀이, 스위트, 체커의 변경 알림
+# Rheehose (Rhee Creative) 2008-2026
+# Licensed under Apache-2.0
+
+# Linux uses inotify (through ctypes, no extra package); other platforms fall
+# back to comparing (mtime, size) every POLL_INTERVAL. Files are watched
+# through their directory, since editors often save by writing a new file
+# and renaming it over the old one, which would orphan a watch on the file.
+# 리눅스는 inotify (ctypes 사용, 추가 패키지 없음), 다른 플랫폼은 POLL_INTERVAL마다
+# (수정 시각, 크기)를 비교. 편집기는 새 파일을 써서 기존 파일 위로 이름을 바꿔 저장하는
+# 경우가 많아, 파일 자체가 아니라 그 폴더를 감시.
+
+import os
+import sys
+import time
+import ctypes
+import select
+import struct
+
+DEBOUNCE = 0.2 # Quiet seconds that end a burst of saves / 연속 저장이 끝났다고 보는 조용한 시간 (초)
+POLL_INTERVAL = 0.5
+STOP_POLL = 0.5 # Seconds between checks of the stop event / 중지 이벤트 확인 간격 (초)
+READ_SIZE = 64 * 1024
+
+# Editor swap/backup files and caches are not changes to the suite
+# 편집기 스왑/백업 파일과 캐시는 스위트 변경이 아님
+IGNORED_NAMES = ("4913", "__pycache__") # 4913: vim's write probe / vim의 쓰기 검사 파일
+IGNORED_SUFFIXES = ("~", ".swp", ".swx", ".tmp", ".pyc")
+
+# linux/inotify.h
+IN_MODIFY, IN_ATTRIB, IN_CLOSE_WRITE = 0x2, 0x4, 0x8
+IN_MOVED_FROM, IN_MOVED_TO, IN_CREATE, IN_DELETE = 0x40, 0x80, 0x100, 0x200
+IN_Q_OVERFLOW, IN_ISDIR = 0x4000, 0x40000000
+IN_NONBLOCK, IN_CLOEXEC = os.O_NONBLOCK, getattr(os, "O_CLOEXEC", 0)
+WATCH_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT = struct.Struct("iIII") # wd, mask, cookie, len
+
+def _ignored(path):
+    name = os.path.basename(path)
+    return name.startswith(".") or name in IGNORED_NAMES or name.endswith(IGNORED_SUFFIXES)
+
+class _Targets:
+    # Watched files, and directories watched recursively for files ending in
+    # `suffixes` (any file if None)
+    # 감시 파일, 그리고 `suffixes`로 끝나는 파일(None이면 모든 파일)을 하위까지 감시하는 폴더
+    def __init__(self, paths, suffixes=None):
+        paths = [os.path.abspath(path) for path in paths]
+        self.dirs = [path for path in paths if os.path.isdir(path)]
+        self.files = {path for path in paths if path not in self.dirs}
+        self.suffixes = tuple(suffixes) if suffixes else None
+
+    def wanted(self, path, is_dir=False):
+        if path in self.files:
+            return True
+        if _ignored(path) or not any(path.startswith(directory + os.sep) for directory in self.dirs):
+            return False
+        return is_dir or self.suffixes is None or path.lower().endswith(self.suffixes)
+
+    def directories(self):
+        for path in self.files:
+            yield os.path.dirname(path)
+        for directory in self.dirs:
+            for root, subdirs, _ in os.walk(directory):
+                subdirs[:] = [name for name in subdirs if not _ignored(name)]
+                yield root
+
+class InotifyWatcher:
+    def __init__(self, paths, suffixes=None):
+        self.targets = _Targets(paths, suffixes)
+        self.libc = ctypes.CDLL(None, use_errno=True)
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_init1: {os.strerror(err)}")
+        self.wds = {} # Watch descriptor -> directory / 감시 디스크립터 -> 폴더
+        for directory in set(self.targets.directories()):
+            self._add(directory)
+
+    def _add(self, directory):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd >= 0:
+            self.wds[wd] = directory
+
+    def read(self, timeout):
+        # Changed paths seen within `timeout` seconds (empty set if none)
+        # `timeout`초 안에 본 변경 경로 (없으면 빈 집합)
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return set()
+        try:
+            data = os.read(self.fd, READ_SIZE)
+        except BlockingIOError:
+            return set()
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT.unpack_from(data, offset)
+            name = data[offset + EVENT.size:offset + EVENT.size + length].rstrip(b"\0")
+            offset += EVENT.size + length
+            if mask & IN_Q_OVERFLOW:
+                # Events were dropped: assume everything changed / 이벤트 유실: 전부 바뀐 것으로 간주
+                changed.update(self.targets.files, self.targets.dirs)
+                continue
+            if wd not in self.wds or not name:
+                continue
+            path = os.path.join(self.wds[wd], os.fsdecode(name))
+            if not self.targets.wanted(path, bool(mask & IN_ISDIR)):
+                continue
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    # New subfolder of a suite: watch it as well / 스위트의 새 하위 폴더도 감시
+                    for root, subdirs, _ in os.walk(path):
+                        self._add(root)
+                continue
+            changed.add(path)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+class PollingWatcher:
+    def __init__(self, paths, suffixes=None):
+        self.targets = _Targets(paths, suffixes)
+        self.state = self._scan()
+
+    def _scan(self):
+        state = {}
+        paths = set(self.targets.files)
+        for directory in self.targets.dirs:
+            for root, subdirs, files in os.walk(directory):
+                subdirs[:] = [name for name in subdirs if not _ignored(name)]
+                paths.update(path for path in (os.path.join(root, name) for name in files) if self.targets.wanted(path))
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            state[path] = (st.st_mtime_ns, st.st_size)
+        return state
+
+    def read(self, timeout):
+        time.sleep(min(timeout, POLL_INTERVAL))
+        state = self._scan()
+        changed = {path for path in state.keys() | self.state.keys() if state.get(path) != self.state.get(path)}
+        self.state = state
+        return changed
+
+    def close(self):
+        pass
+
+def watcher(paths, suffixes=None):
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(paths, suffixes)
+        except (OSError, AttributeError):
+            pass # No inotify (old kernel, limits reached) / inotify 없음 (오래된 커널, 한도 초과)
+    return PollingWatcher(paths, suffixes)
+
+def changes(paths, stop=None, suffixes=None):
+    # Yields a set of changed paths per burst of saves, until `stop` (a
+    # threading.Event) is set. A burst ends after DEBOUNCE quiet seconds, so one
+    # save (write, rename, chmod...) or a "save all" gives a single batch.
+    # 연속 저장마다 바뀐 경로 집합을 생성, `stop` (threading.Event)이 설정되면 종료.
+    # DEBOUNCE초 동안 조용하면 한 묶음으로 끝나므로 한 번의 저장(쓰기, 이름 변경, 권한 변경...)이나
+    # "모두 저장"은 한 묶음이 됨.
+    source = watcher(paths, suffixes)
+    try:
+        while stop is None or not stop.is_set():
+            batch = source.read(STOP_POLL)
+            if not batch:
+                continue
+            while True:
+                more = source.read(DEBOUNCE)
+                if not more:
+                    break
+                batch |= more
+            yield batch
+    finally:
+        source.close()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Lavendar Bench - Backup benchmarks on synthetic source trees
+# Lavendar 벤치 - 합성 원천 폴더로 백업 성능 측정
+# Rheehose (Rhee Creative) 2008-2026
+# Licensed under Apache-2.0
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import statistics
+
+import snapshot
+import telemetry
+from snapshot import get_msg
+
+SEED = 0x1a7e
+BLOCK = 1024 * 1024
+MUTATE_RATIO = 0.01 # Share of files touched before a second run / 두 번째 실행 전 수정할 파일 비율
+DELTA_MIN_MB = 4
+
+# name -> (tiny files, tiny max bytes, huge files, huge MB, nesting depth) at scale 1
+# 이름 -> 배율 1 기준 (작은 파일 수, 작은 파일 최대 크기, 큰 파일 수, 큰 파일 MB, 중첩 깊이)
+SHAPES = {
+    "tiny": (20000, 4096, 0, 0, 2),
+    "huge": (0, 0, 4, 256, 1),
+    "deep": (2000, 2048, 0, 0, 64),
+    "mixed": (5000, 16384, 2, 128, 8),
+}
+
+def _fill(f, size, rnd):
+    # Half random, half repeated blocks: realistic for dedup, cheap to generate.
+    # All bytes come from the seeded `rnd`, so runs stay comparable.
+    # 절반은 무작위, 절반은 반복 블록: 중복 제거에 현실적이고 생성 비용이 낮음.
+    # 모든 바이트는 시드가 정해진 `rnd`에서 나오므로 실행 간 비교 가능
+    pattern = rnd.randbytes(BLOCK)
+    written = 0
+    while written < size:
+        n = min(BLOCK, size - written)
+        f.write(rnd.randbytes(n) if rnd.random() < 0.5 else pattern[:n])
+        written += n
+
+def generate_tree(root, shape, scale=1.0):
+    tiny, tiny_max, huge, huge_mb, depth = SHAPES[shape]
+    rnd = random.Random(SEED)
+    os.makedirs(root, exist_ok=True)
+    dirs = [root]
+    # A chain `depth` levels deep plus a few siblings per level
+    # `depth` 단계 깊이의 사슬과 단계마다 몇 개의 형제 폴더
+    path = root
+    for level in range(depth):
+        path = os.path.join(path, f"d{level:02d}")
+        for sibling in range(3):
+            os.makedirs(os.path.join(path, f"s{sibling}"), exist_ok=True)
+            dirs.append(os.path.join(path, f"s{sibling}"))
+        dirs.append(path)
+    for i in range(int(tiny * scale)):
+        with open(os.path.join(rnd.choice(dirs), f"f{i:06d}.txt"), "wb") as f:
+            f.write(rnd.randbytes(rnd.randint(0, tiny_max)))
+    for i in range(huge):
+        with open(os.path.join(root, f"huge{i:02d}.bin"), "wb") as f:
+            _fill(f, int(huge_mb * scale * BLOCK), rnd)
+    return root
+
+def mutate_tree(root, ratio=MUTATE_RATIO):
+    # Appends to a few small files and rewrites 4 KB inside each large one
+    # 일부 작은 파일에 덧붙이고 큰 파일마다 내부 4KB를 다시 씀
+    rnd = random.Random(SEED + 1)
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        files.extend(os.path.join(dirpath, name) for name in sorted(filenames))
+    for path in files:
+        size = os.path.getsize(path)
+        if size >= BLOCK:
+            with open(path, "r+b") as f:
+                f.seek(rnd.randrange(size - 4096))
+                f.write(rnd.randbytes(4096))
+        elif rnd.random() < ratio:
+            with open(path, "ab") as f:
+                f.write(b"changed\n")
+
+def read_io():
+    # Linux /proc/self/io: wchar = bytes handed to write(), syscr/syscw = read/write calls
+    # 리눅스 /proc/self/io: wchar = write()에 넘긴 바이트, syscr/syscw = 읽기/쓰기 호출 수
+    try:
+        with open("/proc/self/io", "r") as f:
+            return {k: int(v) for k, v in (line.split(": ") for line in f)}
+    except OSError:
+        return None
+
+def disk_usage(path):
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for name in filenames:
+            try:
+                total += os.lstat(os.path.join(dirpath, name)).st_blocks * 512
+            except OSError:
+                pass
+    return total
+
+def measure(func):
+    before = read_io()
+    started = time.perf_counter()
+    func()
+    wall = time.perf_counter() - started
+    after = read_io()
+    result = {"wall": wall, "written": None, "syscalls": None}
+    if before and after:
+        result["written"] = after["wchar"] - before["wchar"]
+        result["syscalls"] = (after["syscr"] - before["syscr"]) + (after["syscw"] - before["syscw"])
+    return result
+
+# Modes: prepare(source, dest) runs unmeasured, run(source, dest) is timed.
+# New copy engines are benchmarked by adding an entry here.
+# 모드: prepare(원천, 대상)은 측정하지 않고, run(원천, 대상)만 측정.
+# 새 복사 엔진은 여기에 항목을 추가해 측정.
+def _snapshot(delta_min_mb=None):
+    return lambda source, dest: snapshot.run_snapshot(source, dest, delta_min_size=snapshot.mb_to_bytes(delta_min_mb))
+
+def _second_run(delta_min_mb=None):
+    def prepare(source, dest):
+        _snapshot(delta_min_mb)(source, dest)
+        mutate_tree(source)
+    return prepare
+
+# Plain snapshots have no incremental mode: "copy-rerun" is a second full copy
+# next to an existing snapshot, the baseline that "delta-incremental" is measured against
+# 일반 스냅샷에는 증분 모드가 없음: "copy-rerun"은 기존 스냅샷 옆에 다시 하는 전체 복사로,
+# "delta-incremental"과 비교할 기준
+MODES = {
+    "copy": (None, _snapshot()),
+    "copy-rerun": (_second_run(), _snapshot()),
+    "delta": (None, _snapshot(DELTA_MIN_MB)),
+    "delta-incremental": (_second_run(DELTA_MIN_MB), _snapshot(DELTA_MIN_MB)),
+}
+
+def default_targets():
+    # tmpfs isolates CPU cost from the disk; the temp dir is usually a real disk
+    # tmpfs는 디스크 영향을 배제, 임시 폴더는 보통 실제 디스크
+    targets = []
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        targets.append("/dev/shm")
+    targets.append(tempfile.gettempdir())
+    return targets
+
+def run_case(target, shape, mode, scale, repeat):
+    prepare, run = MODES[mode]
+    samples = []
+    for _ in range(repeat):
+        work = tempfile.mkdtemp(prefix="lavendar-bench-", dir=target)
+        try:
+            source = generate_tree(os.path.join(work, "src"), shape, scale)
+            dest = os.path.join(work, "dst")
+            if prepare:
+                prepare(source, dest)
+            before = disk_usage(dest) if os.path.isdir(dest) else 0
+            sample = measure(lambda: run(source, dest))
+            sample["disk"] = disk_usage(dest) - before
+            samples.append(sample)
+        finally:
+            shutil.rmtree(work, ignore_errors=True)
+    # Median per metric so one noisy run does not skew the table
+    # 잡음이 큰 실행 하나가 표를 왜곡하지 않도록 지표별 중앙값
+    result = {"target": target, "shape": shape, "mode": mode, "scale": scale, "runs": repeat}
+    for key in ("wall", "written", "syscalls", "disk"):
+        values = [s[key] for s in samples if s[key] is not None]
+        result[key] = statistics.median(values) if values else None
+    return result
+
+def format_row(r):
+    written = telemetry.format_bytes(r["written"]) if r["written"] is not None else "n/a"
+    syscalls = f"{int(r['syscalls'])}" if r["syscalls"] is not None else "n/a"
+    return (
+        f"{r['target'][:18]:<18} {r['shape']:<6} {r['mode']:<17} "
+        f"{r['wall']:>8.3f}s {written:>10} {telemetry.format_bytes(r['disk']):>10} {syscalls:>9}"
+    )
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="cli.py bench", description="Benchmark backup modes on synthetic source trees",
+        epilog="Throttled targets (e.g. a loopback image behind dm-delay or a cgroup io.max limit) need root to set up; mount one and pass it with --target.",
+    )
+    parser.add_argument("--target", action="append", default=[], help="Directory to run in (repeatable, default: /dev/shm and the temp dir)")
+    parser.add_argument("--shape", action="append", choices=sorted(SHAPES), help="Source tree shape (repeatable, default: all)")
+    parser.add_argument("--mode", action="append", choices=list(MODES), help="Backup mode (repeatable, default: all)")
+    parser.add_argument("--scale", type=float, default=0.1, help="Tree size multiplier (1.0 = full size, default: 0.1)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case, the median is reported (default: 3)")
+    parser.add_argument("--json", metavar="FILE", help="Also write results as JSON lines")
+    args = parser.parse_args(argv)
+
+    targets = args.target or default_targets()
+    if read_io() is None:
+        print(get_msg("경고: /proc/self/io가 없어 기록 바이트/시스템 호출은 n/a로 표시됩니다.",
+                      "Warning: /proc/self/io is unavailable, bytes written and syscalls will show n/a."), file=sys.stderr)
+    print(f"{'target':<18} {'shape':<6} {'mode':<17} {'wall':>9} {'written':>10} {'disk':>10} {'syscalls':>9}")
+    out = open(args.json, "w", encoding="utf-8") if args.json else None
+    try:
+        for target in targets:
+            for shape in args.shape or SHAPES:
+                for mode in args.mode or MODES:
+                    result = run_case(target, shape, mode, args.scale, max(1, args.repeat))
+                    print(format_row(result), flush=True)
+                    if out:
+                        out.write(json.dumps(result) + "\n")
+                        out.flush()
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        if out:
+            out.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
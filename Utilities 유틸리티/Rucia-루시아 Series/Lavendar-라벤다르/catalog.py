@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Lavendar Catalog - Per-snapshot SQLite index of files, sizes & hashes
+# Lavendar 카탈로그 - 스냅샷별 파일, 크기, 해시 SQLite 색인
+# Rheehose (Rhee Creative) 2008-2026
+# Licensed under Apache-2.0
+
+import os
+import sqlite3
+
+from delta import CATALOG_NAME, metadata_dir
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT,
+    chunked INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+"""
+
+def catalog_path(snapshot_path):
+    return os.path.join(metadata_dir(snapshot_path), CATALOG_NAME)
+
+def has_catalog(snapshot_path):
+    return os.path.exists(catalog_path(snapshot_path))
+
+def write_catalog(snapshot_path, source, rows):
+    # rows: (rel, stat, sha256, chunked); one transaction, written before publish
+    # rows: (상대경로, stat, sha256, 청크 여부), 게시 전 단일 트랜잭션으로 기록
+    path = catalog_path(snapshot_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    if os.path.exists(tmp):
+        os.remove(tmp)
+    conn = sqlite3.connect(tmp)
+    try:
+        # The file is renamed into place, so no journal is needed
+        # 파일은 이름 변경으로 게시되므로 저널이 필요 없음
+        conn.execute("PRAGMA journal_mode=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+        with conn:
+            conn.executescript(SCHEMA)
+            conn.executemany("INSERT INTO meta VALUES (?, ?)", [("source", source), ("version", "1")])
+            conn.executemany(
+                "INSERT INTO files VALUES (?, ?, ?, ?, ?)",
+                ((rel.replace(os.sep, "/"), st.st_size, st.st_mtime_ns, digest, int(bool(chunked))) for rel, st, digest, chunked in rows),
+            )
+    finally:
+        conn.close()
+    with open(tmp, "rb+") as f:
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def chunked_paths(snapshot_path):
+    # Relative paths (OS separators) stored as chunk manifests / 청크 매니페스트로 저장된 상대경로 (OS 구분자)
+    conn = open_catalog(snapshot_path)
+    try:
+        return {path.replace("/", os.sep) for path, in conn.execute("SELECT path FROM files WHERE chunked")}
+    finally:
+        conn.close()
+
+def open_catalog(snapshot_path):
+    # Read-only URI so a query never creates an empty catalog by accident
+    # 조회 중 빈 카탈로그가 생기지 않도록 읽기 전용 URI로 열기
+    path = catalog_path(snapshot_path)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"no catalog in {snapshot_path}")
+    return sqlite3.connect(f"file:{_quote(path)}?mode=ro", uri=True)
+
+def _quote(path):
+    return path.replace("%", "%25").replace("?", "%3f").replace("#", "%23")
+
+def diff_snapshots(old_path, new_path):
+    # Yields (change, path, old_row, new_row), change in added/removed/modified.
+    # Both catalogs are joined inside SQLite; neither tree is walked.
+    # (변경, 경로, 이전 행, 새 행) 생성, 변경은 added/removed/modified.
+    # 두 카탈로그를 SQLite 안에서 조인하며 폴더는 순회하지 않음.
+    conn = open_catalog(new_path)
+    try:
+        conn.execute("ATTACH DATABASE ? AS old", (f"file:{_quote(catalog_path(old_path))}?mode=ro",))
+        query = """
+            SELECT 'removed', o.path, o.size, o.mtime_ns, o.sha256, NULL, NULL, NULL
+              FROM old.files o LEFT JOIN main.files n ON n.path = o.path WHERE n.path IS NULL
+            UNION ALL
+            SELECT 'added', n.path, NULL, NULL, NULL, n.size, n.mtime_ns, n.sha256
+              FROM main.files n LEFT JOIN old.files o ON o.path = n.path WHERE o.path IS NULL
+            UNION ALL
+            SELECT 'modified', n.path, o.size, o.mtime_ns, o.sha256, n.size, n.mtime_ns, n.sha256
+              FROM main.files n JOIN old.files o ON o.path = n.path
+             WHERE CASE WHEN o.sha256 IS NOT NULL AND n.sha256 IS NOT NULL
+                        THEN o.sha256 != n.sha256
+                        ELSE o.size != n.size OR o.mtime_ns != n.mtime_ns END
+            ORDER BY 2
+        """
+        for change, path, *values in conn.execute(query):
+            old_row = dict(zip(("size", "mtime_ns", "sha256"), values[:3])) if change != "added" else None
+            new_row = dict(zip(("size", "mtime_ns", "sha256"), values[3:])) if change != "removed" else None
+            yield change, path, old_row, new_row
+    finally:
+        conn.close()
+
+def lookup(snapshot_path, rel_path):
+    conn = open_catalog(snapshot_path)
+    try:
+        row = conn.execute("SELECT size, mtime_ns, sha256 FROM files WHERE path = ?", (rel_path,)).fetchone()
+    finally:
+        conn.close()
+    return dict(zip(("size", "mtime_ns", "sha256"), row)) if row else None
+
+def _changed(old, new):
+    # Hashes decide when both sides have one, else size + mtime (same rule as diff)
+    # 양쪽에 해시가 있으면 해시로, 없으면 크기 + mtime으로 판정 (diff와 같은 규칙)
+    if old["sha256"] and new["sha256"]:
+        return old["sha256"] != new["sha256"]
+    return (old["size"], old["mtime_ns"]) != (new["size"], new["mtime_ns"])
+
+def file_history(snapshots, rel_path):
+    # Yields (snapshot, change, row) for each snapshot where rel_path changed;
+    # one primary-key lookup per snapshot catalog
+    # rel_path가 바뀐 스냅샷마다 (스냅샷, 변경, 행) 생성, 카탈로그당 기본 키 조회 한 번
+    rel_path = rel_path.replace(os.sep, "/").strip("/")
+    previous = None
+    for snap in snapshots:
+        if not has_catalog(snap):
+            continue
+        row = lookup(snap, rel_path)
+        if row is None:
+            if previous is not None:
+                yield snap, "deleted", None
+            previous = None
+            continue
+        if previous is None:
+            yield snap, "added", row
+        elif _changed(previous, row):
+            yield snap, "changed", row
+        previous = row
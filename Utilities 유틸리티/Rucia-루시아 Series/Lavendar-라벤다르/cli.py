@@ -4,12 +4,20 @@
 # Rheehose (Rhee Creative) 2008-2026
 
 import os
-import shutil
 import time
 import datetime
 import sys
 import argparse
 import locale
+import json
+import socket
+
+import bench
+import catalog
+import daemon
+import ignore
+import snapshot
+import telemetry
 
 def get_msg(ko_msg, en_msg):
     try:
@@ -24,21 +32,40 @@ def log(message):
     timestamp = datetime.datetime.now().strftime("[%H:%M:%S]")
     print(f"{timestamp} {message}")
 
-def run_backup(source, dest, keep=10):
+def print_status(event):
+    # Rewrite a single terminal line in place / 터미널 한 줄을 제자리에서 갱신
+    line = telemetry.format_status(event)
+    pad = max(0, print_status.width - len(line))
+    print_status.width = len(line)
+    end = "\n" if event["phase"] in ("done", "failed") else ""
+    sys.stdout.write(f"\r{line}{' ' * pad}{end}")
+    sys.stdout.flush()
+    if end:
+        print_status.width = 0
+print_status.width = 0
+
+def run_backup(source, dest, keep=10, exclude=None, delta_min_mb=None):
     try:
         if not os.path.exists(source):
             print(get_msg(f"오류: 원천 디렉토리 '{source}'가 존재하지 않습니다.", f"Error: Source directory '{source}' does not exist."))
             return False
         
-        if not os.path.exists(dest):
-            os.makedirs(dest)
-            
-        now = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        target_path = os.path.join(dest, f"backup_{now}")
-        
-        log(get_msg(f"{os.path.basename(target_path)}로 백업을 시작합니다...", f"Starting backup to {os.path.basename(target_path)}..."))
-        shutil.copytree(source, target_path)
-        log(get_msg("백업 성공.", "Backup Successful."))
+        log(get_msg(f"{os.path.basename(os.path.abspath(dest))}로 백업을 시작합니다...", f"Starting backup to {os.path.basename(os.path.abspath(dest))}..."))
+        # Written to a .partial staging folder, renamed on success / .partial 스테이징 폴더에 기록 후 성공 시 이름 변경
+        # .lavendarignore + --exclude, compiled once per run / 실행마다 한 번 컴파일
+        matcher = ignore.load_matcher(source, exclude)
+        # Live status line on a terminal, JSON-lines metrics always / 터미널에서는 상태 줄, 지표 파일은 항상 기록
+        tracker = telemetry.ProgressTracker(print_status if sys.stdout.isatty() else None, telemetry.metrics_path(dest))
+        try:
+            target_path = snapshot.run_snapshot(
+                source, dest, log=log, matcher=matcher, progress=tracker,
+                delta_min_size=snapshot.mb_to_bytes(delta_min_mb),
+            )
+        except BaseException:
+            tracker.finish("failed")
+            raise
+        tracker.finish("ok", target_path)
+        log(get_msg(f"백업 성공: {os.path.basename(target_path)}", f"Backup Successful: {os.path.basename(target_path)}"))
         
         # Cleanup
         cleanup_old_backups(dest, keep)
@@ -49,32 +76,151 @@ def run_backup(source, dest, keep=10):
 
 def cleanup_old_backups(dest, keep):
     try:
-        backups = [os.path.join(dest, d) for d in os.listdir(dest) if d.startswith("backup_")]
-        backups.sort(key=os.path.getmtime)
-        
-        while len(backups) > keep:
-            oldest = backups.pop(0)
-            shutil.rmtree(oldest)
+        for oldest in snapshot.prune_snapshots(dest, keep):
             log(f"{get_msg('오래된 백업 제거됨', 'Removed old backup')}: {os.path.basename(oldest)}")
     except Exception as e:
         log(f"{get_msg('정리 오류', 'Cleanup Error')}: {str(e)}")
 
+def cmd_daemon(argv):
+    parser = argparse.ArgumentParser(prog="cli.py daemon", description="Run Lavendar as a long-lived backup service with a control socket")
+    parser.add_argument("--config", default=daemon.CONFIG_FILE, help=f"JSON config file re-read on reload (default: {daemon.CONFIG_FILE})")
+    parser.add_argument("--source", help="Source directory to backup (overrides config)")
+    parser.add_argument("--dest", help="Destination directory for backups (overrides config)")
+    parser.add_argument("--interval", type=int, help="Backup interval in minutes, 0 = only on trigger (overrides config)")
+    parser.add_argument("--keep", type=int, help="Number of backups to keep (overrides config)")
+    parser.add_argument("--exclude", action="append", metavar="PATTERN", help="gitignore-style pattern to skip (overrides config)")
+    parser.add_argument("--delta-min-mb", type=float, help="Store files of at least this many MB as deduplicated chunks (overrides config)")
+    parser.add_argument("--socket", help="Control socket path")
+    args = parser.parse_args(argv)
+
+    if not hasattr(socket, "AF_UNIX"):
+        print(get_msg("오류: 데몬 모드는 유닉스 도메인 소켓이 필요합니다.", "Error: daemon mode requires Unix domain sockets."))
+        return 1
+    overrides = {"source": args.source, "dest": args.dest, "interval": args.interval, "keep": args.keep, "exclude": args.exclude, "delta_min_mb": args.delta_min_mb}
+    try:
+        service = daemon.BackupDaemon(args.config, overrides, args.socket)
+        service.serve()
+    except (OSError, ValueError, RuntimeError) as e:
+        log(f"{get_msg('오류', 'ERROR')}: {str(e)}")
+        return 1
+    return 0
+
+def cmd_ctl(argv):
+    parser = argparse.ArgumentParser(prog="cli.py ctl", description="Control a running Lavendar daemon")
+    parser.add_argument("command", choices=daemon.COMMANDS)
+    parser.add_argument("--socket", help="Control socket path")
+    args = parser.parse_args(argv)
+
+    try:
+        reply = daemon.send_command(args.command, args.socket)
+    except (OSError, ValueError) as e:
+        print(get_msg(f"오류: 데몬에 연결할 수 없습니다 ({e})", f"Error: cannot reach the daemon ({e})"))
+        return 1
+    print(json.dumps(reply, indent=2, ensure_ascii=False))
+    return 0 if reply.get("ok") else 1
+
+def cmd_restore(argv):
+    parser = argparse.ArgumentParser(prog="cli.py restore", description="Restore a snapshot to a plain folder, reassembling chunked files")
+    parser.add_argument("snapshot", help="Snapshot folder (backup_<ts>) inside the backup destination")
+    parser.add_argument("target", help="Folder to restore into")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.snapshot):
+        print(get_msg(f"오류: 스냅샷 '{args.snapshot}'를 찾을 수 없습니다.", f"Error: Snapshot '{args.snapshot}' not found."))
+        return 1
+    try:
+        count = snapshot.restore_snapshot(args.snapshot, args.target)
+    except (OSError, ValueError, catalog.sqlite3.Error) as e:
+        log(f"{get_msg('오류', 'ERROR')}: {str(e)}")
+        return 1
+    log(get_msg(f"{count}개 파일 복원 완료: {args.target}", f"Restored {count} files to {args.target}"))
+    return 0
+
+def resolve_snapshot(dest, ref):
+    # Name, path, or index into the snapshot list (-1 = newest)
+    # 이름, 경로 또는 스냅샷 목록 인덱스 (-1 = 최신)
+    snaps = snapshot.list_snapshots(dest)
+    try:
+        return snaps[int(ref)]
+    except ValueError:
+        pass
+    except IndexError:
+        raise ValueError(get_msg(f"스냅샷 번호 범위 초과: {ref}", f"No snapshot at index {ref}"))
+    path = ref if os.path.isdir(ref) else os.path.join(dest, ref)
+    if not os.path.isdir(path):
+        raise ValueError(get_msg(f"스냅샷을 찾을 수 없습니다: {ref}", f"Snapshot not found: {ref}"))
+    return path
+
+def cmd_diff(argv):
+    parser = argparse.ArgumentParser(prog="cli.py diff", description="List files added, removed or modified between two snapshots (from their catalogs)")
+    parser.add_argument("--dest", required=True, help="Backup destination")
+    parser.add_argument("old", nargs="?", default="-2", help="Older snapshot: name, path or index (default: -2)")
+    parser.add_argument("new", nargs="?", default="-1", help="Newer snapshot: name, path or index (default: -1, newest)")
+    args = parser.parse_args(argv)
+
+    try:
+        old, new = resolve_snapshot(args.dest, args.old), resolve_snapshot(args.dest, args.new)
+        counts = {"added": 0, "removed": 0, "modified": 0}
+        marks = {"added": "+", "removed": "-", "modified": "M"}
+        for change, path, old_row, new_row in catalog.diff_snapshots(old, new):
+            counts[change] += 1
+            row = new_row or old_row
+            print(f"{marks[change]} {path} ({telemetry.format_bytes(row['size'])})")
+    except (OSError, ValueError, catalog.sqlite3.Error) as e:
+        print(f"{get_msg('오류', 'Error')}: {e}")
+        return 1
+    print(f"{os.path.basename(old)} -> {os.path.basename(new)}: "
+          f"{counts['added']} added, {counts['removed']} removed, {counts['modified']} modified")
+    return 0
+
+def cmd_log(argv):
+    parser = argparse.ArgumentParser(prog="cli.py log", description="Show the snapshots in which a file was added, changed or deleted (from their catalogs)")
+    parser.add_argument("--dest", required=True, help="Backup destination")
+    parser.add_argument("path", help="File path relative to the backup source")
+    args = parser.parse_args(argv)
+
+    found = False
+    try:
+        for snap, change, row in catalog.file_history(snapshot.list_snapshots(args.dest), args.path):
+            found = True
+            detail = f"{telemetry.format_bytes(row['size'])} sha256:{(row['sha256'] or '?')[:12]}" if row else ""
+            print(f"{os.path.basename(snap)}  {change:<8} {detail}".rstrip())
+    except (OSError, catalog.sqlite3.Error) as e:
+        print(f"{get_msg('오류', 'Error')}: {e}")
+        return 1
+    if not found:
+        print(get_msg(f"어떤 스냅샷에도 '{args.path}' 기록이 없습니다.", f"'{args.path}' does not appear in any snapshot."))
+        return 1
+    return 0
+
+def cmd_bench(argv):
+    return bench.main(argv)
+
+# Subcommands; anything else is the classic --source/--dest invocation
+# 하위 명령, 그 외에는 기존 --source/--dest 방식
+SUBCOMMANDS = {"daemon": cmd_daemon, "ctl": cmd_ctl, "restore": cmd_restore, "diff": cmd_diff, "log": cmd_log, "bench": cmd_bench}
+
 def main():
-    parser = argparse.ArgumentParser(description="Lavendar CLI - Auto-Backup Tool")
+    if len(sys.argv) > 1 and sys.argv[1] in SUBCOMMANDS:
+        sys.exit(SUBCOMMANDS[sys.argv[1]](sys.argv[2:]))
+
+    parser = argparse.ArgumentParser(description="Lavendar CLI - Auto-Backup Tool", epilog="Subcommands: daemon, ctl, restore, diff, log, bench (see 'cli.py <subcommand> --help')")
     parser.add_argument("--source", required=True, help="Source directory to backup")
     parser.add_argument("--dest", required=True, help="Destination directory for backups")
     parser.add_argument("--interval", type=int, default=0, help="Backup interval in minutes (0 for one-time)")
     parser.add_argument("--keep", type=int, default=10, help="Number of backups to keep")
+    parser.add_argument("--exclude", action="append", default=[], metavar="PATTERN", help="gitignore-style pattern to skip (repeatable, added after .lavendarignore)")
+    parser.add_argument("--delta-min-mb", type=float, help="Store files of at least this many MB as deduplicated chunks (restore with 'cli.py restore')")
     
     args = parser.parse_args()
     
     if args.interval == 0:
-        run_backup(args.source, args.dest, args.keep)
+        run_backup(args.source, args.dest, args.keep, args.exclude, args.delta_min_mb)
     else:
         log(get_msg(f"지속적인 백업 보호 시작 ({args.interval}분마다)...", f"Starting continuous backup protection (every {args.interval} min)..."))
         try:
             while True:
-                run_backup(args.source, args.dest, args.keep)
+                run_backup(args.source, args.dest, args.keep, args.exclude, args.delta_min_mb)
                 time.sleep(args.interval * 60)
         except KeyboardInterrupt:
             log(get_msg("사용자에 의해 백업 보호가 중지되었습니다.", "Backup protection stopped by user."))
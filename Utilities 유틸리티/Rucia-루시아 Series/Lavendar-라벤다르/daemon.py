@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Lavendar Daemon - Long-lived backup service with a control socket
+# Lavendar 데몬 - 제어 소켓을 갖춘 상주형 백업 서비스
+# Rheehose (Rhee Creative) 2008-2026
+# Licensed under Apache-2.0
+
+import os
+import json
+import time
+import signal
+import socket
+import datetime
+import threading
+import socketserver
+
+import ignore
+import snapshot
+import telemetry
+from snapshot import get_msg
+
+APP_DIR = os.path.join(os.path.expanduser("~"), ".lavendar")
+CONFIG_FILE = os.path.join(APP_DIR, "config.json")
+DEFAULT_CONFIG = {"source": None, "dest": None, "interval": 5, "keep": 10, "exclude": [], "delta_min_mb": None}
+COMMANDS = ("status", "trigger", "pause", "resume", "reload")
+STOP_GRACE = 30 # Seconds a running snapshot may finish after SIGTERM / SIGTERM 후 진행 중 스냅샷을 마칠 수 있는 시간 (초)
+POLL_SECONDS = 1.0
+
+def default_socket_path():
+    # $XDG_RUNTIME_DIR (systemd user sessions) or ~/.lavendar / $XDG_RUNTIME_DIR 또는 ~/.lavendar
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    return os.path.join(runtime or APP_DIR, "lavendar.sock")
+
+def log(message):
+    # stdout is captured by journald under systemd / systemd에서는 journald가 stdout을 수집
+    timestamp = datetime.datetime.now().strftime("[%H:%M:%S]")
+    print(f"{timestamp} {message}", flush=True)
+
+def load_config(path, overrides=None):
+    config = dict(DEFAULT_CONFIG)
+    if path and os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            config.update(json.load(f))
+    for key, value in (overrides or {}).items():
+        if value is not None:
+            config[key] = value
+    if not config["source"] or not config["dest"]:
+        raise ValueError(get_msg(
+            "source와 dest를 설정 파일 또는 옵션으로 지정해야 합니다.",
+            "source and dest must be set in the config file or on the command line."
+        ))
+    return config
+
+def sd_notify(state):
+    # Minimal sd_notify(3) so Type=notify units know when we are ready
+    # Type=notify 유닛이 준비 시점을 알 수 있도록 하는 최소한의 sd_notify(3)
+    address = os.environ.get("NOTIFY_SOCKET")
+    if not address or not hasattr(socket, "AF_UNIX"):
+        return
+    if address.startswith("@"):
+        address = "\0" + address[1:]
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+            sock.sendto(state.encode("utf-8"), address)
+    except OSError:
+        pass
+
+def send_command(command, socket_path=None, timeout=5.0):
+    # Client side: one JSON request line, one JSON reply line
+    # 클라이언트: JSON 요청 한 줄, JSON 응답 한 줄
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path or default_socket_path())
+        sock.sendall((json.dumps({"cmd": command}) + "\n").encode("utf-8"))
+        with sock.makefile("r", encoding="utf-8") as f:
+            return json.loads(f.readline())
+
+def is_running(socket_path=None):
+    try:
+        send_command("status", socket_path, timeout=1.0)
+        return True
+    except (OSError, ValueError):
+        return False
+
+class ControlHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+            reply = self.server.daemon.handle_command(request.get("cmd"))
+        except (ValueError, AttributeError) as e:
+            reply = {"ok": False, "error": str(e)}
+        self.wfile.write((json.dumps(reply) + "\n").encode("utf-8"))
+
+class ControlServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+class BackupDaemon:
+    def __init__(self, config_path=CONFIG_FILE, overrides=None, socket_path=None):
+        self.config_path = config_path
+        self.overrides = overrides or {}
+        self.socket_path = socket_path or default_socket_path()
+        self.config = load_config(config_path, self.overrides)
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self.cancel = threading.Event()
+        self.state = "idle"
+        self.paused = False
+        self.trigger_requested = False
+        self.stop_requested = False
+        self.reload_requested = False
+        self.stop_deadline = None
+        self.next_run = time.monotonic()
+        self.last = {"status": None, "snapshot": None, "finished": None, "error": None}
+        self.progress = None
+        self.server = None
+
+    # --- Control socket / 제어 소켓 ---
+    def handle_command(self, cmd):
+        with self.lock:
+            if cmd == "status":
+                return {"ok": True, **self.status()}
+            if cmd == "trigger":
+                self.trigger_requested = True
+            elif cmd == "pause":
+                self.paused = True
+            elif cmd == "resume":
+                self.paused = False
+                self.next_run = min(self.next_run, time.monotonic())
+            elif cmd == "reload":
+                try:
+                    self.config = load_config(self.config_path, self.overrides)
+                except (OSError, ValueError) as e:
+                    return {"ok": False, "error": str(e)}
+                log(get_msg("설정을 다시 불러왔습니다.", "Configuration reloaded."))
+            else:
+                return {"ok": False, "error": f"unknown command: {cmd} (expected one of {', '.join(COMMANDS)})"}
+        self.wake.set()
+        return {"ok": True}
+
+    def status(self):
+        next_in = None
+        if not self.paused and self.config["interval"] > 0:
+            next_in = max(0.0, round(self.next_run - time.monotonic(), 1))
+        return {
+            "pid": os.getpid(),
+            "state": "paused" if self.paused and self.state == "idle" else self.state,
+            "paused": self.paused,
+            "next_run_in": next_in,
+            "last": self.last,
+            "progress": self.progress,
+            "config": self.config,
+        }
+
+    def start_server(self):
+        if is_running(self.socket_path):
+            raise RuntimeError(get_msg(
+                f"이미 실행 중인 데몬이 있습니다: {self.socket_path}",
+                f"A daemon is already listening on {self.socket_path}"
+            ))
+        # Stale socket from a crash / 비정상 종료로 남은 소켓
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        os.makedirs(os.path.dirname(self.socket_path), exist_ok=True)
+        old_umask = os.umask(0o177)
+        try:
+            self.server = ControlServer(self.socket_path, ControlHandler)
+        finally:
+            os.umask(old_umask)
+        self.server.daemon = self
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    # --- Lifecycle / 생명주기 ---
+    def on_signal(self, signum, frame):
+        # Plain attribute writes only: Event/Lock calls could deadlock inside a handler.
+        # The main loop and the watchdog thread poll these flags.
+        # 핸들러 안에서는 단순 속성 기록만 수행 (Event/Lock 호출은 교착 위험), 메인 루프와 감시 스레드가 확인
+        if hasattr(signal, "SIGHUP") and signum == signal.SIGHUP:
+            self.reload_requested = True
+            return
+        if self.stop_requested:
+            # Second signal: abandon the snapshot now / 두 번째 신호: 스냅샷 즉시 중단
+            self.stop_deadline = time.monotonic()
+            return
+        self.stop_requested = True
+        self.stop_deadline = time.monotonic() + STOP_GRACE
+
+    def install_signals(self):
+        signal.signal(signal.SIGTERM, self.on_signal)
+        signal.signal(signal.SIGINT, self.on_signal)
+        if hasattr(signal, "SIGHUP"):
+            signal.signal(signal.SIGHUP, self.on_signal)
+
+    def watchdog(self):
+        # Cancels a snapshot that outlives the stop grace period
+        # 종료 유예 시간을 넘긴 스냅샷을 취소
+        while self.state == "running":
+            if self.stop_requested and time.monotonic() >= self.stop_deadline:
+                self.cancel.set()
+                return
+            time.sleep(POLL_SECONDS / 4)
+
+    def serve(self):
+        self.install_signals()
+        self.start_server()
+        log(get_msg(
+            f"Lavendar 데몬 시작 (제어 소켓: {self.socket_path})",
+            f"Lavendar daemon started (control socket: {self.socket_path})"
+        ))
+        sd_notify("READY=1")
+        try:
+            while not self.stop_requested:
+                self.wake.wait(POLL_SECONDS)
+                self.wake.clear()
+                if self.reload_requested:
+                    self.reload_requested = False
+                    self.handle_command("reload")
+                with self.lock:
+                    interval = self.config["interval"]
+                    due = not self.paused and interval > 0 and time.monotonic() >= self.next_run
+                    run_now = self.trigger_requested or due
+                    self.trigger_requested = False
+                if run_now and not self.stop_requested:
+                    self.run_once()
+                    with self.lock:
+                        self.next_run = time.monotonic() + interval * 60
+        finally:
+            sd_notify("STOPPING=1")
+            if self.server:
+                self.server.shutdown()
+                self.server.server_close()
+            try:
+                os.unlink(self.socket_path)
+            except OSError:
+                pass
+            log(get_msg("Lavendar 데몬이 종료되었습니다.", "Lavendar daemon stopped."))
+
+    def on_progress(self, event):
+        self.progress = event
+
+    def run_once(self):
+        with self.lock:
+            config = dict(self.config)
+            self.state = "running"
+        self.cancel.clear()
+        self.progress = None
+        threading.Thread(target=self.watchdog, daemon=True).start()
+        sd_notify("STATUS=backing up")
+        log(get_msg(f"{config['dest']}로 백업을 시작합니다...", f"Starting backup to {config['dest']}..."))
+        tracker = None
+        try:
+            matcher = ignore.load_matcher(config["source"], config["exclude"])
+            tracker = telemetry.ProgressTracker(self.on_progress, telemetry.metrics_path(config["dest"]))
+            target = snapshot.run_snapshot(
+                config["source"], config["dest"], log=log, matcher=matcher, progress=tracker,
+                cancel=self.cancel, delta_min_size=snapshot.mb_to_bytes(config["delta_min_mb"]),
+            )
+            tracker.finish("ok", target)
+            for oldest in snapshot.prune_snapshots(config["dest"], config["keep"]):
+                log(f"{get_msg('오래된 백업 제거됨', 'Removed old backup')}: {os.path.basename(oldest)}")
+            self.last = {"status": "ok", "snapshot": os.path.basename(target), "finished": datetime.datetime.now().isoformat(timespec="seconds"), "error": None}
+            log(get_msg(f"백업 성공: {os.path.basename(target)}", f"Backup Successful: {os.path.basename(target)}"))
+        except snapshot.SnapshotCancelled as e:
+            # Not published; the staging dir is resumed next time
+            # 게시되지 않음, 스테이징 폴더는 다음 실행에서 재개
+            if tracker:
+                tracker.finish("cancelled")
+            self.last = {"status": "cancelled", "snapshot": None, "finished": datetime.datetime.now().isoformat(timespec="seconds"), "error": str(e)}
+            log(str(e))
+        except Exception as e:
+            if tracker:
+                tracker.finish("failed")
+            self.last = {"status": "failed", "snapshot": None, "finished": datetime.datetime.now().isoformat(timespec="seconds"), "error": str(e)}
+            log(f"{get_msg('오류', 'ERROR')}: {str(e)}")
+        finally:
+            with self.lock:
+                self.state = "idle"
+            sd_notify("STATUS=idle")
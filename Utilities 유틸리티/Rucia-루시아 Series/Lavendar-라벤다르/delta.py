@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Lavendar Delta Store - Content-defined chunking for large files
+# Lavendar 델타 저장소 - 대용량 파일을 위한 내용 기반 청킹
+# Rheehose (Rhee Creative) 2008-2026
+# Licensed under Apache-2.0
+
+import os
+import re
+import json
+import shutil
+import random
+import hashlib
+
+MANIFEST_SUFFIX = ".lvchunks"
+CHUNK_DIR = os.path.join(".lavendar", "chunks")
+# Engine files of each snapshot, kept out of the snapshot tree so they can
+# never collide with the user's files: <dest>/.lavendar/snapshots/<name>/
+# 스냅샷별 엔진 파일은 사용자 파일과 절대 겹치지 않도록 스냅샷 폴더 밖에 보관
+SNAPSHOT_META_DIR = os.path.join(".lavendar", "snapshots")
+CHUNK_REFS = "chunkrefs" # Per-snapshot list of referenced chunks / 스냅샷별 참조 청크 목록
+CATALOG_NAME = "catalog.sqlite"
+TMP_SUFFIX = ".lvtmp"
+
+# Chunk geometry / 청크 크기
+MIN_CHUNK = 64 * 1024
+AVG_CHUNK = 256 * 1024
+MAX_CHUNK = 1024 * 1024
+READ_SIZE = 8 * 1024 * 1024
+
+# Boundaries are placed right after a 4-byte "anchor": a run of bytes drawn
+# from four byte classes. The classes are tuned per file from a byte histogram
+# so anchors occur about once per AVG_CHUNK, and are stored in the manifest so
+# every later version of the file is cut at the same content positions.
+# Matching runs inside the C regex engine, not a per-byte Python loop.
+# 경계는 4바이트 "앵커"(네 개의 바이트 클래스에서 뽑은 연속 바이트) 직후에 놓임.
+# 클래스는 파일별 바이트 히스토그램으로 조정되어 AVG_CHUNK마다 한 번꼴로 등장하며,
+# 매니페스트에 저장되어 이후 버전도 같은 내용 위치에서 잘림.
+# 매칭은 파이썬 바이트 루프가 아닌 C 정규식 엔진에서 수행.
+ANCHOR_WIDTH = 4
+ANCHOR_SEED = 0x1a7e
+SAMPLE_SIZE = 1024 * 1024
+
+def choose_anchor(path):
+    counts = [0] * 256
+    total = 0
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        for offset in (0, max(0, size // 2 - SAMPLE_SIZE // 2)):
+            f.seek(offset)
+            for b, n in _histogram(f.read(SAMPLE_SIZE)):
+                counts[b] += n
+                total += n
+    # Per-class hit probability so that 4 hits in a row ~ 1 / (AVG - MIN)
+    # 4연속 적중 확률이 약 1 / (AVG - MIN)이 되도록 하는 클래스별 확률
+    target = (1.0 / (AVG_CHUNK - MIN_CHUNK)) ** (1.0 / ANCHOR_WIDTH)
+    rnd = random.Random(ANCHOR_SEED)
+    anchor = []
+    for _ in range(ANCHOR_WIDTH):
+        order = list(range(256))
+        rnd.shuffle(order)
+        chosen, mass = [], 0.0
+        for b in order:
+            if total and counts[b] == 0:
+                continue
+            chosen.append(b)
+            mass += counts[b] / total if total else 1 / 256
+            if mass >= target:
+                break
+        anchor.append(bytes(sorted(chosen)).hex())
+    return anchor
+
+def _histogram(data):
+    if not data:
+        return []
+    # bytes.count runs in C; 256 passes over 1 MB beats a Python loop
+    # bytes.count는 C에서 실행, 1MB에 256번 훑는 것이 파이썬 루프보다 빠름
+    return [(b, data.count(bytes((b,)))) for b in range(256)]
+
+def compile_anchor(anchor):
+    parts = []
+    for cls in anchor:
+        parts.append(b"[" + b"".join(re.escape(bytes((b,))) for b in bytes.fromhex(cls)) + b"]")
+    return re.compile(b"".join(parts))
+
+def iter_chunks(f, pattern):
+    buf = b""
+    eof = False
+    while not eof:
+        data = f.read(READ_SIZE)
+        eof = not data
+        buf += data
+        pos = 0
+        while len(buf) - pos >= MAX_CHUNK or (eof and pos < len(buf)):
+            limit = min(pos + MAX_CHUNK, len(buf))
+            m = pattern.search(buf, pos + MIN_CHUNK, limit) if pos + MIN_CHUNK < limit else None
+            cut = m.end() if m else limit
+            yield buf[pos:cut]
+            pos = cut
+        buf = buf[pos:]
+
+class ChunkStore:
+    # Content-addressed: <dest>/.lavendar/chunks/ab/ab12...  / 내용 주소 기반 저장소
+    def __init__(self, dest):
+        self.root = os.path.join(dest, CHUNK_DIR)
+
+    def path(self, digest):
+        return os.path.join(self.root, digest[:2], digest)
+
+    def put(self, digest, data):
+        # Returns bytes actually written (0 when deduplicated) / 실제 기록한 바이트 수 (중복이면 0)
+        path = self.path(digest)
+        if os.path.exists(path):
+            return 0
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + TMP_SUFFIX
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        return len(data)
+
+    def get(self, digest):
+        with open(self.path(digest), "rb") as f:
+            data = f.read()
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise IOError(f"corrupt chunk {digest}")
+        return data
+
+def metadata_dir(snapshot_path):
+    snapshot_path = os.path.abspath(snapshot_path)
+    return os.path.join(os.path.dirname(snapshot_path), SNAPSHOT_META_DIR, os.path.basename(snapshot_path))
+
+def load_manifest(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def manifest_matches(manifest, st):
+    return manifest.get("size") == st.st_size and manifest.get("mtime_ns") == st.st_mtime_ns
+
+def store_file(src, manifest_path, store, st, anchor=None, progress=None, cancel_check=None):
+    # Chunk src into the store and write its manifest; returns (manifest, bytes_written)
+    # src를 청크로 저장소에 넣고 매니페스트 기록, (매니페스트, 기록 바이트) 반환
+    anchor = anchor or choose_anchor(src)
+    pattern = compile_anchor(anchor)
+    chunks, written = [], 0
+    file_hash = hashlib.sha256()
+    with open(src, "rb") as f:
+        for data in iter_chunks(f, pattern):
+            file_hash.update(data)
+            digest = hashlib.sha256(data).hexdigest()
+            written += store.put(digest, data)
+            chunks.append([digest, len(data)])
+            if progress:
+                progress.advance(len(data))
+            if cancel_check:
+                cancel_check()
+    manifest = {"version": 1, "size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": file_hash.hexdigest(), "anchor": anchor, "chunks": chunks}
+    tmp = manifest_path + TMP_SUFFIX
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    shutil.copystat(src, tmp)
+    os.replace(tmp, manifest_path)
+    return manifest, written
+
+def restore_file(manifest_path, out_path, store):
+    manifest = load_manifest(manifest_path)
+    tmp = out_path + TMP_SUFFIX
+    with open(tmp, "wb") as f:
+        for digest, _ in manifest["chunks"]:
+            f.write(store.get(digest))
+    shutil.copystat(manifest_path, tmp)
+    os.utime(tmp, ns=(manifest["mtime_ns"], manifest["mtime_ns"]))
+    os.replace(tmp, out_path)
+
+def read_refs(snapshot_path):
+    try:
+        with open(os.path.join(metadata_dir(snapshot_path), CHUNK_REFS), "r", encoding="utf-8") as f:
+            return {line.strip() for line in f if line.strip()}
+    except OSError:
+        return set()
+
+def write_refs(snapshot_path, refs):
+    if refs:
+        os.makedirs(metadata_dir(snapshot_path), exist_ok=True)
+        with open(os.path.join(metadata_dir(snapshot_path), CHUNK_REFS), "w", encoding="utf-8") as f:
+            f.writelines(f"{digest}\n" for digest in sorted(refs))
+
+def manifest_refs(path):
+    return {digest for digest, _ in load_manifest(path)["chunks"]}
+
+def collect_garbage(dest, snapshots, partials=()):
+    # Mark & sweep: published snapshots list their refs; staging dirs are scanned
+    # 마크 & 스윕: 게시된 스냅샷은 참조 목록을, 스테이징 폴더는 직접 스캔
+    root = os.path.join(dest, CHUNK_DIR)
+    if not os.path.isdir(root):
+        return 0
+    live = set()
+    for snap in snapshots:
+        live |= read_refs(snap)
+    for partial in partials:
+        for dirpath, _, files in os.walk(partial):
+            for name in files:
+                if name.endswith(MANIFEST_SUFFIX):
+                    # May be a user file with the same suffix: extra refs only keep chunks alive
+                    # 같은 접미사의 사용자 파일일 수 있음: 남는 참조는 청크를 보존할 뿐
+                    try:
+                        live |= manifest_refs(os.path.join(dirpath, name))
+                    except (OSError, ValueError, KeyError, TypeError):
+                        pass
+    removed = 0
+    for prefix in os.listdir(root):
+        folder = os.path.join(root, prefix)
+        for name in os.listdir(folder):
+            if name not in live:
+                os.remove(os.path.join(folder, name))
+                removed += 1
+    return removed
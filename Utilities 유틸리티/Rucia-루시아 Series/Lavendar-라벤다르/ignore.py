@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Lavendar Ignore Rules - gitignore-style exclusion matcher
+# Lavendar 제외 규칙 - gitignore 문법 기반 제외 매처
+# Rheehose (Rhee Creative) 2008-2026
+# Licensed under Apache-2.0
+
+import os
+import re
+
+IGNORE_FILE = ".lavendarignore"
+
+def _translate(pattern):
+    # gitignore glob -> regex body (paths are '/'-separated and relative)
+    # gitignore 글롭 -> 정규식 본문 (경로는 '/' 구분의 상대 경로)
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            if pattern.startswith("**", i) and (i == 0 or pattern[i - 1] == "/"):
+                if pattern.startswith("**/", i):
+                    out.append("(?:.*/)?")
+                    i += 3
+                    continue
+                if i + 2 == n:
+                    out.append(".*")
+                    i += 2
+                    continue
+            while i < n and pattern[i] == "*":
+                i += 1
+            out.append("[^/]*")
+            continue
+        if c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = i + 1
+            if j < n and pattern[j] in "!^":
+                j += 1
+            if j < n and pattern[j] == "]":
+                j += 1
+            while j < n and pattern[j] != "]":
+                j += 1
+            if j >= n:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1:j].replace("\\", "\\\\")
+                if body[:1] in ("!", "^"):
+                    body = "^" + body[1:]
+                out.append(f"(?!/)[{body}]")
+                i = j
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+def parse_rule(line):
+    # Returns (regex, negated, dir_only) or None for blanks and comments
+    # (정규식, 부정 여부, 폴더 전용 여부) 반환, 빈 줄과 주석은 None
+    line = line.rstrip("\n\r")
+    if not line.strip() or line.startswith("#"):
+        return None
+    # Trailing spaces are ignored unless escaped / 이스케이프되지 않은 끝 공백 무시
+    while line.endswith(" ") and not line.endswith("\\ "):
+        line = line[:-1]
+    negated = line.startswith("!")
+    if negated:
+        line = line[1:]
+    elif line.startswith("\\!") or line.startswith("\\#"):
+        line = line[1:]
+    dir_only = line.endswith("/")
+    line = line.rstrip("/")
+    if not line:
+        return None
+    # A slash anywhere but the end anchors the rule to the source root
+    # 끝이 아닌 위치에 슬래시가 있으면 원천 루트 기준으로 고정
+    anchored = "/" in line
+    line = line.lstrip("/")
+    prefix = "" if anchored else "(?:.*/)?"
+    return f"{prefix}{_translate(line)}", negated, dir_only
+
+class IgnoreMatcher:
+    # All rules are folded into a handful of alternation regexes: consecutive
+    # rules of the same polarity share one, and the last matching group wins.
+    # Without '!' rules a lookup is a single regex match.
+    # 모든 규칙을 소수의 정규식으로 합침: 같은 극성의 연속 규칙은 하나로 묶이고
+    # 마지막으로 일치한 그룹이 결정. '!' 규칙이 없으면 정규식 한 번으로 판정.
+    def __init__(self, lines=()):
+        self.rules = [r for r in (parse_rule(line) for line in lines) if r]
+        self.dir_groups = self._compile(self.rules)
+        self.file_groups = self._compile([r for r in self.rules if not r[2]])
+
+    @staticmethod
+    def _compile(rules):
+        groups = []
+        for regex, negated, _ in rules:
+            if groups and groups[-1][1] == negated:
+                groups[-1][0].append(regex)
+            else:
+                groups.append(([regex], negated))
+        # Evaluated last-to-first / 마지막 그룹부터 평가
+        return [(re.compile("^(?:" + "|".join(r) + ")$", re.DOTALL), neg) for r, neg in reversed(groups)]
+
+    def __bool__(self):
+        return bool(self.rules)
+
+    def match(self, rel_path, is_dir=False):
+        if os.sep != "/":
+            rel_path = rel_path.replace(os.sep, "/")
+        for regex, negated in (self.dir_groups if is_dir else self.file_groups):
+            if regex.match(rel_path):
+                return not negated
+        return False
+
+def load_matcher(source, extra_patterns=()):
+    # <source>/.lavendarignore first, then --exclude patterns (later rules win)
+    # <source>/.lavendarignore 먼저, 그 다음 --exclude 패턴 (뒤의 규칙이 우선)
+    lines = []
+    try:
+        with open(os.path.join(source, IGNORE_FILE), "r", encoding="utf-8") as f:
+            lines.extend(f)
+    except OSError:
+        pass
+    lines.extend(extra_patterns or ())
+    return IgnoreMatcher(lines)
+
+def split_patterns(text):
+    # "node_modules/, *.pyc" -> ["node_modules/", "*.pyc"] (GUI entry field / GUI 입력 필드)
+    return [p.strip() for p in text.split(",") if p.strip()]
@@ -6,14 +6,45 @@
 # Licensed under Apache-2.0
 
 import os
-import shutil
-import time
+import queue
+import socket
 import threading
 import datetime
+import logging
+import logging.handlers
 from tkinter import filedialog, messagebox
 import customtkinter as ctk
 import locale
 
+import ignore
+import daemon
+import snapshot
+import telemetry
+
+# Log pipeline limits / 로그 파이프라인 한도
+LOG_VIEW_MAX_LINES = 1000  # On-screen ring buffer / 화면 링 버퍼
+LOG_DRAIN_BATCH = 200      # Lines inserted per drain / 한 번에 삽입할 줄 수
+LOG_DRAIN_MS = 100
+PROGRESS_POLL_MS = 200
+DAEMON_POLL_SECONDS = 1.0 # Status requests while attached to the daemon / 데몬 연결 중 상태 요청 간격
+DELTA_MIN_MB = 64
+LOG_FILE = os.path.join(os.path.expanduser("~"), ".lavendar", "lavendar.log")
+
+def get_file_logger():
+    # Full history goes to a rotating file (4 x 1 MB) / 전체 기록은 회전 파일로 (1MB x 4)
+    logger = logging.getLogger("lavendar")
+    if not logger.handlers:
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        try:
+            os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
+            handler = logging.handlers.RotatingFileHandler(LOG_FILE, maxBytes=1024 * 1024, backupCount=3, encoding="utf-8")
+            handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            logger.addHandler(handler)
+        except OSError:
+            logger.addHandler(logging.NullHandler())
+    return logger
+
 def get_system_lang():
     try:
         lang, _ = locale.getdefaultlocale()
@@ -40,12 +71,20 @@ TRANSLATIONS = {
         'select_both': '원천 폴더와 대상 폴더를 모두 선택하세요! / Select both source and destination folders!',
         'error': '오류 / Error',
         'interval_error': '주기는 숫자여야 합니다! / Interval must be a number!',
+        'exclude': '제외: / Exclude:',
+        'delta': '대용량 파일 델타 저장 / Delta for large files',
+        'exclude_placeholder': 'node_modules/, .venv/, __pycache__/ (+ .lavendarignore)',
         'system_ready': '>>> 시스템 준비 완료. 활성화를 기다리는 중...\n',
         'activated': '백업 보호가 활성화되었습니다 / Backup Protection Activated.',
         'deactivated': '백업 보호가 비활성화되었습니다 / Backup Protection Deactivated.',
         'starting_backup': '백업 시작 중 / Starting backup to ',
         'success': '백업 성공 / Backup Successful.',
-        'removed_old': '오래된 백업 제거됨 / Removed old backup: '
+        'removed_old': '오래된 백업 제거됨 / Removed old backup: ',
+        'daemon_attached': '실행 중인 데몬에 연결됨 (데몬 설정 사용) / Attached to the running daemon (its config is used): ',
+        'daemon_paused': '데몬 백업 일시 중지됨 / Daemon backups paused.',
+        'daemon_result': '데몬 백업 결과 / Daemon backup: ',
+        'daemon_lost': '데몬 연결이 끊겨 이 창에서 직접 백업합니다 / Daemon went away, backing up from this window.',
+        'cancelled': '진행 중인 백업이 취소되었습니다 / Running backup cancelled.'
     },
     'en': {
         'backup': 'BACKUP',
@@ -62,12 +101,20 @@ TRANSLATIONS = {
         'select_both': 'Select both source and destination folders!',
         'error': 'Error',
         'interval_error': 'Interval must be a number!',
+        'exclude': 'Exclude:',
+        'delta': 'Delta for large files',
+        'exclude_placeholder': 'node_modules/, .venv/, __pycache__/ (+ .lavendarignore)',
         'system_ready': '>>> System Ready. Waiting for activation...\n',
         'activated': 'Backup Protection Activated.',
         'deactivated': 'Backup Protection Deactivated.',
         'starting_backup': 'Starting backup to ',
         'success': 'Backup Successful.',
-        'removed_old': 'Removed old backup: '
+        'removed_old': 'Removed old backup: ',
+        'daemon_attached': 'Attached to the running daemon (its config is used): ',
+        'daemon_paused': 'Daemon backups paused.',
+        'daemon_result': 'Daemon backup: ',
+        'daemon_lost': 'Daemon went away, backing up from this window.',
+        'cancelled': 'Running backup cancelled.'
     }
 }
 
@@ -94,12 +141,23 @@ class Lavendar(ctk.CTk):
         self.source_dir = ""
         self.dest_dir = ""
         self.is_running = False
+        self.session = None # Set to end the current session (and cancel its snapshot) / 설정하면 현재 세션 종료 (진행 중 스냅샷 취소)
+        self.attached = False # Driving the daemon over its socket / 소켓으로 데몬을 제어 중
+        self.session_lost = False # Set by a worker, handled on the Tk thread / 워커가 설정, Tk 스레드가 처리
         self.interval_min = 5
+        self.exclude_patterns = []
+        self.delta_min_mb = None
         self.last_backup = "None"
         self.current_lang = get_system_lang()
+        self.log_queue = queue.Queue()
+        self.log_lines = 0
+        self.progress_event = None # Latest event from the worker / 워커의 최신 이벤트
+        self.file_logger = get_file_logger()
         
         # UI Setup / UI 구축
         self.setup_ui()
+        self.after(LOG_DRAIN_MS, self.drain_logs)
+        self.after(PROGRESS_POLL_MS, self.poll_progress)
 
     def setup_ui(self):
         # Sidebar / 사이드바
@@ -152,6 +210,15 @@ class Lavendar(ctk.CTk):
         self.interval_spin = ctk.CTkEntry(self.settings_row, width=60, fg_color=self.secondary_color, border_color="#30363d")
         self.interval_spin.insert(0, "5")
         self.interval_spin.pack(side="left")
+
+        self.exclude_label = ctk.CTkLabel(self.settings_row, text=TRANSLATIONS[self.current_lang]['exclude'], font=("Inter", 13))
+        self.exclude_label.pack(side="left", padx=(20, 10))
+        self.exclude_entry = ctk.CTkEntry(self.settings_row, placeholder_text=TRANSLATIONS[self.current_lang]['exclude_placeholder'], fg_color=self.secondary_color, border_color="#30363d")
+        self.exclude_entry.pack(side="left", fill="x", expand=True, padx=(0, 20))
+
+        # Files >= DELTA_MIN_MB stored as deduplicated chunks / DELTA_MIN_MB 이상 파일은 중복 제거 청크로 저장
+        self.delta_check = ctk.CTkCheckBox(self.settings_row, text=TRANSLATIONS[self.current_lang]['delta'], font=("Inter", 12), fg_color=self.accent_color, hover_color="#2ea043")
+        self.delta_check.pack(side="left", padx=(0, 20))
         
         self.btn_toggle = ctk.CTkButton(self.settings_row, text=TRANSLATIONS[self.current_lang]['activate'], command=self.toggle_session_proxy, fg_color=self.accent_color, hover_color="#2ea043", font=("Inter", 13, "bold"), height=40)
         self.btn_toggle.pack(side="right")
@@ -162,11 +229,19 @@ class Lavendar(ctk.CTk):
         
         self.logs_label = ctk.CTkLabel(self.status_card, text=TRANSLATIONS[self.current_lang]['logs'], font=("Inter", 12, "bold"), text_color=self.dim_text)
         self.logs_label.pack(anchor="w", padx=20, pady=(15, 5))
+
+        # Progress / 진행률
+        self.progress_bar = ctk.CTkProgressBar(self.status_card, progress_color=self.accent_color, fg_color=self.secondary_color)
+        self.progress_bar.set(0)
+        self.progress_bar.pack(fill="x", padx=20, pady=(5, 0))
+        self.progress_label = ctk.CTkLabel(self.status_card, text="", font=("JetBrains Mono", 11), text_color=self.dim_text, anchor="w")
+        self.progress_label.pack(fill="x", padx=20)
         
         self.log_view = ctk.CTkTextbox(self.status_card, fg_color="transparent", font=("JetBrains Mono", 11), text_color="#7ee787")
         self.log_view.pack(fill="both", expand=True, padx=10, pady=10)
         self.log_view.insert("end", TRANSLATIONS[self.current_lang]['system_ready'])
         self.log_view.configure(state="disabled")
+        self.log_lines = 1
 
     def toggle_lang(self):
         self.current_lang = 'en' if self.current_lang == 'ko' else 'ko'
@@ -183,6 +258,8 @@ class Lavendar(ctk.CTk):
         self.source_selector.browse_btn.configure(text=lang['browse'])
         self.dest_selector.browse_btn.configure(text=lang['browse'])
         self.interval_label.configure(text=lang['interval'])
+        self.exclude_label.configure(text=lang['exclude'])
+        self.delta_check.configure(text=lang['delta'])
         self.btn_toggle.configure(text=lang['deactivate'] if self.is_running else lang['activate'])
         self.logs_label.configure(text=lang['logs'])
         self.lang_btn.configure(text=self.current_lang.upper())
@@ -229,43 +306,163 @@ class Lavendar(ctk.CTk):
             self.dest_entry.insert(0, path)
 
     def log(self, message):
-        self.log_view.configure(state="normal")
+        # Safe from any thread: only enqueues, the Tk thread renders
+        # 어느 스레드에서든 안전: 큐에 넣기만 하고 렌더링은 Tk 스레드가 담당
         timestamp = datetime.datetime.now().strftime("[%H:%M:%S]")
-        self.log_view.insert("end", f"{timestamp} {message}\n")
-        self.log_view.see("end")
-        self.log_view.configure(state="disabled")
+        self.log_queue.put(f"{timestamp} {message}")
+        self.file_logger.info(message)
+
+    def drain_logs(self):
+        lines = []
+        try:
+            while len(lines) < LOG_DRAIN_BATCH:
+                lines.append(self.log_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        if lines:
+            self.log_view.configure(state="normal")
+            self.log_view.insert("end", "".join(f"{line}\n" for line in lines))
+            self.log_lines += len(lines)
+            # Bounded ring: drop the oldest lines / 링 버퍼 유지: 가장 오래된 줄 삭제
+            excess = self.log_lines - LOG_VIEW_MAX_LINES
+            if excess > 0:
+                self.log_view.delete("1.0", f"{excess + 1}.0")
+                self.log_lines -= excess
+            self.log_view.see("end")
+            self.log_view.configure(state="disabled")
+
+        # Come back sooner while a backlog remains / 밀린 로그가 있으면 더 빨리 재호출
+        self.after(1 if not self.log_queue.empty() else LOG_DRAIN_MS, self.drain_logs)
+
+    def on_progress(self, event):
+        # Worker thread: just publish the latest event / 워커 스레드: 최신 이벤트만 게시
+        self.progress_event = event
+
+    def poll_progress(self):
+        event, self.progress_event = self.progress_event, None
+        if event:
+            if event["phase"] == "scan" or not event["bytes_total"]:
+                self.progress_bar.set(0 if event["phase"] == "scan" else 1)
+            else:
+                self.progress_bar.set(event["bytes_done"] / event["bytes_total"])
+            self.progress_label.configure(text=telemetry.format_status(event))
+        if self.session_lost:
+            self.session_lost = False
+            if self.is_running:
+                self.toggle_backup()
+        self.after(PROGRESS_POLL_MS, self.poll_progress)
+
+    def daemon_running(self):
+        # The daemon owns scheduling when it is up: the GUI then only drives it
+        # 데몬이 떠 있으면 일정은 데몬이 담당하고 GUI는 제어만 함
+        return hasattr(socket, "AF_UNIX") and daemon.is_running()
 
     def toggle_backup(self):
         if not self.is_running:
-            if not self.source_dir or not self.dest_dir:
-                messagebox.showwarning(TRANSLATIONS[self.current_lang]['warning'], TRANSLATIONS[self.current_lang]['select_both'])
-                return
-            
+            # Read even when attaching: they apply if the daemon goes away
+            # 데몬에 연결할 때도 읽어 둠: 데몬이 사라지면 적용됨
             try:
                 self.interval_min = int(self.interval_spin.get())
             except ValueError:
                 messagebox.showerror(TRANSLATIONS[self.current_lang]['error'], TRANSLATIONS[self.current_lang]['interval_error'])
                 return
+            self.exclude_patterns = ignore.split_patterns(self.exclude_entry.get())
+            self.delta_min_mb = DELTA_MIN_MB if self.delta_check.get() else None
+
+            if self.daemon_running():
+                try:
+                    daemon.send_command("resume")
+                    daemon.send_command("trigger")
+                    config = daemon.send_command("status")["config"]
+                except (OSError, ValueError, KeyError) as e:
+                    messagebox.showerror(TRANSLATIONS[self.current_lang]['error'], str(e))
+                    return
+                self.start_session(attached=True)
+                self.log(f"{TRANSLATIONS[self.current_lang]['daemon_attached']}{config.get('source')} -> {config.get('dest')}")
+                return
+            if not self.source_dir or not self.dest_dir:
+                messagebox.showwarning(TRANSLATIONS[self.current_lang]['warning'], TRANSLATIONS[self.current_lang]['select_both'])
+                return
 
-            self.is_running = True
-            self.btn_toggle.configure(text=TRANSLATIONS[self.current_lang]['deactivate'], fg_color="#f85149", hover_color="#da3633")
+            self.start_session(attached=False)
             self.log(TRANSLATIONS[self.current_lang]['activated'])
-            threading.Thread(target=self.backup_loop, daemon=True).start()
         else:
             self.is_running = False
+            # Ends the session's loop and cancels a running local snapshot
+            # 세션 루프를 끝내고 진행 중인 로컬 스냅샷을 취소
+            self.session.set()
+            if self.attached:
+                try:
+                    daemon.send_command("pause")
+                    self.log(TRANSLATIONS[self.current_lang]['daemon_paused'])
+                except (OSError, ValueError) as e:
+                    self.log(f"ERROR: {str(e)}")
             self.btn_toggle.configure(text=TRANSLATIONS[self.current_lang]['activate'], fg_color=self.accent_color, hover_color="#2ea043")
             self.log(TRANSLATIONS[self.current_lang]['deactivated'])
 
-    def backup_loop(self):
-        while self.is_running:
+    def start_session(self, attached):
+        # One Event per session, so a loop from an earlier session that is
+        # still finishing cannot carry on into this one
+        # 세션마다 Event 하나: 아직 끝나는 중인 이전 세션의 루프가 이번 세션으로 이어지지 않음
+        self.is_running = True
+        self.attached = attached
+        self.session = threading.Event()
+        self.btn_toggle.configure(text=TRANSLATIONS[self.current_lang]['deactivate'], fg_color="#f85149", hover_color="#da3633")
+        target = self.daemon_loop if attached else self.backup_loop
+        threading.Thread(target=target, args=(self.session,), daemon=True).start()
+
+    def daemon_loop(self, stop):
+        # Mirrors the daemon's progress and results; no copying happens here
+        # 데몬의 진행률과 결과를 보여주기만 하고 여기서는 복사하지 않음
+        last = None
+        while not stop.is_set():
             try:
-                # Create timestamped folder / 타임스탬프 폴더 생성
-                now = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-                target_path = os.path.join(self.dest_dir, f"backup_{now}")
-                
-                self.log(f"{TRANSLATIONS[self.current_lang]['starting_backup']}{os.path.basename(target_path)}...")
-                shutil.copytree(self.source_dir, target_path)
-                self.log(TRANSLATIONS[self.current_lang]['success'])
+                status = daemon.send_command("status")
+            except (OSError, ValueError):
+                break
+            if status.get("progress"):
+                self.on_progress(status["progress"])
+            result = status.get("last") or {}
+            if last is not None and result != last and result.get("status"):
+                detail = result.get("snapshot") or result.get("error") or ""
+                self.log(f"{TRANSLATIONS[self.current_lang]['daemon_result']}{result['status']} {detail}".rstrip())
+            last = result
+            stop.wait(DAEMON_POLL_SECONDS)
+        else:
+            return
+        # Daemon gone mid-session: fall back to our own loop if we can
+        # 세션 중 데몬이 사라짐: 가능하면 자체 루프로 대체
+        if self.source_dir and self.dest_dir:
+            self.log(TRANSLATIONS[self.current_lang]['daemon_lost'])
+            self.attached = False
+            self.backup_loop(stop)
+        else:
+            self.session_lost = True
+
+    def backup_loop(self, stop):
+        while not stop.is_set():
+            try:
+                # Staged as backup_<ts>.partial, renamed on success / backup_<ts>.partial로 스테이징 후 성공 시 이름 변경
+                self.log(f"{TRANSLATIONS[self.current_lang]['starting_backup']}{os.path.basename(self.dest_dir)}...")
+                # .lavendarignore is re-read every run / .lavendarignore는 매 실행마다 다시 읽음
+                matcher = ignore.load_matcher(self.source_dir, self.exclude_patterns)
+                tracker = telemetry.ProgressTracker(self.on_progress, telemetry.metrics_path(self.dest_dir))
+                try:
+                    target_path = snapshot.run_snapshot(
+                        self.source_dir, self.dest_dir, log=self.log, matcher=matcher, progress=tracker,
+                        cancel=stop, delta_min_size=snapshot.mb_to_bytes(self.delta_min_mb),
+                    )
+                except snapshot.SnapshotCancelled:
+                    # Left unpublished; the next run resumes it / 게시되지 않음, 다음 실행이 재개
+                    tracker.finish("cancelled")
+                    self.log(TRANSLATIONS[self.current_lang]['cancelled'])
+                    break
+                except BaseException:
+                    tracker.finish("failed")
+                    raise
+                tracker.finish("ok", target_path)
+                self.log(f"{TRANSLATIONS[self.current_lang]['success']} ({os.path.basename(target_path)})")
                 
                 # Cleanup old backups (keep last 10) / 오래된 백업 정리 (최근 10개 유지)
                 self.cleanup_old_backups()
@@ -273,19 +470,12 @@ class Lavendar(ctk.CTk):
             except Exception as e:
                 self.log(f"ERROR: {str(e)}")
             
-            # Wait for interval / 주기 대기
-            for _ in range(self.interval_min * 60):
-                if not self.is_running: break
-                time.sleep(1)
+            # Wait for interval, or until deactivated / 주기만큼, 또는 비활성화될 때까지 대기
+            stop.wait(self.interval_min * 60)
 
     def cleanup_old_backups(self):
         try:
-            backups = [os.path.join(self.dest_dir, d) for d in os.listdir(self.dest_dir) if d.startswith("backup_")]
-            backups.sort(key=os.path.getmtime)
-            
-            while len(backups) > 10:
-                oldest = backups.pop(0)
-                shutil.rmtree(oldest)
+            for oldest in snapshot.prune_snapshots(self.dest_dir, 10):
                 self.log(f"{TRANSLATIONS[self.current_lang]['removed_old']}{os.path.basename(oldest)}")
         except:
             pass
@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Lavendar Snapshot Engine - Atomic & Resumable Backup Snapshots
+# Lavendar 스냅샷 엔진 - 원자적이고 재개 가능한 백업 스냅샷
+# Rheehose (Rhee Creative) 2008-2026
+# Licensed under Apache-2.0
+
+import os
+import json
+import shutil
+import datetime
+import hashlib
+import locale
+
+import catalog
+import delta
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+SNAPSHOT_PREFIX = "backup_"
+PARTIAL_SUFFIX = ".partial"
+JOURNAL_NAME = "journal" # Inside the snapshot's metadata folder / 스냅샷 메타데이터 폴더 안
+TMP_SUFFIX = ".lvtmp"
+JOURNAL_SYNC_EVERY = 64 # fsync the journal every N files / N개 파일마다 저널 fsync
+COPY_CHUNK = 8 * 1024 * 1024
+LOCK_FILE = os.path.join(".lavendar", "lock")
+
+class SnapshotBusy(RuntimeError):
+    pass
+
+class SnapshotCancelled(RuntimeError):
+    pass
+
+def get_msg(ko_msg, en_msg):
+    try:
+        lang, _ = locale.getdefaultlocale()
+        if lang and lang.startswith('ko'):
+            return f"{ko_msg} / {en_msg}"
+    except:
+        pass
+    return en_msg
+
+def mb_to_bytes(mb):
+    return None if mb is None else int(mb * 1024 * 1024)
+
+def timestamp_name():
+    return SNAPSHOT_PREFIX + datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+
+def list_snapshots(dest):
+    # Published snapshots only, oldest first / 게시 완료된 스냅샷만 (오래된 순)
+    if not os.path.isdir(dest):
+        return []
+    names = [
+        d for d in os.listdir(dest)
+        if d.startswith(SNAPSHOT_PREFIX) and not d.endswith(PARTIAL_SUFFIX)
+        and os.path.isdir(os.path.join(dest, d))
+    ]
+    names.sort()
+    return [os.path.join(dest, d) for d in names]
+
+def list_partials(dest):
+    if not os.path.isdir(dest):
+        return []
+    names = sorted(d for d in os.listdir(dest) if d.startswith(SNAPSHOT_PREFIX) and d.endswith(PARTIAL_SUFFIX))
+    return [os.path.join(dest, d) for d in names]
+
+def prune_snapshots(dest, keep):
+    # Staging directories never count toward the keep limit / 스테이징 폴더는 보관 개수에 포함되지 않음
+    with DestinationLock(dest):
+        snapshots = list_snapshots(dest)
+        removed = []
+        while len(snapshots) > keep:
+            oldest = snapshots.pop(0)
+            shutil.rmtree(oldest)
+            shutil.rmtree(delta.metadata_dir(oldest), ignore_errors=True)
+            removed.append(oldest)
+        if removed:
+            # Drop chunks no surviving snapshot refers to / 남은 스냅샷이 참조하지 않는 청크 삭제
+            delta.collect_garbage(dest, snapshots, list_partials(dest))
+    return removed
+
+def _fsync_dir(path):
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+class DestinationLock:
+    # One writer per destination across GUI, CLI, cron and daemon
+    # GUI, CLI, cron, 데몬을 통틀어 대상 폴더당 하나의 기록자만 허용
+    def __init__(self, dest):
+        self.path = os.path.join(dest, LOCK_FILE)
+        self.file = None
+
+    def __enter__(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.file = open(self.path, "a+")
+        if fcntl:
+            try:
+                fcntl.flock(self.file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                self.file.close()
+                raise SnapshotBusy(get_msg(
+                    "다른 Lavendar 프로세스가 이 대상 폴더에 백업 중입니다.",
+                    "Another Lavendar process is backing up to this destination."
+                ))
+        self.file.seek(0)
+        self.file.truncate()
+        self.file.write(f"{os.getpid()}\n")
+        self.file.flush()
+        return self
+
+    def __exit__(self, *exc):
+        self.file.close()
+        return False
+
+def read_journal(staging):
+    # Returns (source, {rel: (size, mtime_ns, sha256, chunked)}) or (None, {}) if unreadable
+    # (원천 경로, {상대경로: (크기, mtime_ns, sha256, 청크 여부)}) 반환, 읽을 수 없으면 (None, {})
+    done = {}
+    try:
+        with open(os.path.join(delta.metadata_dir(staging), JOURNAL_NAME), "r", encoding="utf-8") as f:
+            source = json.loads(f.readline()).get("source")
+            for line in f:
+                try:
+                    rel, size, mtime_ns, digest, chunked = (json.loads(line) + [None, None])[:5]
+                except (ValueError, TypeError):
+                    break # Torn write from a crash / 비정상 종료로 잘린 줄
+                done[rel] = (size, mtime_ns, digest, bool(chunked))
+    except (OSError, ValueError, AttributeError):
+        return None, {}
+    return source, done
+
+class Journal:
+    # Append-only list of files fully copied into the staging directory
+    # 스테이징 폴더에 복사가 끝난 파일의 추가 전용 목록
+    def __init__(self, staging, source, done):
+        self.path = os.path.join(delta.metadata_dir(staging), JOURNAL_NAME)
+        self.pending = 0
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        # Rewrite valid entries so a torn tail never corrupts new appends
+        # 잘린 꼬리가 새 기록을 오염시키지 않도록 유효한 항목만 다시 기록
+        tmp = self.path + TMP_SUFFIX
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"source": source}) + "\n")
+            for rel, entry in done.items():
+                f.write(json.dumps([rel, *entry]) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        self.file = open(self.path, "a", encoding="utf-8")
+
+    def record(self, rel, size, mtime_ns, digest, chunked):
+        self.file.write(json.dumps([rel, size, mtime_ns, digest, chunked]) + "\n")
+        self.file.flush()
+        self.pending += 1
+        if self.pending >= JOURNAL_SYNC_EVERY:
+            self.sync()
+
+    def sync(self):
+        os.fsync(self.file.fileno())
+        self.pending = 0
+
+    def close(self):
+        if not self.file.closed:
+            self.sync()
+            self.file.close()
+
+def open_staging(source, dest, log=None):
+    # Reuse the newest interrupted run of this source, otherwise start fresh
+    # 같은 원천의 가장 최근 중단된 실행을 재사용하고, 없으면 새로 시작
+    staging, done = None, {}
+    for partial in reversed(list_partials(dest)):
+        journal_source, entries = read_journal(partial)
+        if journal_source != source:
+            continue
+        if staging is None:
+            staging, done = partial, entries
+        else:
+            shutil.rmtree(partial, ignore_errors=True)
+            shutil.rmtree(delta.metadata_dir(partial), ignore_errors=True)
+
+    if staging is None:
+        staging = os.path.join(dest, timestamp_name() + PARTIAL_SUFFIX)
+        os.makedirs(staging)
+    elif log:
+        log(get_msg(
+            f"중단된 백업을 재개합니다: {os.path.basename(staging)} ({len(done)}개 파일 완료됨)",
+            f"Resuming interrupted backup {os.path.basename(staging)} ({len(done)} files already copied)"
+        ))
+    return staging, done
+
+def _is_done(entry, st, target):
+    # A journal entry counts only if source is unchanged and the copy is intact
+    # 원천이 그대로이고 사본이 온전할 때만 저널 항목을 인정
+    if entry is None or entry[:2] != (st.st_size, st.st_mtime_ns):
+        return False
+    if entry[3]:
+        # Stored as a chunk manifest instead / 대신 청크 매니페스트로 저장됨
+        return os.path.exists(target + delta.MANIFEST_SUFFIX)
+    try:
+        return os.path.getsize(target) == st.st_size
+    except OSError:
+        return False
+
+def _check_cancel(cancel):
+    if cancel is not None and cancel.is_set():
+        raise SnapshotCancelled(get_msg("백업이 취소되었습니다.", "Backup cancelled."))
+
+def _copy_data(src, dst, progress=None, cancel=None):
+    # Chunked copy so progress moves inside large files; the bytes pass through
+    # user space once anyway, so the catalog hash comes for free
+    # 큰 파일 안에서도 진행률이 움직이도록 청크 단위 복사, 바이트가 어차피 한 번
+    # 사용자 공간을 지나므로 카탈로그용 해시를 추가 읽기 없이 계산
+    hasher = hashlib.sha256()
+    buf = bytearray(COPY_CHUNK)
+    view = memoryview(buf)
+    with open(src, "rb", buffering=0) as fsrc, open(dst, "wb", buffering=0) as fdst:
+        while True:
+            n = fsrc.readinto(buf)
+            if not n:
+                return hasher.hexdigest()
+            hasher.update(view[:n])
+            fdst.write(view[:n])
+            if progress:
+                progress.advance(n)
+            _check_cancel(cancel)
+
+def copy_file(src, dst, progress=None, cancel=None):
+    # Copy beside the target and rename, so a file is either whole or absent
+    # 대상 옆에 복사한 뒤 이름을 바꿔, 파일이 완전하거나 아예 없도록 보장
+    # Any failure (cancel, unreadable source, full disk) drops the temp file,
+    # so it never ends up in the finished snapshot
+    # 어떤 실패(취소, 읽을 수 없는 원천, 디스크 가득 참)든 임시 파일을 지워 완성된 스냅샷에 남지 않게 함
+    tmp = dst + TMP_SUFFIX
+    try:
+        digest = _copy_data(src, tmp, progress, cancel)
+        shutil.copystat(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    return digest
+
+def scan_source(source, dest_rel=None, matcher=None, progress=None):
+    # Pre-scan: relative dirs and (rel, stat) files to copy, plus stat errors
+    # 사전 스캔: 복사할 상대 폴더와 (상대경로, stat) 파일 목록, stat 오류
+    dirs_seen, files, errors = [], [], []
+    for root, dirs, names in os.walk(source, followlinks=True):
+        rel_root = os.path.relpath(root, source)
+        # Prune ignored directories in place so they are never walked
+        # 제외된 폴더는 제자리에서 잘라내어 아예 순회하지 않음
+        kept = []
+        for d in dirs:
+            rel_dir = d if rel_root == "." else os.path.join(rel_root, d)
+            if rel_dir == dest_rel or (matcher and matcher.match(rel_dir, True)):
+                continue
+            kept.append(d)
+        dirs[:] = sorted(kept)
+        dirs_seen.append(rel_root)
+
+        batch_bytes, batch_files = 0, 0
+        for name in sorted(names):
+            rel = name if rel_root == "." else os.path.join(rel_root, name)
+            if matcher and matcher.match(rel):
+                continue
+            try:
+                st = os.stat(os.path.join(root, name))
+            except OSError as e:
+                errors.append((os.path.join(root, name), rel, str(e)))
+                continue
+            files.append((rel, st))
+            batch_bytes += st.st_size
+            batch_files += 1
+        if progress:
+            progress.scanned(batch_files, batch_bytes)
+    return dirs_seen, files, errors
+
+def store_delta(src, dst, st, previous, store, progress=None, cancel=None):
+    # Large file -> chunk manifest; returns (referenced chunk digests, file sha256)
+    # 대용량 파일 -> 청크 매니페스트, (참조 청크 해시, 파일 sha256) 반환
+    manifest_path = dst + delta.MANIFEST_SUFFIX
+    prev_path = previous + delta.MANIFEST_SUFFIX if previous else None
+    prev = None
+    if prev_path and os.path.exists(prev_path):
+        try:
+            prev = delta.load_manifest(prev_path)
+        except (OSError, ValueError):
+            prev = None
+    if prev and delta.manifest_matches(prev, st):
+        # Unchanged since the last snapshot: reuse its manifest without reading the file
+        # 지난 스냅샷 이후 변경 없음: 파일을 읽지 않고 매니페스트 재사용
+        copy_file(prev_path, manifest_path)
+        if progress:
+            progress.advance(st.st_size)
+        return {digest for digest, _ in prev["chunks"]}, prev.get("sha256")
+    # Reusing the previous anchor keeps unchanged regions on the same cut points
+    # 이전 앵커를 재사용해야 변경되지 않은 구간이 같은 지점에서 잘림
+    manifest, _ = delta.store_file(
+        src, manifest_path, store, st,
+        anchor=prev["anchor"] if prev else None,
+        progress=progress,
+        cancel_check=lambda: _check_cancel(cancel),
+    )
+    return {digest for digest, _ in manifest["chunks"]}, manifest["sha256"]
+
+def restore_snapshot(snapshot_path, target, dest=None, log=None):
+    # Rebuild a plain tree from a snapshot, reassembling the files its catalog
+    # marks as chunked; anything else, whatever its name, is copied as is
+    # 카탈로그가 청크로 표시한 파일은 재조립하고, 나머지는 이름과 관계없이 그대로 복사
+    manifests = {rel + delta.MANIFEST_SUFFIX for rel in catalog.chunked_paths(snapshot_path)}
+    store = delta.ChunkStore(dest or os.path.dirname(os.path.abspath(snapshot_path)))
+    restored = 0
+    for root, dirs, files in os.walk(snapshot_path):
+        dirs.sort()
+        rel_root = os.path.relpath(root, snapshot_path)
+        out_root = target if rel_root == "." else os.path.join(target, rel_root)
+        os.makedirs(out_root, exist_ok=True)
+        for name in sorted(files):
+            src = os.path.join(root, name)
+            if (name if rel_root == "." else os.path.join(rel_root, name)) in manifests:
+                delta.restore_file(src, os.path.join(out_root, name[:-len(delta.MANIFEST_SUFFIX)]), store)
+            else:
+                shutil.copy2(src, os.path.join(out_root, name))
+            restored += 1
+        shutil.copystat(root, out_root)
+    if log:
+        log(f"restored {restored} files -> {target}")
+    return restored
+
+def run_snapshot(source, dest, log=None, matcher=None, progress=None, cancel=None, delta_min_size=None):
+    # cancel: threading.Event; when set the run stops unpublished and resumable
+    # delta_min_size: files at least this big are stored as chunks (None = plain copies)
+    # cancel: threading.Event, 설정되면 게시하지 않고 재개 가능한 상태로 중단
+    # delta_min_size: 이 크기 이상의 파일은 청크로 저장 (None이면 일반 복사)
+    source = os.path.abspath(source)
+    if not os.path.isdir(source):
+        raise FileNotFoundError(get_msg(
+            f"원천 디렉토리 '{source}'가 존재하지 않습니다.",
+            f"Source directory '{source}' does not exist."
+        ))
+    os.makedirs(dest, exist_ok=True)
+    with DestinationLock(dest):
+        return _run_locked(source, dest, log, matcher, progress, cancel, delta_min_size)
+
+def _run_locked(source, dest, log, matcher, progress, cancel, delta_min_size):
+    # Never descend into the backup destination itself / 백업 대상 폴더 자체로는 절대 내려가지 않음
+    dest_rel = os.path.relpath(os.path.realpath(dest), os.path.realpath(source))
+    if dest_rel.startswith(os.pardir) or os.path.isabs(dest_rel):
+        dest_rel = None
+
+    staging, done = open_staging(source, dest, log)
+    dirs_seen, files, errors = scan_source(source, dest_rel, matcher, progress)
+    for rel_dir in dirs_seen:
+        os.makedirs(staging if rel_dir == "." else os.path.join(staging, rel_dir), exist_ok=True)
+
+    # Split resumed files from pending ones so totals include both
+    # 총계에 둘 다 포함되도록 재개된 파일과 남은 파일을 분리
+    pending = []
+    resumed_bytes = 0
+    refs = set()
+    rows = [] # Catalog rows / 카탈로그 행
+    for rel, st in files:
+        target = os.path.join(staging, rel)
+        if _is_done(done.get(rel), st, target):
+            resumed_bytes += st.st_size
+            chunked = done[rel][3]
+            if chunked:
+                refs |= delta.manifest_refs(target + delta.MANIFEST_SUFFIX)
+            rows.append((rel, st, done[rel][2], chunked))
+        else:
+            pending.append((rel, st))
+    if progress:
+        progress.begin_copy(len(files) - len(pending), resumed_bytes)
+
+    store = delta.ChunkStore(dest)
+    snapshots = list_snapshots(dest)
+    previous = snapshots[-1] if snapshots else None
+    # Which files of the last snapshot are manifests comes from its catalog,
+    # never from the suffix: a user file may end in .lvchunks too
+    # 지난 스냅샷의 어떤 파일이 매니페스트인지는 접미사가 아닌 카탈로그로 판단: 사용자 파일도 .lvchunks로 끝날 수 있음
+    prev_chunked = set()
+    if previous and delta_min_size is not None:
+        try:
+            prev_chunked = catalog.chunked_paths(previous)
+        except (OSError, catalog.sqlite3.Error):
+            pass
+    # A chunked file's manifest would land on a source file named <file>.lvchunks
+    # 청크 파일의 매니페스트가 원천의 <파일>.lvchunks와 겹치는 경우
+    taken = {rel for rel, _ in files if rel.endswith(delta.MANIFEST_SUFFIX)}
+    journal = Journal(staging, source, done)
+    try:
+        for rel, st in pending:
+            _check_cancel(cancel)
+            src = os.path.join(source, rel)
+            dst = os.path.join(staging, rel)
+            try:
+                chunked = delta_min_size is not None and st.st_size >= delta_min_size and rel + delta.MANIFEST_SUFFIX not in taken
+                if chunked:
+                    file_refs, digest = store_delta(src, dst, st, os.path.join(previous, rel) if rel in prev_chunked else None, store, progress, cancel)
+                    refs |= file_refs
+                else:
+                    digest = copy_file(src, dst, progress, cancel)
+                journal.record(rel, st.st_size, st.st_mtime_ns, digest, chunked)
+                rows.append((rel, st, digest, chunked))
+            except OSError as e:
+                errors.append((src, dst, str(e)))
+            if progress:
+                progress.advance(files=1)
+    finally:
+        journal.close()
+
+    if errors:
+        # Keep the staging directory so the next run resumes from the journal
+        # 다음 실행이 저널에서 재개할 수 있도록 스테이징 폴더 유지
+        raise shutil.Error(errors)
+
+    os.remove(journal.path)
+    delta.write_refs(staging, refs)
+    catalog.write_catalog(staging, source, rows)
+
+    # Directory metadata last, deepest first, like copytree
+    # copytree와 마찬가지로 폴더 메타데이터는 마지막에 깊은 곳부터 적용
+    for rel_dir in reversed(dirs_seen):
+        try:
+            shutil.copystat(os.path.join(source, rel_dir), staging if rel_dir == "." else os.path.join(staging, rel_dir))
+        except OSError:
+            pass
+
+    # Publish atomically / 원자적으로 게시
+    final = os.path.join(dest, timestamp_name())
+    base, n = final, 1
+    while os.path.exists(final) or os.path.exists(delta.metadata_dir(final)):
+        # Two runs within the same second / 같은 초에 실행된 두 번의 백업
+        final = f"{base}_{n}"
+        n += 1
+    # Metadata first: a published snapshot always has its chunk refs, or
+    # garbage collection would take its chunks
+    # 메타데이터 먼저: 게시된 스냅샷에는 항상 청크 참조 목록이 있어야 가비지 수집이 청크를 지우지 않음
+    os.rename(delta.metadata_dir(staging), delta.metadata_dir(final))
+    os.rename(staging, final)
+    _fsync_dir(dest)
+    return final
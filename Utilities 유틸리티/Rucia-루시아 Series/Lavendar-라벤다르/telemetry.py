@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Lavendar Telemetry - Progress, ETA & Throughput per backup run
+# Lavendar 텔레메트리 - 백업 실행별 진행률, 남은 시간, 처리량
+# Rheehose (Rhee Creative) 2008-2026
+# Licensed under Apache-2.0
+
+import os
+import json
+import time
+import datetime
+
+METRICS_DIR = os.path.join(".lavendar", "metrics")
+METRICS_KEEP = 200 # Run files kept per destination / 대상 폴더별 보관할 실행 파일 수
+EMIT_INTERVAL = 0.25 # Seconds between progress events / 진행 이벤트 간격 (초)
+RATE_SMOOTHING = 0.3 # EWMA weight of the newest sample / 최신 표본의 EWMA 가중치
+
+def metrics_path(dest):
+    # <dest>/.lavendar/metrics/run_<ts>.jsonl, oldest files pruned
+    # <dest>/.lavendar/metrics/run_<ts>.jsonl, 오래된 파일은 정리
+    folder = os.path.join(dest, METRICS_DIR)
+    os.makedirs(folder, exist_ok=True)
+    runs = sorted(f for f in os.listdir(folder) if f.startswith("run_") and f.endswith(".jsonl"))
+    for old in runs[:max(0, len(runs) - METRICS_KEEP + 1)]:
+        try:
+            os.remove(os.path.join(folder, old))
+        except OSError:
+            pass
+    now = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    return os.path.join(folder, f"run_{now}.jsonl")
+
+def format_bytes(n):
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(n) < 1024:
+            return f"{n:.1f}{unit}" if unit != "B" else f"{int(n)}B"
+        n /= 1024.0
+    return f"{n:.1f}TB"
+
+def format_eta(seconds):
+    if seconds is None:
+        return "--:--"
+    seconds = int(seconds)
+    h, rem = divmod(seconds, 3600)
+    m, s = divmod(rem, 60)
+    return f"{h}:{m:02d}:{s:02d}" if h else f"{m:02d}:{s:02d}"
+
+def format_status(event):
+    # One-line summary shared by the CLI status line and the GUI label
+    # CLI 상태 줄과 GUI 라벨이 함께 쓰는 한 줄 요약
+    if event["phase"] == "scan":
+        return f"scanning... {event['files_total']} files, {format_bytes(event['bytes_total'])}"
+    percent = 100.0 * event["bytes_done"] / event["bytes_total"] if event["bytes_total"] else 100.0
+    return (
+        f"{percent:5.1f}% {event['files_done']}/{event['files_total']} files "
+        f"{format_bytes(event['bytes_done'])}/{format_bytes(event['bytes_total'])} "
+        f"{format_bytes(event['rate'])}/s ETA {format_eta(event['eta'])}"
+    )
+
+class ProgressTracker:
+    # Turns engine counters into throttled events and a JSON-lines metrics file
+    # 엔진 카운터를 간격 조절된 이벤트와 JSON-lines 지표 파일로 변환
+    def __init__(self, callback=None, metrics_file=None):
+        self.callback = callback
+        self.metrics = open(metrics_file, "a", encoding="utf-8") if metrics_file else None
+        self.phase = "scan"
+        self.files_total = self.bytes_total = 0
+        self.files_done = self.bytes_done = 0
+        self.bytes_copied = 0 # Excludes bytes resumed from the journal / 저널로 재개된 바이트 제외
+        self.rate = 0.0
+        self.started = self.last_emit = time.monotonic()
+        self.last_bytes = 0
+        self.copy_started = None
+
+    def scanned(self, files, nbytes):
+        self.files_total += files
+        self.bytes_total += nbytes
+        now = time.monotonic()
+        if now - self.last_emit >= EMIT_INTERVAL:
+            self.emit(now)
+
+    def begin_copy(self, files_done, bytes_done):
+        # Resumed files count as already done / 재개된 파일은 완료된 것으로 계산
+        self.phase = "copy"
+        self.files_done, self.bytes_done = files_done, bytes_done
+        self.last_bytes = bytes_done
+        self.copy_started = self.last_emit = time.monotonic()
+        self.emit(self.last_emit)
+
+    def advance(self, nbytes=0, files=0):
+        self.bytes_done += nbytes
+        self.bytes_copied += nbytes
+        self.files_done += files
+        now = time.monotonic()
+        if now - self.last_emit >= EMIT_INTERVAL:
+            self.emit(now)
+
+    def emit(self, now):
+        dt = now - self.last_emit
+        if self.phase == "copy" and dt > 0:
+            sample = (self.bytes_done - self.last_bytes) / dt
+            self.rate = sample if self.rate == 0 else RATE_SMOOTHING * sample + (1 - RATE_SMOOTHING) * self.rate
+        self.last_emit, self.last_bytes = now, self.bytes_done
+        remaining = self.bytes_total - self.bytes_done
+        event = {
+            "phase": self.phase,
+            "elapsed": round(now - self.started, 3),
+            "files_done": self.files_done,
+            "files_total": self.files_total,
+            "bytes_done": self.bytes_done,
+            "bytes_total": self.bytes_total,
+            "rate": round(self.rate, 1),
+            "eta": round(remaining / self.rate, 1) if self.rate > 0 else None,
+        }
+        self.write(event)
+        if self.callback:
+            self.callback(event)
+        return event
+
+    def finish(self, status, snapshot=None):
+        now = time.monotonic()
+        copy_time = now - self.copy_started if self.copy_started else 0
+        # The final event reports the run average / 마지막 이벤트는 실행 평균을 보고
+        self.phase = "done" if status == "ok" else "failed"
+        if copy_time > 0:
+            self.rate = self.bytes_copied / copy_time
+        event = self.emit(now)
+        self.write({
+            "phase": "summary",
+            "status": status,
+            "snapshot": os.path.basename(snapshot) if snapshot else None,
+            "elapsed": event["elapsed"],
+            "files": self.files_done,
+            "bytes": self.bytes_done,
+            "bytes_copied": self.bytes_copied,
+            "avg_rate": round(self.bytes_copied / copy_time, 1) if copy_time > 0 else None,
+        })
+        self.close()
+
+    def write(self, record):
+        if self.metrics and not self.metrics.closed:
+            record = dict(record, ts=datetime.datetime.now().isoformat(timespec="milliseconds"))
+            self.metrics.write(json.dumps(record) + "\n")
+            self.metrics.flush()
+
+    def close(self):
+        if self.metrics and not self.metrics.closed:
+            self.metrics.close()